@@ -0,0 +1,101 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Construction, arithmetic operators and c_ component operator attributes,
+for float, Decimal, NumPy array and SymPy component values
+"""
+
+import skvectors
+from benchmarks.common import COMPONENT_KINDS, component_functions, component_values
+
+
+class Arithmetic:
+
+    params = COMPONENT_KINDS
+    param_names = [ 'components' ]
+
+
+    def setup(self, components):
+
+        self.CV3D = \
+            skvectors.create_class_Cartesian_3D_Vector(
+                'CV3D',
+                'xyz',
+                functions = component_functions(components)
+            )
+        self.cvalues = component_values(components, 3, seed=0)
+        self.u = self.CV3D(*self.cvalues)
+        self.v = self.CV3D(*component_values(components, 3, seed=1))
+
+
+    def time_construct(self, components):
+
+        self.CV3D(*self.cvalues)
+
+
+    def time_add_vector(self, components):
+
+        self.u + self.v
+
+
+    def time_mul_vector(self, components):
+
+        self.u * self.v
+
+
+    def time_mul_scalar(self, components):
+
+        self.u * 2
+
+
+    def time_rmul_scalar(self, components):
+
+        2 * self.u
+
+
+    def time_truediv_scalar(self, components):
+
+        self.u / 2
+
+
+    def time_pow_scalar(self, components):
+
+        self.u**2
+
+
+    def time_iadd_vector(self, components):
+
+        w = self.u.copy()
+        w += self.v
+
+
+    def time_neg(self, components):
+
+        -self.u
+
+
+    def time_dot(self, components):
+
+        self.u.dot(self.v)
+
+
+    def time_cross(self, components):
+
+        self.u.cross(self.v)
+
+
+    def time_c_abs_x(self, components):
+
+        self.u.c_abs_x()
+
+
+    def time_c_mul_bar_z(self, components):
+
+        self.u.c_mul_bar_z(2)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Arithmetic)
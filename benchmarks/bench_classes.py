@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Time it takes to create the vector classes with each of the create_class_* functions
+"""
+
+import skvectors
+
+
+class Class_Creation:
+
+    params = \
+        [
+            'Fundamental_Vector',
+            'Simple_Vector',
+            'Vector',
+            'Cartesian_Vector',
+            'Cartesian_2D_Vector',
+            'Cartesian_3D_Vector',
+            'Versatile_Vector',
+            'Tolerant_Cartesian_Vector',
+            'Tolerant_Cartesian_2D_Vector',
+            'Tolerant_Cartesian_3D_Vector',
+            'Tolerant_Versatile_Vector'
+        ]
+    param_names = [ 'vector_class' ]
+
+
+    def setup(self, vector_class):
+
+        self.create_class = getattr(skvectors, 'create_class_' + vector_class)
+        self.component_names = 'xy' if '2D' in vector_class else 'xyz'
+
+
+    def time_create_class(self, vector_class):
+
+        self.create_class('V', self.component_names)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Class_Creation)
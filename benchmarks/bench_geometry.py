@@ -0,0 +1,83 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Lengths, normalization, rotations and tolerant comparisons of 3D vectors,
+for float, NumPy array and SymPy component values
+(Decimal component values do not work here, since math.cos etc. and x**0.5 return floats)
+"""
+
+import skvectors
+from benchmarks.common import COMPONENT_KINDS, component_functions, component_values
+
+
+class Geometry:
+
+    params = [ kind for kind in COMPONENT_KINDS if kind != 'decimal' ]
+    param_names = [ 'components' ]
+
+
+    def setup(self, components):
+
+        functions = component_functions(components)
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz', functions=functions)
+        self.TCV3D = skvectors.create_class_Tolerant_Cartesian_3D_Vector('TCV3D', 'xyz', functions=functions)
+        cvalues_u = component_values(components, 3, seed=0)
+        cvalues_v = component_values(components, 3, seed=1)
+        cvalues_w = component_values(components, 3, seed=2)
+        self.u = self.CV3D(*cvalues_u)
+        self.v = self.CV3D(*cvalues_v)
+        self.w = self.CV3D(*cvalues_w)
+        self.tu = self.TCV3D(*cvalues_u)
+        self.tv = self.TCV3D(*cvalues_v)
+
+
+    def time_length(self, components):
+
+        self.u.length()
+
+
+    def time_normalize(self, components):
+
+        self.u.normalize()
+
+
+    def time_angle(self, components):
+
+        self.u.angle(self.v)
+
+
+    def time_angle_sin_cos(self, components):
+
+        self.u.angle_sin_cos(self.v)
+
+
+    def time_rotate_x(self, components):
+
+        self.u.rotate_x(0.5)
+
+
+    def time_axis_rotate(self, components):
+
+        self.u.axis_rotate(self.v, 0.5)
+
+
+    def time_reorient(self, components):
+
+        self.u.reorient(self.v, self.w)
+
+
+    def time_tolerant_eq(self, components):
+
+        self.tu == self.tv
+
+
+    def time_tolerant_are_parallel(self, components):
+
+        self.tu.are_parallel(self.tv)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Geometry)
@@ -0,0 +1,61 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Compares queries in a Vector_KD_Tree with brute force searches over vectors with NumPy arrays as component values
+"""
+
+import numpy as np
+import skvectors
+from skvectors.kd_tree import Vector_KD_Tree
+
+
+class KD_Tree:
+
+    params = [ 100000, 1000000, 10000000 ]
+    param_names = [ 'points' ]
+
+
+    def setup(self, points):
+
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz')
+        rng = np.random.default_rng(0)
+        self.batch = self.CV3D(*rng.random((3, points)))
+        self.tree = Vector_KD_Tree(self.CV3D, self.batch)
+        self.queries = [ self.CV3D(*q) for q in rng.random((10, 3)).tolist() ]
+
+
+    def time_build(self, points):
+
+        Vector_KD_Tree(self.CV3D, self.batch)
+
+
+    def time_nearest_tree(self, points):
+
+        for q in self.queries:
+            self.tree.query(q, k=5)
+
+
+    def time_nearest_brute_force(self, points):
+
+        for q in self.queries:
+            distances = self.batch.distance(q)
+            np.argpartition(distances, 5)[:5]
+
+
+    def time_within_tree(self, points):
+
+        for q in self.queries:
+            self.tree.query_radius(q, 0.01)
+
+
+    def time_within_brute_force(self, points):
+
+        for q in self.queries:
+            np.flatnonzero(self.batch.distance(q) <= 0.01)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(KD_Tree)
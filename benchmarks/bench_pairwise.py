@@ -0,0 +1,52 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Blocked pairwise matrices compared with calling the methods for each pair of vectors
+"""
+
+import numpy as np
+import skvectors
+
+
+class Pairwise:
+
+    params = [ 64, 512, 4096 ]
+    param_names = [ 'block' ]
+
+
+    def setup(self, block):
+
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz')
+        rng = np.random.default_rng(0)
+        self.batch_a = self.CV3D(*rng.standard_normal((3, 2000)))
+        self.batch_b = self.CV3D(*rng.standard_normal((3, 2000)))
+        self.list_a = [ self.CV3D(*cv) for cv in rng.standard_normal((100, 3)).tolist() ]
+        self.list_b = [ self.CV3D(*cv) for cv in rng.standard_normal((100, 3)).tolist() ]
+
+
+    def time_pairwise_distance(self, block):
+
+        self.CV3D.pairwise_distance(self.batch_a, self.batch_b, block=block)
+
+
+    def time_pairwise_angle(self, block):
+
+        self.CV3D.pairwise_angle(self.batch_a, self.batch_b, block=block)
+
+
+    def time_pairwise_distance_stream(self, block):
+
+        for _, _, distances in self.CV3D.pairwise_distance(self.batch_a, self.batch_b, block=block, stream=True):
+            distances.min()
+
+
+    def time_distance_per_pair(self, block):
+
+        [ [ a.distance(b) for b in self.list_b ] for a in self.list_a ]
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Pairwise)
@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Compares the DataFrame accessor 'skv' with using Pandas Series as component values
+"""
+
+import math
+import numpy as np
+import pandas as pd
+import skvectors
+import skvectors.pandas_accessor
+
+
+functions = \
+    {
+        'min': np.minimum,
+        'max': np.maximum,
+        'atan2': np.arctan2,
+        'cos': np.cos,
+        'sin': np.sin
+    }
+
+
+class Pandas_Accessor:
+
+    params = [ 1000, 1000000 ]
+    param_names = [ 'rows' ]
+
+
+    def setup(self, rows):
+
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz', functions=functions)
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame(rng.standard_normal((rows, 3)), columns=[ 'x', 'y', 'z' ])
+        self.other = self.CV3D(1.0, -2.0, 3.0)
+
+
+    def series_vector(self):
+
+        df = self.df
+
+        return self.CV3D(df['x'], df['y'], df['z'])
+
+
+    def time_length_series(self, rows):
+
+        self.df['length'] = self.series_vector().length()
+
+
+    def time_length_accessor(self, rows):
+
+        self.df.skv(self.CV3D, 'xyz').length()
+
+
+    def time_normalize_series(self, rows):
+
+        vn = self.series_vector().normalize()
+        self.df['nx'], self.df['ny'], self.df['nz'] = vn
+
+
+    def time_normalize_accessor(self, rows):
+
+        self.df.skv(self.CV3D, 'xyz').normalize(names=[ 'nx', 'ny', 'nz' ])
+
+
+    def time_cross_series(self, rows):
+
+        vc = self.series_vector().cross(self.other)
+        self.df['cx'], self.df['cy'], self.df['cz'] = vc
+
+
+    def time_cross_accessor(self, rows):
+
+        self.df.skv(self.CV3D, 'xyz').cross(self.other, names=[ 'cx', 'cy', 'cz' ])
+
+
+    def time_rotate_series(self, rows):
+
+        vr = self.series_vector().rotate_x(math.pi / 3)
+        self.df['rx'], self.df['ry'], self.df['rz'] = vr
+
+
+    def time_rotate_accessor(self, rows):
+
+        self.df.skv(self.CV3D, 'xyz').rotate_x(math.pi / 3, names=[ 'rx', 'ry', 'rz' ])
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Pandas_Accessor)
@@ -0,0 +1,56 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Batch polar conversions compared with the vector properties on vectors with NumPy arrays as component values
+"""
+
+import numpy as np
+import skvectors
+
+
+class Polar:
+
+    params = [ 100000, 1000000 ]
+    param_names = [ 'vectors' ]
+
+
+    def setup(self, vectors):
+
+        functions = { 'atan2': np.arctan2, 'cos': np.cos, 'sin': np.sin }
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz', functions=functions)
+        rng = np.random.default_rng(0)
+        self.v = self.CV3D(*rng.standard_normal((3, vectors)))
+        self.polar = self.CV3D.to_polar_many(self.v)
+        self.out = np.empty((3, vectors))
+
+
+    def time_to_polar_many(self, vectors):
+
+        self.CV3D.to_polar_many(self.v, out=self.out)
+
+
+    def time_to_polar(self, vectors):
+
+        self.v.to_polar()
+
+
+    def time_polar_properties(self, vectors):
+
+        self.v.radius, self.v.azimuth, self.v.inclination
+
+
+    def time_from_polar_many(self, vectors):
+
+        self.CV3D.from_polar_many(*self.polar, out=self.out)
+
+
+    def time_from_polar(self, vectors):
+
+        self.CV3D.from_polar(*self.polar)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Polar)
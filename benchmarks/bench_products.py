@@ -0,0 +1,52 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Batch cross products and triangle normals compared with the vector methods on vectors with NumPy arrays as component values
+"""
+
+import numpy as np
+import skvectors
+
+
+class Products:
+
+    params = [ 100000, 1000000 ]
+    param_names = [ 'triangles' ]
+
+
+    def setup(self, triangles):
+
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz')
+        rng = np.random.default_rng(0)
+        self.corners = [ self.CV3D(*rng.random((3, triangles))) for _ in range(3) ]
+        self.out = np.empty((3, triangles))
+
+
+    def time_triangle_normals(self, triangles):
+
+        self.CV3D.triangle_normals(*self.corners, normalize=True, out=self.out)
+
+
+    def time_triangle_normals_methods(self, triangles):
+
+        p0, p1, p2 = self.corners
+        normals = (p1 - p0).cross(p2 - p0)
+        normals / normals.length()
+
+
+    def time_stp_many(self, triangles):
+
+        self.CV3D.stp_many(*self.corners)
+
+
+    def time_stp_methods(self, triangles):
+
+        p0, p1, p2 = self.corners
+        p0.stp(p1, p2)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Products)
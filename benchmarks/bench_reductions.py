@@ -0,0 +1,63 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Streaming bounds and centroids compared with reductions over the vector methods
+"""
+
+from functools import reduce
+import numpy as np
+import skvectors
+
+
+class Reductions:
+
+    params = [ 10000, 100000 ]
+    param_names = [ 'vectors' ]
+
+
+    def setup(self, vectors):
+
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz')
+        rng = np.random.default_rng(0)
+        points = rng.standard_normal((vectors, 3))
+        self.batch = self.CV3D(*points.T)
+        self.vector_list = [ self.CV3D(*p) for p in points.tolist() ]
+
+
+    def time_centroid_list(self, vectors):
+
+        self.CV3D.centroid(self.vector_list)
+
+
+    def time_centroid_batch(self, vectors):
+
+        self.CV3D.centroid(self.batch)
+
+
+    def time_sum_of_vectors_list(self, vectors):
+
+        self.CV3D.sum_of_vectors(self.vector_list) / len(self.vector_list)
+
+
+    def time_bounds_list(self, vectors):
+
+        self.CV3D.bounds(self.vector_list)
+
+
+    def time_bounds_reduce_list(self, vectors):
+
+        cvalues = [ *zip(*(v.cvalues for v in self.vector_list)) ]
+        [ reduce(self.CV3D.component_min, cvs) for cvs in cvalues ]
+        [ reduce(self.CV3D.component_max, cvs) for cvs in cvalues ]
+
+
+    def time_principal_axes_batch(self, vectors):
+
+        self.CV3D.principal_axes(self.batch)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Reductions)
@@ -0,0 +1,84 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Throughput of the tolerance calculations for lists of vectors and for vectors with NumPy arrays as component values
+"""
+
+import numpy as np
+import skvectors
+
+
+functions = \
+    {
+        'max': np.maximum,
+        'abs': np.abs,
+        'ceil': np.ceil,
+        'trunc': np.trunc,
+        'log10': np.log10,
+        'copysign': np.copysign,
+        'and': np.logical_and,
+        'or': np.logical_or,
+        'all': np.all
+    }
+
+
+class Tolerance:
+
+    params = [ 1000, 100000 ]
+    param_names = [ 'vectors' ]
+
+
+    def setup(self, vectors):
+
+        rng = np.random.default_rng(0)
+        cvalues = rng.standard_normal((3, vectors))
+        self.TCV3D = skvectors.create_class_Tolerant_Cartesian_3D_Vector('TCV3D', 'xyz', functions=functions)
+        self.TVV3D = skvectors.create_class_Tolerant_Versatile_Vector('TVV3D', 'xyz', functions=functions)
+        self.cartesian_batch = self.TCV3D(*cvalues)
+        self.cartesian_list = [ self.TCV3D(*cv) for cv in cvalues.T.tolist() ]
+        self.versatile_batch = self.TVV3D(*cvalues)
+        self.versatile_list = [ self.TVV3D(*cv) for cv in cvalues.T.tolist() ]
+        self.versatile_other = self.versatile_batch * 1.000001
+
+
+    def time_cartesian_tolerance_all_list(self, vectors):
+
+        self.TCV3D.tolerance_all(self.cartesian_list)
+
+
+    def time_cartesian_tolerance_all_batch(self, vectors):
+
+        self.TCV3D.tolerance_all(self.cartesian_batch)
+
+
+    def time_cartesian_round_components_list(self, vectors):
+
+        for v in self.cartesian_list:
+            v.round_components()
+
+
+    def time_cartesian_round_components_batch(self, vectors):
+
+        self.cartesian_batch.round_components()
+
+
+    def time_versatile_tolerance_all_list(self, vectors):
+
+        self.TVV3D.tolerance_all(self.versatile_list)
+
+
+    def time_versatile_tolerance_all_batch(self, vectors):
+
+        self.TVV3D.tolerance_all(self.versatile_batch)
+
+
+    def time_versatile_eq_batch(self, vectors):
+
+        self.versatile_batch.eq(self.versatile_other)
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Tolerance)
@@ -0,0 +1,53 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Affine transforms compared with chained vector methods on vectors with NumPy arrays as component values
+"""
+
+import numpy as np
+import skvectors
+
+
+class Transforms:
+
+    params = [ 100000, 1000000 ]
+    param_names = [ 'vectors' ]
+
+
+    def setup(self, vectors):
+
+        functions = { 'atan2': np.arctan2, 'cos': np.cos, 'sin': np.sin }
+        self.CV3D = skvectors.create_class_Cartesian_3D_Vector('CV3D', 'xyz', functions=functions)
+        rng = np.random.default_rng(0)
+        self.v = self.CV3D(*rng.standard_normal((3, vectors)))
+        self.axis = self.CV3D(1, 1, 0)
+        self.offset = self.CV3D(1, 2, 3)
+        self.transform = \
+            self.CV3D.transform() \
+            .rotate(0.5, 'x') \
+            .rotate(0.2, self.axis) \
+            .scale(2.0) \
+            .translate(self.offset)
+        self.out = np.empty((3, vectors))
+
+
+    def time_apply_many(self, vectors):
+
+        self.transform.apply_many(self.v, out=self.out)
+
+
+    def time_apply(self, vectors):
+
+        self.transform.apply(self.v)
+
+
+    def time_chained_methods(self, vectors):
+
+        self.v.rotate_x(0.5).axis_rotate(self.axis, 0.2) * 2.0 + self.offset
+
+
+if __name__ == "__main__":
+    from benchmarks.common import run_benchmarks
+    run_benchmarks(Transforms)
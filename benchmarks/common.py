@@ -0,0 +1,202 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Helpers for running the benchmarks without asv.
+The benchmark classes follow the asv conventions: setup() and time_*() methods,
+with optional 'params' and 'param_names' class attributes.
+"""
+
+import itertools
+import json
+import math
+import timeit
+from decimal import Decimal
+
+# The kinds of component values that the vector benchmarks are run with
+COMPONENT_KINDS = [ 'float', 'decimal', 'numpy_1e3', 'numpy_1e6', 'sympy' ]
+
+
+def component_functions(kind):
+    """Functions for the vector classes that fit a kind of component values"""
+
+    if kind.startswith('numpy'):
+        import numpy as np
+        functions = \
+            {
+                'not': np.logical_not,
+                'and': np.logical_and,
+                'or': np.logical_or,
+                'all': np.all,
+                'any': np.any,
+                'min': np.minimum,
+                'max': np.maximum,
+                'abs': np.absolute,
+                'ceil': np.ceil,
+                'copysign': np.copysign,
+                'log10': np.log10,
+                'cos': np.cos,
+                'sin': np.sin,
+                'atan2': np.arctan2,
+                'trunc': np.trunc
+            }
+    elif kind == 'sympy':
+        sympy = import_sympy()
+        functions = \
+            {
+                'min': sympy.Min,
+                'max': sympy.Max,
+                'ceil': sympy.ceiling,
+                'log10': lambda x: sympy.log(x, 10),
+                'cos': sympy.cos,
+                'sin': sympy.sin,
+                'atan2': sympy.atan2,
+                'pi': sympy.pi
+            }
+    else:
+        functions = None
+
+    return functions
+
+
+def import_sympy():
+    """Import SymPy, or skip the benchmark if it is not installed"""
+
+    try:
+        import sympy
+    except ImportError as err:
+        raise NotImplementedError("SymPy is not installed") from err
+
+    return sympy
+
+
+def component_values(kind, dimensions, seed=0):
+    """Lists of component values of a kind, for one vector (or a batch of vectors for the NumPy kinds)"""
+
+    if kind.startswith('numpy'):
+        import numpy as np
+        size = int(float(kind.split('_')[1]))
+        rng = np.random.default_rng(seed)
+        cvalues = [ *(rng.random((dimensions, size)) + 0.5) ]
+    else:
+        # Deterministic values in [0.5, 1.5), without needing NumPy
+        floats = [ 0.5 + math.modf((seed + 1) * (i + 1) * 0.6180339887498949)[0] for i in range(dimensions) ]
+        if kind == 'float':
+            cvalues = floats
+        elif kind == 'decimal':
+            cvalues = [ Decimal(repr(f)) for f in floats ]
+        elif kind == 'sympy':
+            sympy = import_sympy()
+            cvalues = [ sympy.Rational(repr(f)) for f in floats ]
+        else:
+            msg = "Unknown kind of component values: {kind}".format_map(vars())
+            raise ValueError(msg)
+
+    return cvalues
+
+
+def benchmark_methods(benchmark_class):
+    """Names of the timing methods of a benchmark class"""
+
+    names = \
+        [
+            name
+            for name in sorted(dir(benchmark_class))
+            if name.startswith('time_')
+        ]
+
+    return names
+
+
+def time_benchmark(benchmark_class, method_name, params=(), repeat=5):
+    """
+    Best time in seconds for one call of a timing method
+    None is returned if setup() raises NotImplementedError, as asv skips these benchmarks
+    """
+
+    benchmark = benchmark_class()
+    setup = getattr(benchmark, 'setup', None)
+    if setup is not None:
+        try:
+            setup(*params)
+        except NotImplementedError:
+            return None
+    method = getattr(benchmark, method_name)
+    timer = timeit.Timer(lambda: method(*params))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    return best
+
+
+def run_benchmarks(*benchmark_classes, repeat=5, pattern=None):
+    """
+    Run the timing methods of the benchmark classes and return the results in a dictionary
+    If pattern is given, only the benchmarks with a name that contains it are run
+    """
+
+    results = { }
+    for benchmark_class in benchmark_classes:
+        params = getattr(benchmark_class, 'params', None)
+        if params is None:
+            param_combinations = [ () ]
+        else:
+            if not isinstance(params[0], (list, tuple)):
+                params = [ params ]
+            param_combinations = list(itertools.product(*params))
+        for method_name in benchmark_methods(benchmark_class):
+            for param_combination in param_combinations:
+                key = benchmark_class.__name__ + '.' + method_name
+                if param_combination:
+                    key += '(' + ', '.join(map(repr, param_combination)) + ')'
+                if (pattern is not None) and (pattern not in key):
+                    continue
+                best = time_benchmark(benchmark_class, method_name, param_combination, repeat)
+                if best is None:
+                    print('{key:<72} {text:>15}'.format(key=key, text='skipped'))
+                    continue
+                results[key] = best
+                print('{key:<72} {time:>12.3f} ms'.format(key=key, time=best * 1e3))
+
+    return results
+
+
+def save_results(results, file_name):
+    """Save benchmark results (seconds per call) as a JSON baseline"""
+
+    with open(file_name, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_results(file_name):
+    """Load benchmark results from a JSON baseline"""
+
+    with open(file_name) as f:
+        results = json.load(f)
+
+    return results
+
+
+def compare_results(results, baseline, factor=1.2):
+    """
+    Print the ratios between the results and a baseline
+    Returns the keys of the benchmarks that are more than factor times slower than in the baseline
+    """
+
+    slower = [ ]
+    for key, best in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = best / base
+        flag = ''
+        if ratio > factor:
+            flag = 'SLOWER'
+            slower.append(key)
+        elif ratio < 1 / factor:
+            flag = 'faster'
+        print('{key:<72} {ratio:>8.2f} {flag}'.format(key=key, ratio=ratio, flag=flag))
+
+    return slower
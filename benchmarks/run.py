@@ -0,0 +1,73 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Runs all the benchmarks in the bench_*.py modules, and saves or compares JSON baselines.
+
+    python3 -m benchmarks.run --save baseline.json
+    python3 -m benchmarks.run --compare baseline.json --factor 1.2 --pattern Geometry
+"""
+
+import argparse
+import importlib
+import inspect
+import pkgutil
+import sys
+
+import benchmarks
+from benchmarks.common import benchmark_methods, compare_results, load_results, run_benchmarks, save_results
+
+
+def find_benchmark_classes(module_names=None):
+    """The benchmark classes (classes with time_* methods) in the bench_*.py modules"""
+
+    if module_names is None:
+        module_names = \
+            sorted(
+                name
+                for _, name, _ in pkgutil.iter_modules(benchmarks.__path__)
+                if name.startswith('bench_')
+            )
+    benchmark_classes = [ ]
+    for module_name in module_names:
+        try:
+            module = importlib.import_module('benchmarks.' + module_name)
+        except ImportError as err:
+            print('{module_name:<72} {text:>15} ({err})'.format(module_name=module_name, text='skipped', err=err))
+            continue
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if (cls.__module__ == module.__name__) and benchmark_methods(cls):
+                benchmark_classes.append(cls)
+
+    return benchmark_classes
+
+
+def main(args=None):
+
+    parser = argparse.ArgumentParser(description="Run the scikit-vectors benchmarks")
+    parser.add_argument('modules', nargs='*', help="names of bench_* modules to run (default: all)")
+    parser.add_argument('--pattern', help="only run benchmarks with names that contain this")
+    parser.add_argument('--repeat', type=int, default=5, help="number of repeats for each benchmark")
+    parser.add_argument('--save', metavar='FILE', help="save the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="compare the results with a JSON baseline")
+    parser.add_argument('--factor', type=float, default=1.2, help="slowdown factor that counts as a regression")
+    options = parser.parse_args(args)
+
+    benchmark_classes = find_benchmark_classes(options.modules or None)
+    results = run_benchmarks(*benchmark_classes, repeat=options.repeat, pattern=options.pattern)
+    if options.save:
+        save_results(results, options.save)
+    exit_code = 0
+    if options.compare:
+        print()
+        slower = compare_results(results, load_results(options.compare), options.factor)
+        if slower:
+            print('\n{n} benchmark(s) are slower than in the baseline'.format(n=len(slower)))
+            exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,8 +19,13 @@ setuptools.setup(
     long_description_content_type = 'text/markdown',
     url = 'https://github.com/t-o-k/scikit-vectors',
     license = 'BSD',
-    packages = setuptools.find_packages(),
+    packages = setuptools.find_packages(exclude=[ 'benchmarks', 'benchmarks.*' ]),
     include_package_data = True,
+    extras_require = \
+        {
+            'numpy': [ 'numpy' ],
+            'pandas': [ 'numpy', 'pandas' ]
+        },
     classifiers = \
         [
             'Development Status :: 4 - Beta',
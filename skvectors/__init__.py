@@ -1,12 +1,54 @@
-from .fundamental_vectors           import create_class_Fundamental_Vector
-from .simple_vectors                import create_class_Simple_Vector
-from .vectors                       import create_class_Vector
-from .cartesian_vectors             import create_class_Cartesian_Vector
-from .cartesian_2d_vectors          import create_class_Cartesian_2D_Vector
-from .cartesian_3d_vectors          import create_class_Cartesian_3D_Vector
-from .versatile_vectors             import create_class_Versatile_Vector
-from .tolerant_cartesian_vectors    import create_class_Tolerant_Cartesian_Vector
-from .tolerant_cartesian_2d_vectors import create_class_Tolerant_Cartesian_2D_Vector
-from .tolerant_cartesian_3d_vectors import create_class_Tolerant_Cartesian_3D_Vector
-from .tolerant_versatile_vectors    import create_class_Tolerant_Versatile_Vector
+"""
+Copyright (c) 2017, 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
 
+The modules with the functions that create the vector classes are imported
+when the functions are first used (PEP 562), to keep 'import skvectors' fast.
+Python versions before 3.7 do not support PEP 562, so there they are imported at once.
+"""
+
+import sys
+from importlib import import_module
+
+_lazy_attributes = \
+    {
+        'create_class_Fundamental_Vector':           'fundamental_vectors',
+        'create_class_Simple_Vector':                'simple_vectors',
+        'create_class_Vector':                       'vectors',
+        'create_class_Cartesian_Vector':             'cartesian_vectors',
+        'create_class_Cartesian_2D_Vector':          'cartesian_2d_vectors',
+        'create_class_Cartesian_3D_Vector':          'cartesian_3d_vectors',
+        'create_class_Versatile_Vector':             'versatile_vectors',
+        'create_class_Tolerant_Cartesian_Vector':    'tolerant_cartesian_vectors',
+        'create_class_Tolerant_Cartesian_2D_Vector': 'tolerant_cartesian_2d_vectors',
+        'create_class_Tolerant_Cartesian_3D_Vector': 'tolerant_cartesian_3d_vectors',
+        'create_class_Tolerant_Versatile_Vector':    'tolerant_versatile_vectors',
+        'profile':                                   'profiling',
+        'Transform':                                 'transforms'
+    }
+
+__all__ = [ *_lazy_attributes ]
+
+
+def __getattr__(name):
+
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        msg = "module '{__name__}' has no attribute '{name}'".format(__name__=__name__, name=name)
+        raise AttributeError(msg)
+    value = getattr(import_module('.' + module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+
+    return sorted({ *globals(), *_lazy_attributes })
+
+
+if sys.version_info < (3, 7):
+    for _name in _lazy_attributes:
+        __getattr__(_name)
+    del _name
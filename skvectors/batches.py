@@ -0,0 +1,65 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Helpers for the modules that work on batches of vectors with NumPy.
+A batch is an iterable of vectors or a vector with arrays as component values.
+"""
+
+import numpy as np
+
+
+def as_points(vector_class, vectors):
+    """
+    Array with one row per vector and a flag telling if vectors was a single vector
+    vectors may be an iterable of vectors or a vector with arrays as component values
+    """
+
+    if vector_class.is_vector(vectors):
+        cvalues = [ np.asarray(cv, dtype=float) for cv in vectors._cvalues ]
+        single = all(cv.ndim == 0 for cv in cvalues)
+        shape = np.broadcast(*cvalues).shape
+        points = \
+            np.column_stack(
+                [
+                    np.broadcast_to(cv, shape).ravel()
+                    for cv in cvalues
+                ]
+            )
+    else:
+        single = False
+        points = \
+            np.array(
+                [
+                    (v if vector_class.is_vector(v) else vector_class.fill(v))._cvalues
+                    for v in vectors
+                ],
+                dtype = float
+            )
+        points = points.reshape(-1, vector_class.dimensions())
+
+    return points, single
+
+
+def as_columns(vector_class, vectors):
+    """
+    List with one contiguous array for each of the components and a flag telling if vectors was a single vector
+    vectors may be an iterable of vectors or a vector with arrays as component values
+    Component arrays that are already contiguous and one-dimensional are not copied
+    """
+
+    if vector_class.is_vector(vectors):
+        cvalues = [ np.asarray(cv, dtype=float) for cv in vectors._cvalues ]
+        single = all(cv.ndim == 0 for cv in cvalues)
+        shape = np.broadcast(*cvalues).shape
+        columns = \
+            [
+                np.ascontiguousarray(np.broadcast_to(cv, shape)).ravel()
+                for cv in cvalues
+            ]
+    else:
+        points, single = as_points(vector_class, vectors)
+        columns = [ *np.ascontiguousarray(points.T) ]
+
+    return columns, single
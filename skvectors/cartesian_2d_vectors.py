@@ -8,7 +8,7 @@ import skvectors.helper_functions as hf
 from skvectors.cartesian_vectors import create_class_Cartesian_Vector
 
 
-def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, functions=None):
+def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, dtype=None, functions=None, frozen=False, memoize=False, verify='cached'):
     """
     Function that creates a cartesian vector class with 2 dimensions
     """
@@ -29,7 +29,11 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
             sep = sep,
             cnull = cnull,
             cunit = cunit,
-            functions = functions
+            dtype = dtype,
+            functions = functions,
+            frozen = frozen,
+            memoize = memoize,
+            verify = verify
         )
 
 
@@ -37,6 +41,8 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
         """Initialize class"""
 
         hf.setup_vector_class(cls=cls, name=name, functions=functions)
+        if cls._memoize:
+            hf.memoize_properties(cls, [ 'radius', 'azimuth' ])
 
         return cls
 
@@ -65,6 +71,9 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
                 'sin'
             ]
 
+        # angle() gives signed angles, so the pairwise matrices of angles are made in the same way
+        _signed_angles = True
+
 
         @classmethod
         def from_polar(cls, radius, azimuth):
@@ -85,6 +94,48 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
             return vector
 
 
+        @classmethod
+        def transform(cls):
+            """
+            An identity affine transform for the vectors of the class, to add rotations, scalings and translations to
+            E.g. V2D.transform().rotate(0.5).translate(...).apply_many(...)
+            """
+
+            from skvectors.transforms import Transform
+
+            return Transform(cls)
+
+
+        @classmethod
+        def from_polar_many(cls, radius, azimuth, out=None):
+            """
+            A vector with arrays as component values created from arrays of polar coordinates (needs NumPy)
+            The coordinates may be scalars or arrays that can be broadcast together
+            The component values are also written into out (shape (2, n)) if given
+            """
+
+            from skvectors.polar import cartesian_columns
+
+            out = cartesian_columns(radius, azimuth, out=out)
+
+            return cls(*out, _internal=True)
+
+
+        @classmethod
+        def to_polar_many(cls, vectors, out=None):
+            """
+            The radii and azimuths of the vectors in a batch as an array with shape (2, n) (needs NumPy)
+            The batch may be an iterable of vectors or a vector with arrays as component values
+            """
+
+            from skvectors.batches import as_columns
+            from skvectors.polar import polar_columns
+
+            columns, _ = as_columns(cls, vectors)
+
+            return polar_columns(columns, out=out)
+
+
         def perp(self):
             """A vector that is perpendicular to a vector"""
 
@@ -135,6 +186,36 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
             return angle_between
 
 
+        @hf.ensure_other_is_vector
+        def angle_sin_cos(self, other, clip=False):
+            """
+            The angle in radians between two vectors (the same as from angle()), and its sine and cosine
+            The lengths are only calculated once
+            """
+
+            cvs0, cvs1 = self._cvalues
+            cvo0, cvo1 = other._cvalues
+            ls = self.length()
+            lo = other.length()
+            dot = cvs0 * cvo0 + cvs1 * cvo1
+            perp_dot = cvs0 * cvo1 - cvs1 * cvo0
+            angle_s = self.component_atan2(cvs1, cvs0)
+            angle_o = other.component_atan2(cvo1, cvo0)
+            angle_between = angle_o - angle_s
+            try:
+                sine = perp_dot / (ls * lo)
+                cosine = dot / (ls * lo)
+            except ZeroDivisionError as err:
+                msg = "One (or both) of the vectors is a zero vector"
+                raise ZeroDivisionError(msg) from err
+            if clip:
+                cunit = self._cunit
+                sine = self.clip(sine, -cunit, cunit)
+                cosine = self.clip(cosine, -cunit, cunit)
+
+            return angle_between, sine, cosine
+
+
         def rotate(self, angle):
             """The vector rotated by an angle in radiands"""
 
@@ -184,14 +265,26 @@ def create_class_Cartesian_2D_Vector(name, component_names, *, brackets='<>', se
             return vector
 
 
+        def to_polar(self):
+            """The radius and azimuth of a vector, calculated in one pass"""
+
+            cunit = self._cunit
+            cvs0, cvs1 = self._cvalues
+            radius = (cvs0**(cunit * 2) + cvs1**(cunit * 2))**(cunit / 2)
+            azimuth = self.component_atan2(cvs1, cvs0)
+
+            return radius, azimuth
+
+
         def polar_as_dict(self):
             """Polar coordinates of a vector as a dictionary"""
 
-            result = \
-                {
-                    'radius': self.radius,
-                    'azimuth': self.azimuth
-                }
+            if self._memoize:
+                # The properties remember their values
+                polar = self.radius, self.azimuth
+            else:
+                polar = self.to_polar()
+            result = dict(zip([ 'radius', 'azimuth' ], polar))
 
             return result
 
@@ -8,7 +8,7 @@ import skvectors.helper_functions as hf
 from skvectors.cartesian_vectors import create_class_Cartesian_Vector
 
 
-def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, functions=None):
+def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, dtype=None, functions=None, frozen=False, memoize=False, verify='cached'):
     """Function that creates a cartesian vector class with 3 dimensions"""
 
     hf.verify_class_name(name)
@@ -27,7 +27,11 @@ def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', se
             sep = sep,
             cnull = cnull,
             cunit = cunit,
-            functions = functions
+            dtype = dtype,
+            functions = functions,
+            frozen = frozen,
+            memoize = memoize,
+            verify = verify
         )
 
 
@@ -122,6 +126,8 @@ def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', se
         make_rotate_0_method(cls)
         make_rotate_1_method(cls)
         make_rotate_2_method(cls)
+        if cls._memoize:
+            hf.memoize_properties(cls, [ 'radius', 'azimuth', 'inclination' ])
 
         return cls
 
@@ -175,6 +181,104 @@ def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', se
             return vector
 
 
+        @classmethod
+        def transform(cls):
+            """
+            An identity affine transform for the vectors of the class, to add rotations, scalings and translations to
+            E.g. V3D.transform().rotate(0.5, 'x').translate(...).apply_many(...)
+            """
+
+            from skvectors.transforms import Transform
+
+            return Transform(cls)
+
+
+        @classmethod
+        def from_polar_many(cls, radius, azimuth, inclination, out=None):
+            """
+            A vector with arrays as component values created from arrays of polar coordinates (needs NumPy)
+            The coordinates may be scalars or arrays that can be broadcast together
+            The component values are also written into out (shape (3, n)) if given
+            """
+
+            from skvectors.polar import cartesian_columns
+
+            out = cartesian_columns(radius, azimuth, inclination, out=out)
+
+            return cls(*out, _internal=True)
+
+
+        @classmethod
+        def to_polar_many(cls, vectors, out=None):
+            """
+            The radii, azimuths and inclinations of the vectors in a batch as an array with shape (3, n) (needs NumPy)
+            The batch may be an iterable of vectors or a vector with arrays as component values
+            """
+
+            from skvectors.batches import as_columns
+            from skvectors.polar import polar_columns
+
+            columns, _ = as_columns(cls, vectors)
+
+            return polar_columns(columns, out=out)
+
+
+        @classmethod
+        def cross_many(cls, vectors_a, vectors_b, normalize=False, out=None):
+            """
+            The cross products of the vectors in two batches (needs NumPy)
+            The batches may be iterables of vectors or vectors with arrays as component values
+            Returns a vector with arrays as component values, with the results also written into out (shape (3, n)) if given
+            """
+
+            from skvectors.batches import as_columns
+            from skvectors.products import cross_columns
+
+            columns_a, _ = as_columns(cls, vectors_a)
+            columns_b, _ = as_columns(cls, vectors_b)
+            out = cross_columns(columns_a, columns_b, normalize=normalize, out=out)
+
+            return cls(*out, _internal=True)
+
+
+        @classmethod
+        def stp_many(cls, vectors_a, vectors_b, vectors_c, out=None):
+            """
+            The scalar triple products of the vectors in three batches as an array (needs NumPy)
+            The batches may be iterables of vectors or vectors with arrays as component values
+            """
+
+            from skvectors.batches import as_columns
+            from skvectors.products import stp_columns
+
+            columns_a, _ = as_columns(cls, vectors_a)
+            columns_b, _ = as_columns(cls, vectors_b)
+            columns_c, _ = as_columns(cls, vectors_c)
+            out = stp_columns(columns_a, columns_b, columns_c, out=out)
+
+            return out
+
+
+        @classmethod
+        def triangle_normals(cls, points_0, points_1, points_2, normalize=False, out=None):
+            """
+            The normals (p1 - p0) x (p2 - p0) of triangles with corners from three batches (needs NumPy)
+            The batches may be iterables of vectors or vectors with arrays as component values
+            With normalize, the normals get length 1, except for degenerate triangles where they stay zero
+            Returns a vector with arrays as component values, with the results also written into out (shape (3, n)) if given
+            """
+
+            from skvectors.batches import as_columns
+            from skvectors.products import triangle_normal_columns
+
+            columns_0, _ = as_columns(cls, points_0)
+            columns_1, _ = as_columns(cls, points_1)
+            columns_2, _ = as_columns(cls, points_2)
+            out = triangle_normal_columns(columns_0, columns_1, columns_2, normalize=normalize, out=out)
+
+            return cls(*out, _internal=True)
+
+
         @hf.ensure_other_is_vector
         def cross(self, other):
             """The cross product of two vectors"""
@@ -266,8 +370,7 @@ def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', se
 
             axis = other.cross(other_)
             try:
-                cos = other.cos(other_)
-                sin = other.sin(other_)
+                _, sin, cos = other.angle_sin_cos(other_)
             except ZeroDivisionError as err:
                 msg = "One (or both) of the direction vectors is a zero vector"
                 raise ZeroDivisionError(msg) from err
@@ -306,15 +409,31 @@ def create_class_Cartesian_3D_Vector(name, component_names, *, brackets='<>', se
             return parallel
 
 
+        def to_polar(self):
+            """
+            The radius, azimuth and inclination of a vector, calculated in one pass
+            The radius in the xy-plane is shared by the radius and the inclination
+            """
+
+            cunit = self._cunit
+            cvs0, cvs1, cvs2 = self._cvalues
+            rxy2 = cvs0**(cunit * 2) + cvs1**(cunit * 2)
+            radius = (rxy2 + cvs2**(cunit * 2))**(cunit / 2)
+            azimuth = self.component_atan2(cvs1, cvs0)
+            inclination = self.component_atan2(cvs2, rxy2**(cunit / 2))
+
+            return radius, azimuth, inclination
+
+
         def polar_as_dict(self):
             """Polar coordinates of a vector as a dictionary"""
 
-            result = \
-                {
-                    'radius': self.radius,
-                    'azimuth': self.azimuth,
-                    'inclination': self.inclination
-                }
+            if self._memoize:
+                # The properties remember their values
+                polar = self.radius, self.azimuth, self.inclination
+            else:
+                polar = self.to_polar()
+            result = dict(zip([ 'radius', 'azimuth', 'inclination' ], polar))
 
             return result
 
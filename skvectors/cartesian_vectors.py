@@ -8,10 +8,12 @@ import skvectors.helper_functions as hf
 from skvectors.vectors import create_class_Vector
 
 
-def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=None, cunit=None, functions=None):
+def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=None, cunit=None, dtype=None, functions=None, frozen=False, memoize=False, verify='cached'):
     """
     Function that creates a cartesian vector class
     The number of dimensions are determined by the number of component names
+    If memoize is true, vectors remember their lengths and normalized vectors until they are changed
+    verify ('full', 'cached' or 'off') controls the verification of cnull and cunit
     """
 
     hf.verify_class_name(name)
@@ -25,7 +27,10 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
             sep = sep,
             cnull = cnull,
             cunit = cunit,
-            functions = functions
+            dtype = dtype,
+            functions = functions,
+            frozen = frozen,
+            verify = verify
         )
 
 
@@ -33,6 +38,9 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
         """Initialize class"""
 
         hf.setup_vector_class(cls=cls, name=name, functions=functions)
+        cls._memoize = memoize or cls._frozen
+        if cls._memoize:
+            hf.memoize_methods(cls, [ 'length', 'normalize' ])
         cls.__abs__ = cls.length
         cls.__matmul__ = cls.dot
         cls.__rmatmul__ = cls.dot
@@ -61,6 +69,111 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
                 'pi',
                 'atan2'
             ]
+        _memo_statistics = { }
+
+
+        @classmethod
+        def memo_statistics(cls):
+            """Number of hits and misses for each of the memoized methods in the class"""
+
+            statistics = \
+                {
+                    method_name: { 'hits': hits, 'misses': misses }
+                    for method_name, (hits, misses) in cls._memo_statistics.items()
+                }
+
+            return statistics
+
+
+        @classmethod
+        def reset_memo_statistics(cls):
+            """Set the number of hits and misses for the memoized methods to 0"""
+
+            for counts in cls._memo_statistics.values():
+                counts[:] = [ 0, 0 ]
+
+
+        @classmethod
+        def pairwise(cls, method_name, vectors_a, vectors_b=None, block=512, stream=False, out=None):
+            """
+            Matrix with the results of a method for all pairs of vectors from two batches (needs NumPy)
+            The batches may be iterables of vectors or vectors with arrays as component values
+            If vectors_b is None, the pairs are taken from vectors_a only
+            If stream is true, a generator that yields (row slice, column slice, block) is returned instead
+            """
+
+            from skvectors.pairwise import pairwise, iter_pairwise
+
+            if stream:
+                if out is not None:
+                    msg = "The out argument can not be used together with stream"
+                    raise ValueError(msg)
+                result = iter_pairwise(cls, method_name, vectors_a, vectors_b, block=block)
+            else:
+                result = pairwise(cls, method_name, vectors_a, vectors_b, block=block, out=out)
+
+            return result
+
+
+        @classmethod
+        def pairwise_dot(cls, vectors_a, vectors_b=None, block=512, stream=False, out=None):
+            """Matrix with the dot products of all pairs of vectors from two batches (needs NumPy)"""
+
+            return cls.pairwise('dot', vectors_a, vectors_b, block=block, stream=stream, out=out)
+
+
+        @classmethod
+        def pairwise_distance(cls, vectors_a, vectors_b=None, block=512, stream=False, out=None):
+            """Matrix with the distances between all pairs of vectors from two batches (needs NumPy)"""
+
+            return cls.pairwise('distance', vectors_a, vectors_b, block=block, stream=stream, out=out)
+
+
+        @classmethod
+        def pairwise_angle(cls, vectors_a, vectors_b=None, block=512, stream=False, out=None):
+            """Matrix with the angles between all pairs of vectors from two batches (needs NumPy)"""
+
+            return cls.pairwise('angle', vectors_a, vectors_b, block=block, stream=stream, out=out)
+
+
+        @classmethod
+        def statistics(cls, vectors=None):
+            """
+            Mergeable statistics (bounds, centroid, covariance and principal axes) for vectors (needs NumPy)
+            vectors may be a vector with arrays as component values or an iterable of vectors or of such vectors
+            """
+
+            from skvectors.reductions import Vector_Statistics
+
+            return Vector_Statistics(cls, vectors)
+
+
+        @classmethod
+        def bounds(cls, vectors):
+            """The vectors with the smallest and the largest component values of several vectors (needs NumPy)"""
+
+            return cls.statistics(vectors).bounds()
+
+
+        @classmethod
+        def centroid(cls, vectors):
+            """The mean of several vectors (needs NumPy)"""
+
+            return cls.statistics(vectors).centroid()
+
+
+        @classmethod
+        def covariance(cls, vectors, ddof=1):
+            """The covariance matrix of the component values of several vectors (needs NumPy)"""
+
+            return cls.statistics(vectors).covariance(ddof)
+
+
+        @classmethod
+        def principal_axes(cls, vectors, ddof=1):
+            """The variances along and the directions of the principal axes of several vectors (needs NumPy)"""
+
+            return cls.statistics(vectors).principal_axes(ddof)
 
 
         @classmethod
@@ -223,7 +336,7 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
             cunit = self._cunit
             length_of_vector = (self**(cunit * 2)).sum_of_components()**(cunit / 2)
 
-            return length_of_vector
+            return self._coerce_value(length_of_vector)
 
 
         @hf.ensure_other_is_vector
@@ -310,6 +423,28 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
             return scalar
 
 
+        def _angle_terms(self, other):
+            """
+            The lengths and the dot product of two vectors, and the squared lengths of the difference and
+            the sum of the vectors when they are scaled to the same length, calculated without temporary vectors
+            """
+
+            exponent = self._cunit * 2
+            ls = self.length()
+            lo = other.length()
+            dot = self.component_null()
+            ln2 = self.component_null()
+            ld2 = self.component_null()
+            for cvs, cvo in zip(self._cvalues, other._cvalues):
+                vs = cvs * lo
+                vo = cvo * ls
+                dot += cvs * cvo
+                ln2 += (vs - vo)**exponent
+                ld2 += (vs + vo)**exponent
+
+            return ls, lo, dot, ln2, ld2
+
+
         @hf.ensure_other_is_vector
         def angle(self, other):
             """
@@ -318,15 +453,38 @@ def create_class_Cartesian_Vector(name, component_names, *, brackets='<>', sep='
             https://people.eecs.berkeley.edu/~wkahan/MathH110/Cross.pdf
             """
 
-            ls = self.length()
-            lo = other.length()
-            vs = self * lo
-            vo = other * ls
-            ln = (vs - vo).length()
-            ld = (vs + vo).length()
+            exponent = self._cunit / 2
+            _, _, _, ln2, ld2 = self._angle_terms(other)
+            angle_between = self.component_atan2(ln2**exponent, ld2**exponent) * 2
+
+            return self._coerce_value(angle_between)
+
+
+        @hf.ensure_other_is_vector
+        def angle_sin_cos(self, other, clip=False):
+            """
+            The smallest angle in radians (from cnull to +cunit*pi) between two vectors, and its sine and cosine
+            The lengths are only calculated once, and the angle with a single call to atan2, as in angle()
+            """
+
+            cunit = self._cunit
+            exponent = cunit / 2
+            ls, lo, dot, ln2, ld2 = self._angle_terms(other)
+            ln = ln2**exponent
+            ld = ld2**exponent
             angle_between = self.component_atan2(ln, ld) * 2
+            try:
+                # The sine of the double of the half angle that has the tangent ln / ld
+                sine = ln * ld * 2 / (ln2 + ld2)
+                cosine = dot / (ls * lo)
+            except ZeroDivisionError as err:
+                msg = "One (or both) of the vectors is a zero vector"
+                raise ZeroDivisionError(msg) from err
+            if clip:
+                sine = self.clip(sine, self._cnull, cunit)
+                cosine = self.clip(cosine, -cunit, cunit)
 
-            return angle_between
+            return self._coerce_value(angle_between), self._coerce_value(sine), self._coerce_value(cosine)
 
 
         @hf.ensure_other_is_vector
@@ -5,8 +5,8 @@ Use of this source code is governed by a BSD-license that can be found in the LI
 """
 
 from copy import copy
-from inspect import getfullargspec, isfunction, ismethod  # isbuiltin
-# import functools
+from functools import lru_cache
+from itertools import repeat
 import skvectors.helper_functions as hf
 
 
@@ -53,10 +53,47 @@ def verify_names(*, chk_names, ref_names):
     return names_ok
 
 
-def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep=', '):
+@lru_cache(maxsize=256)
+def format_template(dimensions, format_spec, brackets, sep):
+    """
+    Function that formats the component values of a vector with format_spec, brackets and sep
+    The functions are remembered, so that the template is only made once for each combination
+    """
+
+    if '{' in format_spec or '}' in format_spec:
+
+
+        def format_cvalues(*cvalues):
+
+            csv = \
+                sep.join(
+                    format(cv, format_spec)
+                    for cv in cvalues
+                )
+            string = csv.join(brackets)
+
+            return string
+
+
+        template = format_cvalues
+    else:
+        escape = lambda s: s.replace('{', '{{').replace('}', '}}')
+        fields = \
+            (
+                '{' + str(index) + ':' + format_spec + '}'
+                for index in range(dimensions)
+            )
+        template = \
+            escape(sep).join(fields).join(map(escape, brackets)).format
+
+    return template
+
+
+def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep=', ', frozen=False):
     """
     Function that creates a fundamental vector class
     The number of dimensions are determined by the number of component names
+    If frozen is true, the vectors in the class are immutable and hashable
     """
 
 
@@ -88,6 +125,7 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
     dimensions = len(set(component_names))
     brackets = [ str(br) for br in brackets ]
     sep = str(sep)
+    frozen = bool(frozen)
     verify_arguments(component_names, dimensions, brackets)
 
 
@@ -106,11 +144,24 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
             def cset(self, value, _index=index):
 
                 self._cvalues[_index] = copy(value)
+                self._coerce_cvalues()
+                self._clear_memo()
+
+
+            def cset_frozen(self, value, _cname=cname):
+
+                cls = type(self)
+                msg = \
+                    "'{cls.__name__}' object attribute '{_cname}' is read-only" \
+                    .format_map(vars())
+                raise AttributeError(msg)
 
 
             cdoc = \
                 "Value of {cname}-component of vector (component no. {index})" \
                 .format_map(vars())
+            if cls._frozen:
+                cset = cset_frozen
             setattr(cls, cname, property(fget=cget, fset=cset, doc=cdoc))
 
 
@@ -121,6 +172,7 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
         cls._cnames = component_names
         cls.brackets = brackets
         cls.sep = sep
+        cls._frozen = frozen
         hf.setup_vector_class(cls=cls, name=name, functions=None)
         setup_components_access(cls)
 
@@ -161,13 +213,19 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
             return result
 
 
+        @classmethod
+        def _fill_value(cls, value):
+
+            return copy(value)
+
+
         @classmethod
         def fill(cls, value):
             """A vector with all component values set to value"""
 
             cvalues = \
                 (
-                    copy(value)
+                    cls._fill_value(value)
                     for _ in range(cls._dimensions)
                 )
             vector = cls(*cvalues, _internal=True)
@@ -206,6 +264,27 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
                             copy(cv)
                             for cv in cvalues
                         ]
+            if self._frozen:
+                self._cvalues = tuple(self._cvalues)
+
+
+        def _verify_not_frozen(self):
+
+            if self._frozen:
+                cls = type(self)
+                msg = "'{cls.__name__}' object is frozen and can not be changed"
+                raise TypeError(msg.format_map(vars()))
+
+
+        def _coerce_cvalues(self):
+
+            # Classes with a dtype convert changed component values to it
+            pass
+
+
+        def _clear_memo(self):
+
+            self.__dict__.pop('_memo', None)
 
 
         def _check_arguments(self, cvalues, named_cvalues):
@@ -326,15 +405,59 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
             return string
 
 
+        def _format_template(self, format_spec):
+
+            # The brackets and sep may be changed for the class or for an instance
+            template = format_template(self._dimensions, format_spec, tuple(self.brackets), self.sep)
+
+            return template
+
+
+        @classmethod
+        def format_many(cls, vectors, format_spec=''):
+            """
+            Apply format() to each component value of several vectors
+            vectors may also be a vector with sequences (e.g. NumPy arrays) as component values,
+            then one string is made for each of the elements in the sequences
+            """
+
+            template = format_template(cls._dimensions, format_spec, tuple(cls.brackets), cls.sep)
+            if cls.is_vector(vectors):
+                columns = [ ]
+                rows = False
+                for cvs in vectors._cvalues:
+                    tolist = getattr(cvs, 'tolist', None)
+                    if tolist is not None:
+                        column = tolist()
+                    elif hasattr(cvs, '__len__') and not isinstance(cvs, str):
+                        column = [ *cvs ]
+                    else:
+                        column = cvs
+                    if isinstance(column, list):
+                        rows = True
+                    else:
+                        column = repeat(column)
+                    columns.append(column)
+                if rows:
+                    strings = [ *map(template, *columns) ]
+                else:
+                    strings = [ template(*vectors._cvalues) ]
+            else:
+                vectors = cls._ensure_all_are_vectors(vectors)
+                strings = \
+                    [
+                        template(*v._cvalues)
+                        for v in vectors
+                    ]
+
+            return strings
+
+
         def __format__(self, format_spec=''):
             """Apply format() to each component value"""
 
-            csv = \
-                self.sep.join(
-                    format(cvs, format_spec)
-                    for cvs in self._cvalues
-                )
-            string = csv.join(self.brackets)
+            template = self._format_template(format_spec)
+            string = template(*self._cvalues)
 
             return string
 
@@ -356,6 +479,7 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
         def __setitem__(self, index, values):
             """Change vector component values by indexing"""
 
+            self._verify_not_frozen()
             if isinstance(index, int):
                 cvalues = copy(values)
             elif isinstance(index, slice):
@@ -379,6 +503,8 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
                     .format(type_index=type(index))
                 raise TypeError(msg)
             self._cvalues[index] = cvalues
+            self._coerce_cvalues()
+            self._clear_memo()
 
 
         @hf.ensure_other_is_vector
@@ -434,6 +560,9 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
         @classmethod
         def _verify_function(cls, name, function, no_of_arguments):
 
+            # inspect is slow to import, and only needed here
+            from inspect import getfullargspec, isfunction, ismethod  # isbuiltin
+
             if function is None:
                 method_name = 'component_' + name
                 if not hasattr(cls, method_name):
@@ -513,5 +642,62 @@ def create_class_Fundamental_Vector(name, component_names, *, brackets='<>', sep
             setattr(cls, name, vector_function)
 
 
+        @staticmethod
+        def _count_arguments(function):
+
+            from inspect import Parameter, signature
+
+            function_name = getattr(function, '__name__', str(function))
+            if not callable(function):
+                msg = "{function_name} can not be used here"
+                raise TypeError(msg.format_map(vars()))
+            try:
+                parameters = signature(function).parameters.values()
+            except (TypeError, ValueError) as err:
+                msg = "The number of arguments for {function_name} must be given"
+                raise TypeError(msg.format_map(vars())) from err
+            kinds = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+            no_of_arguments = \
+                sum(
+                    1
+                    for p in parameters
+                    if p.kind in kinds and p.default is Parameter.empty
+                )
+
+            return no_of_arguments
+
+
+        @classmethod
+        def register_vector_function(cls, name, function, no_of_arguments=None):
+            """
+            Create the method 'vector_<name>' that applies a function component-wise to 1, 2 or 3 vectors
+            The function may be a NumPy ufunc, a builtin, a functools.partial or any other callable
+            A ufunc gets a specialized method that takes an optional vector out with arrays as component values
+            """
+
+            method_name = 'vector_' + name
+            if hf.is_ufunc(function):
+                if function.nout != 1:
+                    msg = "Only ufuncs with one output can be used, not {function.__name__} with {function.nout}"
+                    raise TypeError(msg.format_map(vars()))
+                vector_function = hf.make_method_ufunc(method_name, function)
+            else:
+                if no_of_arguments is None:
+                    no_of_arguments = cls._count_arguments(function)
+                make_methods = \
+                    {
+                        1: hf.make_method_arg1,
+                        2: hf.make_method_arg2,
+                        3: hf.make_method_arg3
+                    }
+                make_method = make_methods.get(no_of_arguments)
+                if make_method is None:
+                    function_name = getattr(function, '__name__', str(function))
+                    msg = "{function_name} must take 1, 2 or 3 arguments, not {no_of_arguments}"
+                    raise TypeError(msg.format_map(vars()))
+                vector_function = make_method(method_name, function)
+            setattr(cls, method_name, vector_function)
+
+
     return Fundamental_Vector
 
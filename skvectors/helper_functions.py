@@ -7,8 +7,17 @@ Use of this source code is governed by a BSD-license that can be found in the LI
 import keyword
 import operator
 import math
-from functools import wraps
-from pydoc import render_doc, plaintext
+from copy import copy
+from functools import reduce, wraps
+from itertools import repeat
+from weakref import WeakKeyDictionary, WeakSet
+
+# All the vector classes that have been created, e.g. for profiling
+vector_classes = WeakSet()
+
+# Rendered documentation for the functions that methods are made from
+_function_docs = WeakKeyDictionary()
+_builtin_function_docs = { }
 
 
 def ensure_other_is_vector(method):
@@ -60,28 +69,31 @@ def setup_internal_functions(cls, functions):
 
     if functions is not None:
         functions = dict(functions)
-        default_functions = \
-            {
-                'and': and_,
-                'or': or_,
-                'not': operator.not_, # ?
-                'eq': operator.eq,
-                'ne': operator.ne,
-                'all': all,
-                'any': any,
-                'min': min,
-                'max': max,
-                'abs': abs,
-                'trunc': math.trunc,
-                'floor': math.floor,
-                'ceil': math.ceil,
-                'pi': math.pi,
-                'atan2': math.atan2,
-                'cos': math.cos,
-                'sin': math.sin,
-                'copysign': math.copysign,
-                'log10': math.log10
-            }
+        if getattr(cls, '_dtype', None) is not None:
+            default_functions = numpy_functions()
+        else:
+            default_functions = \
+                {
+                    'and': and_,
+                    'or': or_,
+                    'not': operator.not_, # ?
+                    'eq': operator.eq,
+                    'ne': operator.ne,
+                    'all': all,
+                    'any': any,
+                    'min': min,
+                    'max': max,
+                    'abs': abs,
+                    'trunc': math.trunc,
+                    'floor': math.floor,
+                    'ceil': math.ceil,
+                    'pi': math.pi,
+                    'atan2': math.atan2,
+                    'cos': math.cos,
+                    'sin': math.sin,
+                    'copysign': math.copysign,
+                    'log10': math.log10
+                }
         internal_functions = getattr(cls, '_internal_functions', { })
         for fname in internal_functions:
             if fname in functions:
@@ -98,6 +110,37 @@ def setup_internal_functions(cls, functions):
                 setattr(cls, cfname, method)
 
 
+def numpy_functions():
+    """NumPy versions of the default internal functions, for vector classes with a NumPy dtype"""
+
+    import numpy as np
+
+    functions = \
+        {
+            'and': np.logical_and,
+            'or': np.logical_or,
+            'not': np.logical_not,
+            'eq': np.equal,
+            'ne': np.not_equal,
+            'all': np.all,
+            'any': np.any,
+            'min': np.minimum,
+            'max': np.maximum,
+            'abs': np.absolute,
+            'trunc': np.trunc,
+            'floor': np.floor,
+            'ceil': np.ceil,
+            'pi': np.pi,
+            'atan2': np.arctan2,
+            'cos': np.cos,
+            'sin': np.sin,
+            'copysign': np.copysign,
+            'log10': np.log10
+        }
+
+    return functions
+
+
 def verify_class_name(name):
 
     if not isinstance(name, str):
@@ -111,6 +154,18 @@ def verify_class_name(name):
         raise ValueError(msg)
 
 
+def hash_frozen_vector(self):
+    """Hash value of a frozen vector, calculated from its component values"""
+
+    try:
+        hash_value = self.__dict__['_hash']
+    except KeyError:
+        hash_value = hash(self._cvalues)
+        self.__dict__['_hash'] = hash_value
+
+    return hash_value
+
+
 def setup_vector_class(*, cls, name, functions):
 
     cls.__name__ = name
@@ -120,6 +175,124 @@ def setup_vector_class(*, cls, name, functions):
             cs_cnames = ', '.join(cls._cnames)
         )
     setup_internal_functions(cls, functions)
+    if cls._frozen:
+        # A class that defines __eq__ gets __hash__ set to None
+        cls.__hash__ = hash_frozen_vector
+    vector_classes.add(cls)
+
+
+def memoize_method(method):
+    """
+    Make a method without arguments remember its result for each vector instance
+    The results are forgotten when the component values of a vector are changed
+    """
+
+    method_name = method.__name__
+
+
+    @wraps(method)
+    def memoized_method(self):
+
+        memo = self.__dict__.setdefault('_memo', { })
+        counts = self._memo_statistics[method_name]
+        try:
+            result = memo[method_name]
+        except KeyError:
+            result = method(self)
+            memo[method_name] = result
+            counts[1] += 1
+        else:
+            counts[0] += 1
+        if not self._frozen:
+            # The caller may change the result, but not the remembered one
+            if self.is_vector(result):
+                result = result.copy()
+            else:
+                result = copy(result)
+
+        return result
+
+
+    return memoized_method
+
+
+def setup_memo_statistics(cls, method_names):
+
+    if '_memo_statistics' not in vars(cls):
+        cls._memo_statistics = dict(getattr(cls, '_memo_statistics', { }))
+    for method_name in method_names:
+        cls._memo_statistics[method_name] = [ 0, 0 ]
+
+
+def memoize_methods(cls, method_names):
+
+    setup_memo_statistics(cls, method_names)
+    for method_name in method_names:
+        method = getattr(cls, method_name)
+        setattr(cls, method_name, memoize_method(method))
+
+
+def memoize_properties(cls, property_names):
+
+    setup_memo_statistics(cls, property_names)
+    for property_name in property_names:
+        prop = getattr(cls, property_name)
+        fget = memoize_method(prop.fget)
+        setattr(cls, property_name, property(fget=fget, fset=prop.fset, doc=prop.__doc__))
+
+
+def max_of_values(max_function, values, axis=0):
+    """
+    The largest of some non negative values, or 0 if there are no values
+    Functions with a reduce method, like NumPy's maximum, do it in a single operation
+    """
+
+    reduce_function = getattr(max_function, 'reduce', None)
+    if reduce_function is None:
+        try:
+            values = iter(values)
+        except TypeError:
+            values = [ values ]
+        max_value = reduce(max_function, values, 0)
+    else:
+        if not hasattr(values, 'shape'):
+            try:
+                values = [ *values ]
+            except TypeError:
+                pass
+        try:
+            max_value = reduce_function(values, axis=axis, initial=0)
+        except ValueError:
+            # Arrays with different shapes can not be stacked, but they can be broadcast
+            max_value = reduce(max_function, values, 0)
+
+    return max_value
+
+
+def render_function_doc(function):
+    """
+    The documentation for a function as rendered by pydoc, remembered for each function
+    pydoc is only imported when it is needed, since importing it is slow
+    """
+
+    try:
+        docs = _function_docs
+        doc = docs.get(function)
+    except TypeError:
+        # Builtin functions and ufuncs can not be weakly referenced
+        docs = _builtin_function_docs
+        try:
+            doc = docs.get(function)
+        except TypeError:
+            docs = None
+            doc = None
+    if doc is None:
+        from pydoc import render_doc, plaintext
+        doc = render_doc(function, title='%s', renderer=plaintext)
+        if docs is not None:
+            docs[function] = doc
+
+    return doc
 
 
 def make_method_arg1(name, function):
@@ -134,7 +307,7 @@ def make_method_arg1(name, function):
 
 
     method.__name__ = name
-    function_doc = render_doc(function, title='%s', renderer=plaintext)
+    function_doc = render_function_doc(function)
     doc = "Apply this function component-wise to a vector:\n\n"
     doc += function_doc
     method.__doc__ = doc
@@ -146,16 +319,20 @@ def make_method_arg2(name, function):
     """TODO"""
 
 
-    @ensure_other_is_vector
     def method(self, other):
 
-        vector = self._vector(map(function, self._cvalues, other._cvalues))
+        if self.is_vector(other):
+            vector = self._vector(map(function, self._cvalues, other._cvalues))
+        else:
+            # Scalar fast path, without filling a vector with the scalar
+            value = self._fill_value(other)
+            vector = self._vector([ function(cvs, value) for cvs in self._cvalues ])
 
         return vector
 
 
     method.__name__ = name
-    function_doc = render_doc(function, title='%s', renderer=plaintext)
+    function_doc = render_function_doc(function)
     doc = "Apply this function component-wise to two vectors:\n\n"
     doc += function_doc
     method.__doc__ = doc
@@ -167,16 +344,19 @@ def make_method_arg2_r(name, function):
     """TODO"""
 
 
-    @ensure_other_is_vector
     def method(self, other):
 
-        vector = self._vector(map(function, other._cvalues, self._cvalues))
+        if self.is_vector(other):
+            vector = self._vector(map(function, other._cvalues, self._cvalues))
+        else:
+            value = self._fill_value(other)
+            vector = self._vector([ function(value, cvs) for cvs in self._cvalues ])
 
         return vector
 
 
     method.__name__ = name
-    function_doc = render_doc(function, title='%s', renderer=plaintext)
+    function_doc = render_function_doc(function)
     doc = "Apply this right-side function component-wise to two vectors:\n\n"
     doc += function_doc
     method.__doc__ = doc
@@ -188,16 +368,21 @@ def make_method_arg2_i(name, function):
     """TODO"""
 
 
-    @ensure_other_is_vector
     def method(self, other):
 
-        self._cvalues = [ *map(function, self._cvalues, other._cvalues) ]
+        if self.is_vector(other):
+            self._cvalues = [ *map(function, self._cvalues, other._cvalues) ]
+        else:
+            value = self._fill_value(other)
+            self._cvalues = [ function(cvs, value) for cvs in self._cvalues ]
+        self._coerce_cvalues()
+        self._clear_memo()
 
         return self
 
 
     method.__name__ = name
-    function_doc = render_doc(function, title='%s', renderer=plaintext)
+    function_doc = render_function_doc(function)
     doc = "Apply this in-place function component-wise to two vectors:\n\n"
     doc += function_doc
     method.__doc__ = doc
@@ -218,7 +403,7 @@ def make_method_arg3(name, function):
 
 
     method.__name__ = name
-    function_doc = render_doc(function, title='%s', renderer=plaintext)
+    function_doc = render_function_doc(function)
     doc = "Apply this function component-wise to three vectors:\n\n"
     doc += function_doc
     method.__doc__ = doc
@@ -226,6 +411,77 @@ def make_method_arg3(name, function):
     return method
 
 
+def is_ufunc(function):
+    """Check if a function is a NumPy ufunc (without importing NumPy)"""
+
+    return type(function).__name__ == 'ufunc' and hasattr(function, 'nin')
+
+
+def make_method_ufunc(name, ufunc):
+    """
+    Make a method that calls a NumPy ufunc once for each component
+    Arguments that are not vectors are passed directly to the ufunc, instead of being filled into vectors
+    """
+
+    no_of_arguments = ufunc.nin
+
+
+    def method(self, *others, out=None):
+
+        if len(others) != no_of_arguments - 1:
+            msg = \
+                "{name}() takes {n} argument(s) ({given} was given)" \
+                .format(name=name, n=no_of_arguments, given=len(others) + 1)
+            raise TypeError(msg)
+        cvalues_list = \
+            [
+                self._cvalues,
+                *(
+                    other._cvalues if self.is_vector(other) else repeat(other)
+                    for other in others
+                )
+            ]
+        if out is None:
+            vector = self._vector(map(ufunc, *cvalues_list))
+        else:
+            out._verify_not_frozen()
+            for cvs, args in zip(out._cvalues, zip(*cvalues_list)):
+                ufunc(*args, out=cvs)
+            out._coerce_cvalues()
+            out._clear_memo()
+            vector = out
+
+        return vector
+
+
+    method.__name__ = name
+    function_doc = render_function_doc(ufunc)
+    doc = "Apply this ufunc component-wise to {n} vector(s), optionally into the arrays of the vector out:\n\n".format(n=no_of_arguments)
+    doc += function_doc
+    method.__doc__ = doc
+
+    return method
+
+
+def make_method_frozen_i(name, function):
+    """Make an in-place method that refuses to change a frozen vector"""
+
+
+    def method(self, other):
+
+        cls = type(self)
+        msg = \
+            "'{cls.__name__}' object is frozen and does not support in-place operator '{name}'" \
+            .format(cls=cls, name=name)
+        raise TypeError(msg)
+
+
+    method.__name__ = name
+    method.__doc__ = "Not supported for frozen vectors"
+
+    return method
+
+
 def make_dunder_methods(cls, functions):
     """Make double-under methods"""
 
@@ -238,6 +494,8 @@ def make_dunder_methods(cls, functions):
                 '2i': make_method_arg2_i
             }
         make_method = make_methods[str(no_of_args) + prefix]
+        if cls._frozen and (prefix == 'i'):
+            make_method = make_method_frozen_i
         method_name = '__' + prefix + name + '__'
         method = make_method(method_name, fn)
         setattr(cls, method_name, method)
@@ -0,0 +1,287 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+KD-tree for nearest neighbour and radius queries among cartesian vectors. It needs NumPy.
+
+The tree is balanced and implicit: node i has the children 2*i + 1 and 2*i + 2,
+and the points of each node are stored contiguously, so that the leaves can be
+searched with NumPy operations.
+"""
+
+import heapq
+import numpy as np
+
+from skvectors.batches import as_points
+
+
+class Vector_KD_Tree:
+    """KD-tree built from cartesian vectors"""
+
+
+    def __init__(self, vector_class, vectors, *, leaf_size=32):
+
+        if leaf_size < 1:
+            msg = "The leaf size must be at least 1"
+            raise ValueError(msg)
+        if vector_class.is_vector(vectors):
+            self._vectors = None
+        else:
+            vectors = [ *vectors ]
+            self._vectors = vectors
+        points, _ = as_points(vector_class, vectors)
+        self._vector_class = vector_class
+        no_of_points = points.shape[0]
+        depth = 0
+        while no_of_points > leaf_size * 2**depth:
+            depth += 1
+        self._depth = depth
+        self._first_leaf = 2**depth - 1
+        no_of_nodes = 2**(depth + 1) - 1
+        self._node_start = np.zeros(no_of_nodes, dtype=np.intp)
+        self._node_end = np.zeros(no_of_nodes, dtype=np.intp)
+        self._node_dim = np.zeros(no_of_nodes, dtype=np.intp)
+        self._node_split = np.zeros(no_of_nodes)
+        self._node_min = np.zeros((no_of_nodes, points.shape[1]))
+        self._node_max = np.zeros((no_of_nodes, points.shape[1]))
+        self._positions = np.arange(no_of_points)
+        self._points = points.copy()
+        self._build(no_of_points)
+
+
+    def __len__(self):
+
+        return self._points.shape[0]
+
+
+    def _build(self, no_of_points):
+
+        points = self._points
+        positions = self._positions
+        node_start = self._node_start
+        node_end = self._node_end
+        node_end[0] = no_of_points
+        # Split the nodes level by level at the median of their widest dimension
+        for node in range(self._first_leaf):
+            start = node_start[node]
+            end = node_end[node]
+            middle = (start + end) // 2
+            left = 2 * node + 1
+            node_start[left] = start
+            node_end[left] = middle
+            node_start[left + 1] = middle
+            node_end[left + 1] = end
+            if end - start < 2:
+                continue
+            segment = points[start:end]
+            dim = np.argmax(segment.max(axis=0) - segment.min(axis=0))
+            order = np.argpartition(segment[:, dim], middle - start)
+            points[start:end] = segment[order]
+            positions[start:end] = positions[start:end][order]
+            self._node_dim[node] = dim
+            self._node_split[node] = points[middle, dim]
+        # Bounding boxes for the leaves, which are stored in order, and then level by level upwards
+        node_min = self._node_min
+        node_max = self._node_max
+        leaves = np.arange(self._first_leaf, len(node_start))
+        filled = leaves[node_end[leaves] > node_start[leaves]]
+        node_min[leaves] = np.inf
+        node_max[leaves] = -np.inf
+        if len(filled) > 0:
+            node_min[filled] = np.minimum.reduceat(points, node_start[filled], axis=0)
+            node_max[filled] = np.maximum.reduceat(points, node_start[filled], axis=0)
+        for level in range(self._depth - 1, -1, -1):
+            nodes = np.arange(2**level - 1, 2**(level + 1) - 1)
+            node_min[nodes] = np.minimum(node_min[2 * nodes + 1], node_min[2 * nodes + 2])
+            node_max[nodes] = np.maximum(node_max[2 * nodes + 1], node_max[2 * nodes + 2])
+        # Where in the tree the vector at each position is
+        self._rows = np.empty_like(positions)
+        self._rows[positions] = np.arange(no_of_points)
+
+
+    def _box_distance_squared(self, node, point):
+
+        below = self._node_min[node] - point
+        above = point - self._node_max[node]
+        gaps = np.maximum(np.maximum(below, above), 0.0)
+
+        return float(gaps.dot(gaps))
+
+
+    def _children(self, node, point):
+        """The child nodes, with the one on the same side of the split as point first"""
+
+        left = 2 * node + 1
+        if point[self._node_dim[node]] < self._node_split[node]:
+            children = (left, left + 1)
+        else:
+            children = (left + 1, left)
+
+        return children
+
+
+    def _leaf_distances_squared(self, node, point):
+
+        start = self._node_start[node]
+        end = self._node_end[node]
+        differences = self._points[start:end] - point
+        distances_squared = np.einsum('ij,ij->i', differences, differences)
+
+        return start, distances_squared
+
+
+    def _query_one(self, point, k):
+
+        # Max-heap (with negated distances) of the k nearest points found so far
+        best = [ ]
+        bound = np.inf
+        stack = [ 0 ]
+        while stack:
+            node = stack.pop()
+            if self._box_distance_squared(node, point) > bound:
+                continue
+            if node >= self._first_leaf:
+                start, distances_squared = self._leaf_distances_squared(node, point)
+                if len(best) == k:
+                    candidates = np.flatnonzero(distances_squared < bound)
+                else:
+                    candidates = range(len(distances_squared))
+                for i in candidates:
+                    item = (-float(distances_squared[i]), -int(start + i))
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    else:
+                        heapq.heappushpop(best, item)
+                if len(best) == k:
+                    bound = -best[0][0]
+            else:
+                near, far = self._children(node, point)
+                stack.append(far)
+                stack.append(near)
+        best.sort(reverse=True)
+        distances = np.sqrt([ -d for d, _ in best ])
+        positions = self._positions[[ -i for _, i in best ]]
+
+        return distances, positions
+
+
+    def _query_radius_one(self, point, radius):
+
+        radius_squared = radius**2
+        found_distances = [ ]
+        found_indices = [ ]
+        stack = [ 0 ]
+        while stack:
+            node = stack.pop()
+            if self._box_distance_squared(node, point) > radius_squared:
+                continue
+            if node >= self._first_leaf:
+                start, distances_squared = self._leaf_distances_squared(node, point)
+                inside = np.flatnonzero(distances_squared <= radius_squared)
+                found_distances.append(distances_squared[inside])
+                found_indices.append(start + inside)
+            else:
+                stack.extend(self._children(node, point)[::-1])
+        distances_squared = np.concatenate(found_distances + [ np.zeros(0) ])
+        indices = np.concatenate(found_indices + [ np.zeros(0, dtype=np.intp) ])
+        order = np.argsort(distances_squared, kind='stable')
+        distances = np.sqrt(distances_squared[order])
+        positions = self._positions[indices[order]]
+
+        return distances, positions
+
+
+    def query(self, vectors, k=1):
+        """
+        Distances to and positions of the k nearest vectors, nearest first
+        The positions are the indices of the vectors in the order the tree was built from
+        For several query vectors the results are 2D arrays with one row per query vector
+        """
+
+        k = min(k, len(self))
+        points, single = as_points(self._vector_class, vectors)
+        if k < 1:
+            results = [ (np.zeros(0), np.zeros(0, dtype=np.intp)) for _ in points ]
+        else:
+            results = [ self._query_one(point, k) for point in points ]
+        distances = np.array([ d for d, _ in results ]).reshape(len(results), k)
+        positions = np.array([ p for _, p in results ], dtype=np.intp).reshape(len(results), k)
+        if single:
+            distances = distances[0]
+            positions = positions[0]
+
+        return distances, positions
+
+
+    def query_radius(self, vectors, radius):
+        """
+        Distances to and positions of the vectors within radius, nearest first
+        For several query vectors the results are lists with a pair of arrays for each query vector
+        """
+
+        points, single = as_points(self._vector_class, vectors)
+        results = [ self._query_radius_one(point, radius) for point in points ]
+        if single:
+            results = results[0]
+
+        return results
+
+
+    def vectors_at(self, positions):
+        """List of the vectors at some positions"""
+
+        if self._vectors is None:
+            vector_class = self._vector_class
+            rows = self._rows[np.asarray(positions, dtype=np.intp)]
+            vectors = \
+                [
+                    vector_class(*point)
+                    for point in self._points[rows].tolist()
+                ]
+        else:
+            vectors = \
+                [
+                    self._vectors[position]
+                    for position in np.asarray(positions, dtype=np.intp).tolist()
+                ]
+
+        return vectors
+
+
+    def nearest(self, vectors, k=1):
+        """
+        List of the k nearest vectors, nearest first
+        For several query vectors the result is a list of such lists
+        """
+
+        _, positions = self.query(vectors, k)
+        if positions.ndim == 1:
+            nearest_vectors = self.vectors_at(positions)
+        else:
+            nearest_vectors = \
+                [
+                    self.vectors_at(row)
+                    for row in positions
+                ]
+
+        return nearest_vectors
+
+
+    def within(self, vectors, radius):
+        """
+        List of the vectors within radius, nearest first
+        For several query vectors the result is a list of such lists
+        """
+
+        results = self.query_radius(vectors, radius)
+        if isinstance(results, tuple):
+            vectors_within = self.vectors_at(results[1])
+        else:
+            vectors_within = \
+                [
+                    self.vectors_at(positions)
+                    for _, positions in results
+                ]
+
+        return vectors_within
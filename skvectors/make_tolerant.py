@@ -4,8 +4,6 @@ https://github.com/t-o-k/scikit-vectors
 Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
 """
 
-from functools import reduce
-
 import skvectors.helper_functions as hf
 
 
@@ -32,10 +30,15 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
         """Initialize class"""
 
         hf.setup_vector_class(cls=cls, name=name, functions=functions)
+        # Tolerantly equal vectors can have different component values, so they can not
+        # have equal hash values. Tolerant_Vector_Set and Tolerant_Vector_Dict can be used instead.
+        cls.__hash__ = None
         cunit = cls._cunit
-        cls.abs_tol = cunit * abs_tol
+        cls.abs_tol = cls._coerce_value(cunit * abs_tol)
         cls.rel_tol = rel_tol
         cls.cround = property(cls.round_components)
+        if cls._memoize:
+            hf.memoize_methods(cls, [ 'tolerance' ])
 
         return cls
 
@@ -81,9 +84,9 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
 
 
         @classmethod
-        def _epsilon_n(cls, lengths):
+        def _epsilon_n(cls, lengths, axis=0):
 
-            max_length = reduce(cls.component_max, lengths, 0)
+            max_length = hf.max_of_values(cls.component_max, lengths, axis)
             eps = cls.component_max(cls.abs_tol, max_length * cls.rel_tol)
 
             return eps
@@ -91,18 +94,65 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
 
         @classmethod
         def tolerance_all(cls, vectors):
-            """Calculate a common tolerance for several vectors based on their lengths"""
+            """
+            Calculate a common tolerance for several vectors based on their lengths
+            A vector with arrays as component values counts as all the vectors in the arrays
+            """
 
-            vectors = cls._ensure_all_are_vectors(vectors)
-            eps = \
-                cls._epsilon_n(
-                    v.length()
-                    for v in vectors
-                )
+            if cls.is_vector(vectors):
+                eps = cls._epsilon_n(vectors.length(), axis=None)
+            else:
+                vectors = cls._ensure_all_are_vectors(vectors)
+                eps = \
+                    cls._epsilon_n(
+                        [
+                            v.length()
+                            for v in vectors
+                        ]
+                    )
 
             return eps
 
 
+        @classmethod
+        def weld(cls, vectors, tolerance=None, round_components=False):
+            """
+            Collapse vectors that are within a tolerance of each other (needs NumPy)
+            Returns the unique vectors and for each vector the index of its unique vector
+            Each vector is collapsed into the first earlier unique vector within the tolerance
+            vectors may be an iterable of vectors or a vector with arrays as component values
+            If tolerance is None, the common tolerance for all the vectors is used
+            If round_components is true, vectors with equal rounded components are collapsed
+            """
+
+            import numpy as np
+            from skvectors.batches import as_points
+            from skvectors.welding import weld_points
+
+            batch = cls.is_vector(vectors)
+            if batch:
+                if round_components:
+                    vectors = vectors.round_components()
+            else:
+                vectors = [ *cls._ensure_all_are_vectors(vectors) ]
+                if round_components:
+                    vectors = [ v.round_components() for v in vectors ]
+            points, _ = as_points(cls, vectors)
+            if round_components:
+                tolerance = 0.0
+            elif tolerance is None:
+                max_length = np.sqrt(np.einsum('ij,ij->i', points, points).max(initial=0.0))
+                tolerance = cls._epsilon_1(float(max_length))
+            positions, inverse = weld_points(points, tolerance)
+            if batch:
+                unique_vectors = cls(*points[positions].T)
+            else:
+                unique_vectors = [ vectors[position] for position in positions.tolist() ]
+                inverse = inverse.tolist()
+
+            return unique_vectors, inverse
+
+
         @hf.ensure_other_is_vector
         def tolerance_with(self, other):
             """Calculate a common tolerance for two vectors based on their lengths"""
@@ -210,7 +260,7 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
 
             ls = self.length()
             lo = other.length()
-            tol = self.tolerance_with(other)
+            tol = self._epsilon_2(ls, lo)
             equal_vector_lengths = self.component_and((lo - tol) <= ls, ls <= (lo + tol))
 
             return equal_vector_lengths
@@ -222,7 +272,7 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
 
             ls = self.length()
             lo = other.length()
-            tol = self.tolerance_with(other)
+            tol = self._epsilon_2(ls, lo)
             is_shorter = ls < (lo - tol)
 
             return is_shorter
@@ -234,7 +284,7 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
 
             ls = self.length()
             lo = other.length()
-            tol = self.tolerance_with(other)
+            tol = self._epsilon_2(ls, lo)
             is_longer = (lo + tol) < ls
 
             return is_longer
@@ -264,10 +314,21 @@ def make_Cartesian_Vector_Tolerant(*, cartesian_vector_class, name, functions, a
         def round_components(self):
             """Vector with the component values rounded to a calculated tolerance"""
 
+            cunit = self._cunit
             eps = self.tolerance()
             p = -self.component_ceil(self.component_log10(eps))
-            round_fn = lambda cv: self._round_cvalue(cv, p)
-            vector = self._vector(map(round_fn, self._cvalues))
+            # Same result as _round_cvalue(), but the factors are only calculated once
+            d = (cunit * 10)**p
+            scale = d / cunit
+            half = cunit / 2
+            copysign = self.component_copysign
+            trunc = self.component_trunc
+            rounded_cvalues = \
+                (
+                    cunit * (trunc(cv * scale + copysign(half, cv)) / d)
+                    for cv in self._cvalues
+                )
+            vector = self._vector(rounded_cvalues)
 
             return vector
 
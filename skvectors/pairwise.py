@@ -0,0 +1,166 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Pairwise results (dot products, distances, angles etc.) between two batches of cartesian vectors. It needs NumPy.
+
+The matrices are computed in square blocks, so that the temporary arrays fit in the cache.
+The blocks can also be streamed, for matrices that would not fit in memory.
+The operations are done in the same order as in the methods for single vector pairs,
+so that the results are the same.
+"""
+
+import numpy as np
+
+from skvectors.batches import as_columns
+
+
+def _sum_of_squares(vector_class, cvalues):
+
+    # Like vector_class.length() before the root is taken
+    cunit = vector_class._cunit
+    total = vector_class._cnull
+    for cv in cvalues:
+        total = total + cv**(cunit * 2)
+
+    return total
+
+
+def _dot_block(vector_class, a, b):
+
+    total = vector_class._cnull
+    for ca, cb in zip(a, b):
+        total = total + ca * cb
+
+    return total
+
+
+def _distance_block(vector_class, a, b):
+
+    cunit = vector_class._cunit
+    distances = _sum_of_squares(vector_class, (cb - ca for ca, cb in zip(a, b)))**(cunit / 2)
+
+    return distances
+
+
+def _angle_block(vector_class, a, b):
+
+    # Kahan's formula, as in Cartesian_Vector.angle()
+    cunit = vector_class._cunit
+    la = _sum_of_squares(vector_class, a)**(cunit / 2)
+    lb = _sum_of_squares(vector_class, b)**(cunit / 2)
+    vas = [ ca * lb for ca in a ]
+    vbs = [ cb * la for cb in b ]
+    ln = _sum_of_squares(vector_class, (va - vb for va, vb in zip(vas, vbs)))**(cunit / 2)
+    ld = _sum_of_squares(vector_class, (va + vb for va, vb in zip(vas, vbs)))**(cunit / 2)
+    angles = np.arctan2(ln, ld) * 2
+
+    return angles
+
+
+def _angle_2d_block(vector_class, a, b):
+
+    # The signed angle from one vector to the other, as in Cartesian_2D_Vector.angle()
+    ca0, ca1 = a
+    cb0, cb1 = b
+    angles = np.arctan2(cb1, cb0) - np.arctan2(ca1, ca0)
+
+    return angles
+
+
+def _method_block(method_name):
+
+
+    def method_block(vector_class, a, b):
+
+        va = vector_class(*a)
+        vb = vector_class(*b)
+        result = getattr(va, method_name)(vb)
+
+        return np.broadcast_to(result, (a[0].shape[0], b[0].shape[1]))
+
+
+    return method_block
+
+
+_BLOCK_FUNCTIONS = \
+    {
+        'dot': _dot_block,
+        'distance': _distance_block,
+        'angle': _angle_block
+    }
+
+# For the classes that have _signed_angles set, e.g. the 2D classes
+_SIGNED_ANGLE_BLOCK_FUNCTIONS = \
+    {
+        **_BLOCK_FUNCTIONS,
+        'angle': _angle_2d_block
+    }
+
+
+def _columns(vector_class, vectors_a, vectors_b):
+    """One contiguous array for each of the components of the vectors in each batch"""
+
+    columns_a, _ = as_columns(vector_class, vectors_a)
+    if vectors_b is None:
+        columns_b = columns_a
+    else:
+        columns_b, _ = as_columns(vector_class, vectors_b)
+
+    return columns_a, columns_b
+
+
+def _iter_blocks(vector_class, method_name, columns_a, columns_b, block):
+
+    if block < 1:
+        msg = "The block size must be at least 1"
+        raise ValueError(msg)
+    if getattr(vector_class, '_signed_angles', False):
+        block_functions = _SIGNED_ANGLE_BLOCK_FUNCTIONS
+    else:
+        block_functions = _BLOCK_FUNCTIONS
+    block_function = block_functions.get(method_name)
+    if block_function is None:
+        block_function = _method_block(method_name)
+    rows = len(columns_a[0])
+    columns = len(columns_b[0])
+    for row_start in range(0, rows, block):
+        row_slice = slice(row_start, min(row_start + block, rows))
+        a = [ ca[row_slice, np.newaxis] for ca in columns_a ]
+        for column_start in range(0, columns, block):
+            column_slice = slice(column_start, min(column_start + block, columns))
+            b = [ cb[np.newaxis, column_slice] for cb in columns_b ]
+            yield row_slice, column_slice, block_function(vector_class, a, b)
+
+
+def iter_pairwise(vector_class, method_name, vectors_a, vectors_b=None, *, block=512):
+    """
+    Generator that yields the pairwise results in blocks as tuples of
+    (slice of rows, slice of columns, array with the results for the block)
+    Methods other than 'dot', 'distance' and 'angle' are called on vectors with broadcast arrays
+    """
+
+    columns_a, columns_b = _columns(vector_class, vectors_a, vectors_b)
+    yield from _iter_blocks(vector_class, method_name, columns_a, columns_b, block)
+
+
+def pairwise(vector_class, method_name, vectors_a, vectors_b=None, *, block=512, out=None):
+    """
+    Matrix with the results of a method for all pairs of vectors from two batches
+    If vectors_b is None, the pairs are taken from vectors_a only
+    """
+
+    columns_a, columns_b = _columns(vector_class, vectors_a, vectors_b)
+    shape = (len(columns_a[0]), len(columns_b[0]))
+    if out is not None and out.shape != shape:
+        msg = "The shape of out {out.shape} does not match the shape of the result {shape}".format_map(vars())
+        raise ValueError(msg)
+    for row_slice, column_slice, result in _iter_blocks(vector_class, method_name, columns_a, columns_b, block):
+        if out is None:
+            out = np.empty(shape, dtype=result.dtype)
+        out[row_slice, column_slice] = result
+    if out is None:
+        out = np.empty(shape)
+
+    return out
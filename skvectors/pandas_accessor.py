@@ -0,0 +1,179 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Importing this module registers the 'skv' accessor for Pandas DataFrames:
+
+    >>> import skvectors.pandas_accessor
+    >>> df.skv(CV3D, [ 'x', 'y', 'z' ]).normalize(names=[ 'nx', 'ny', 'nz' ])
+
+The vector methods are applied to the NumPy arrays of the DataFrame columns,
+so no index alignment is done. The results are written to new columns, named
+after the method unless names are given. Existing columns are only overwritten
+when they are given in names. The vector class should have been created
+with NumPy functions (e.g. 'cos': np.cos) for the methods that need them.
+"""
+
+import pandas as pd
+
+
+class Vector_Columns:
+    """Some columns of a DataFrame bound to a vector class"""
+
+
+    def __init__(self, data_frame, vector_class, columns):
+
+        columns = [ *columns ]
+        dimensions = vector_class.dimensions()
+        if len(columns) != dimensions:
+            msg = \
+                "The number of columns ({no_of_columns}) does not match " \
+                "the number of dimensions for {vector_class.__name__} ({dimensions})" \
+                .format(
+                    no_of_columns = len(columns),
+                    vector_class = vector_class,
+                    dimensions = dimensions
+                )
+            raise ValueError(msg)
+        for column in columns:
+            if column not in data_frame.columns:
+                msg = "The DataFrame has no column named {column!r}".format_map(vars())
+                raise KeyError(msg)
+        self._data_frame = data_frame
+        self._vector_class = vector_class
+        self._columns = columns
+
+
+    @property
+    def columns(self):
+        """List of the names of the bound columns"""
+
+        return self._columns.copy()
+
+
+    def vector(self):
+        """A vector with the NumPy arrays of the bound columns as component values"""
+
+        data_frame = self._data_frame
+        cvalues = \
+            (
+                data_frame[column].to_numpy()
+                for column in self._columns
+            )
+        vector = self._vector_class(*cvalues)
+
+        return vector
+
+
+    def _argument(self, arg):
+
+        if isinstance(arg, Vector_Columns):
+            arg = arg.vector()
+
+        return arg
+
+
+    def _default_names(self, names):
+
+        # Only columns that are named explicitly are overwritten
+        existing = [ name for name in names if name in self._data_frame.columns ]
+        if existing:
+            msg = \
+                "The DataFrame already has columns named {existing}, " \
+                "use names= to choose the columns for the result" \
+                .format_map(vars())
+            raise ValueError(msg)
+
+        return names
+
+
+    def _store(self, default_name, result, names):
+
+        data_frame = self._data_frame
+        vector_class = self._vector_class
+        if vector_class.is_vector(result):
+            if names is None:
+                names = \
+                    self._default_names(
+                        [
+                            default_name + '_' + cname
+                            for cname in vector_class.component_names()
+                        ]
+                    )
+            for name, cvalue in zip(names, result.component_values()):
+                data_frame[name] = cvalue
+            stored = Vector_Columns(data_frame, vector_class, names)
+        else:
+            if names is None:
+                names, = self._default_names([ default_name ])
+            data_frame[names] = result
+            stored = data_frame[names]
+
+        return stored
+
+
+    def apply(self, method_name, *args, names=None, **kwargs):
+        """
+        Apply a vector method to the bound columns and write the result back as new columns
+        Vector results are returned bound to their new columns, other results as a Series
+        Existing columns are only overwritten if they are given in names
+        """
+
+        vector = self.vector()
+        args = [ self._argument(arg) for arg in args ]
+        kwargs = \
+            {
+                kw: self._argument(arg)
+                for kw, arg in kwargs.items()
+            }
+        attr = getattr(vector, method_name)
+        if callable(attr):
+            result = attr(*args, **kwargs)
+        else:
+            result = attr
+        stored = self._store(method_name, result, names)
+
+        return stored
+
+
+    def __getattr__(self, attr_name):
+        """Methods and properties of the vector class, applied with apply()"""
+
+        if attr_name.startswith('_'):
+            msg = "'{cls.__name__}' object has no attribute '{attr_name}'"
+            raise AttributeError(msg.format(cls=type(self), attr_name=attr_name))
+        class_attr = getattr(self._vector_class, attr_name)
+        if isinstance(class_attr, property):
+            stored = self.apply(attr_name)
+        else:
+
+
+            def method(*args, names=None, **kwargs):
+
+                return self.apply(attr_name, *args, names=names, **kwargs)
+
+
+            method.__name__ = attr_name
+            method.__doc__ = getattr(class_attr, '__doc__', None)
+            stored = method
+
+        return stored
+
+
+@pd.api.extensions.register_dataframe_accessor('skv')
+class Vector_Accessor:
+    """DataFrame accessor that binds a vector class to chosen columns"""
+
+
+    def __init__(self, data_frame):
+
+        self._data_frame = data_frame
+
+
+    def __call__(self, vector_class, columns):
+        """Bind a vector class to some columns of the DataFrame"""
+
+        vector_columns = Vector_Columns(self._data_frame, vector_class, columns)
+
+        return vector_columns
@@ -0,0 +1,90 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Conversions between cartesian and polar coordinates for batches of 2D and 3D vectors. It needs NumPy.
+
+The batches are given as lists with one contiguous array for each of the components.
+All the coordinates are calculated in one pass, with the rows of the result array
+as scratch space, so that the radius in the xy-plane is shared and no temporary
+arrays with the size of the whole batch are made.
+"""
+
+import numpy as np
+
+
+def _check_out(out, shape, inputs):
+
+    if out is None:
+        out = np.empty(shape)
+    else:
+        if out.shape != shape:
+            msg = "The shape of out {out.shape} must be {shape}".format_map(vars())
+            raise ValueError(msg)
+        if any(np.shares_memory(out, array) for array in inputs):
+            msg = "The out array must not overlap the input arrays"
+            raise ValueError(msg)
+
+    return out
+
+
+def polar_columns(columns, *, out=None):
+    """
+    Radius, azimuth (and inclination for 3D vectors) of the vectors in a batch as an array with shape (2, n) or (3, n)
+    The same order of operations as in the to_polar() methods is used
+    """
+
+    dimensions = len(columns)
+    x, y = columns[:2]
+    out = _check_out(out, (dimensions, len(x)), columns)
+    radius = out[0]
+    azimuth = out[1]
+    # The squared radius in the xy-plane, with the azimuth row as scratch space
+    np.square(x, out=radius)
+    np.square(y, out=azimuth)
+    np.add(radius, azimuth, out=radius)
+    if dimensions == 3:
+        z = columns[2]
+        inclination = out[2]
+        np.sqrt(radius, out=inclination)
+        np.arctan2(z, inclination, out=inclination)
+        np.square(z, out=azimuth)
+        np.add(radius, azimuth, out=radius)
+    np.sqrt(radius, out=radius)
+    np.arctan2(y, x, out=azimuth)
+
+    return out
+
+
+def cartesian_columns(radius, azimuth, inclination=None, *, out=None):
+    """
+    Components of the vectors with some polar coordinates as an array with shape (2, n), or (3, n) with inclination
+    The coordinates may be scalars or arrays that can be broadcast together
+    The same order of operations as in the from_polar() methods is used
+    """
+
+    coordinates = [ radius, azimuth ] if inclination is None else [ radius, azimuth, inclination ]
+    coordinates = [ np.asarray(coordinate, dtype=float) for coordinate in coordinates ]
+    coordinates = [ coordinate.ravel() for coordinate in np.broadcast_arrays(*coordinates) ]
+    radius, azimuth = coordinates[:2]
+    out = _check_out(out, (len(coordinates), len(radius)), coordinates)
+    cvs0 = out[0]
+    cvs1 = out[1]
+    np.cos(azimuth, out=cvs0)
+    np.sin(azimuth, out=cvs1)
+    if inclination is None:
+        np.multiply(radius, cvs0, out=cvs0)
+        np.multiply(radius, cvs1, out=cvs1)
+    else:
+        inclination = coordinates[2]
+        cvs2 = out[2]
+        # The radius in the xy-plane, with the z row as scratch space
+        np.cos(inclination, out=cvs2)
+        np.multiply(radius, cvs2, out=cvs2)
+        np.multiply(cvs2, cvs0, out=cvs0)
+        np.multiply(cvs2, cvs1, out=cvs1)
+        np.sin(inclination, out=cvs2)
+        np.multiply(radius, cvs2, out=cvs2)
+
+    return out
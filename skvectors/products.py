@@ -0,0 +1,155 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Cross products, scalar triple products and triangle normals for batches of 3D vectors. It needs NumPy.
+
+The batches are given as lists with one contiguous array for each of the components.
+The work is done in chunks with reused scratch arrays, so that no temporary arrays
+with the size of the whole batch are made and the chunks stay in the cache.
+"""
+
+import numpy as np
+
+_CHUNK = 8192
+
+
+def _check_columns(*columns_list):
+
+    lengths = { len(columns[0]) for columns in columns_list }
+    if len(lengths) != 1:
+        msg = "The batches must have the same number of vectors, not {lengths}".format(lengths=sorted(lengths))
+        raise ValueError(msg)
+    n = lengths.pop()
+
+    return n
+
+
+def _check_out(out, shape, inputs):
+
+    if out is None:
+        out = np.empty(shape)
+    else:
+        if out.shape != shape:
+            msg = "The shape of out {out.shape} must be {shape}".format_map(vars())
+            raise ValueError(msg)
+        if any(np.shares_memory(out, cv) for columns in inputs for cv in columns):
+            msg = "The out array must not overlap the component arrays of the vectors"
+            raise ValueError(msg)
+
+    return out
+
+
+def _chunks(n):
+
+    for start in range(0, n, _CHUNK):
+        yield slice(start, min(start + _CHUNK, n))
+
+
+def _cross_chunk(a, b, out, tmp):
+
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+    o0, o1, o2 = out
+    # Same operations as in Cartesian_3D_Vector.cross()
+    np.multiply(a1, b2, out=o0)
+    np.multiply(a2, b1, out=tmp)
+    np.subtract(o0, tmp, out=o0)
+    np.multiply(a2, b0, out=o1)
+    np.multiply(a0, b2, out=tmp)
+    np.subtract(o1, tmp, out=o1)
+    np.multiply(a0, b1, out=o2)
+    np.multiply(a1, b0, out=tmp)
+    np.subtract(o2, tmp, out=o2)
+
+
+def _normalize_chunk(out, tmp):
+
+    # Vectors with zero length are left as they are
+    np.square(out[0], out=tmp)
+    tmp += np.square(out[1])
+    tmp += np.square(out[2])
+    np.sqrt(tmp, out=tmp)
+    np.divide(out, tmp, out=out, where=tmp > 0)
+
+
+def cross_columns(columns_a, columns_b, *, normalize=False, out=None):
+    """
+    Cross products of the vectors in two batches as an array with shape (3, n)
+    If normalize is true, the cross products are scaled to unit length
+    """
+
+    n = _check_columns(columns_a, columns_b)
+    out = _check_out(out, (3, n), [ columns_a, columns_b ])
+    tmp = np.empty(min(n, _CHUNK))
+    for s in _chunks(n):
+        t = tmp[:s.stop - s.start]
+        _cross_chunk(
+            [ cv[s] for cv in columns_a ],
+            [ cv[s] for cv in columns_b ],
+            out[:, s],
+            t
+        )
+        if normalize:
+            _normalize_chunk(out[:, s], t)
+
+    return out
+
+
+def stp_columns(columns_a, columns_b, columns_c, *, out=None):
+    """Scalar triple products of the vectors in three batches as an array with shape (n,)"""
+
+    n = _check_columns(columns_a, columns_b, columns_c)
+    out = _check_out(out, (n,), [ columns_a, columns_b, columns_c ])
+    tmp = np.empty((2, min(n, _CHUNK)))
+    for s in _chunks(n):
+        t0, t1 = tmp[:, :s.stop - s.start]
+        a0, a1, a2 = (cv[s] for cv in columns_a)
+        b0, b1, b2 = (cv[s] for cv in columns_b)
+        c0, c1, c2 = (cv[s] for cv in columns_c)
+        o = out[s]
+        # Same order of operations as in a.dot(b.cross(c))
+        np.multiply(b1, c2, out=t0)
+        np.multiply(b2, c1, out=t1)
+        np.subtract(t0, t1, out=t0)
+        np.multiply(a0, t0, out=o)
+        np.multiply(b2, c0, out=t0)
+        np.multiply(b0, c2, out=t1)
+        np.subtract(t0, t1, out=t0)
+        np.multiply(a1, t0, out=t0)
+        np.add(o, t0, out=o)
+        np.multiply(b0, c1, out=t0)
+        np.multiply(b1, c0, out=t1)
+        np.subtract(t0, t1, out=t0)
+        np.multiply(a2, t0, out=t0)
+        np.add(o, t0, out=o)
+
+    return out
+
+
+def triangle_normal_columns(columns_p0, columns_p1, columns_p2, *, normalize=False, out=None):
+    """
+    Normals (p1 - p0) x (p2 - p0) of the triangles with corners in three batches as an array with shape (3, n)
+    If normalize is true, the normals are scaled to unit length (normals of degenerate triangles stay zero)
+    """
+
+    n = _check_columns(columns_p0, columns_p1, columns_p2)
+    out = _check_out(out, (3, n), [ columns_p0, columns_p1, columns_p2 ])
+    chunk = min(n, _CHUNK)
+    edges_1 = np.empty((3, chunk))
+    edges_2 = np.empty((3, chunk))
+    tmp = np.empty(chunk)
+    for s in _chunks(n):
+        m = s.stop - s.start
+        e1 = edges_1[:, :m]
+        e2 = edges_2[:, :m]
+        t = tmp[:m]
+        for cv0, cv1, cv2, ce1, ce2 in zip(columns_p0, columns_p1, columns_p2, e1, e2):
+            np.subtract(cv1[s], cv0[s], out=ce1)
+            np.subtract(cv2[s], cv0[s], out=ce2)
+        _cross_chunk(e1, e2, out[:, s], t)
+        if normalize:
+            _normalize_chunk(out[:, s], t)
+
+    return out
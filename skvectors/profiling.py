@@ -0,0 +1,194 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Opt-in profiling of the methods of the vector classes.
+
+Inside a profile() context the methods of the vector classes are replaced with instrumented
+versions that count the calls, the cumulative wall time and the vectors created during the calls.
+The original methods are put back when the context is left, so there is no overhead outside it.
+"""
+
+import logging
+import threading
+import time
+from functools import wraps
+from types import FunctionType
+
+import skvectors.helper_functions as hf
+
+logger = logging.getLogger('skvectors.profile')
+
+
+class Profile:
+    """
+    Context manager that profiles the methods of some vector classes
+    (or of all the existing vector classes if none are given)
+    """
+
+    def __init__(self, *vector_classes, log_level=logging.INFO):
+
+        self.vector_classes = vector_classes
+        self.log_level = log_level
+        self._counts = { }
+        self._saved = [ ]
+        self._local = threading.local()
+
+
+    def __repr__(self):
+
+        return "Profile({n} methods)".format(n=len(self._counts))
+
+
+    def _stack(self):
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = [ ]
+
+        return stack
+
+
+    def _instrument(self, key, function, creates_vectors):
+
+        counts = self._counts.setdefault(key, [ 0, 0.0, 0 ])
+        perf_counter = time.perf_counter
+        profile = self
+
+
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+
+            stack = profile._stack()
+            if creates_vectors:
+                # Each vector counts as created by all the methods that are running
+                for running_counts in stack:
+                    running_counts[2] += 1
+                counts[2] += 1
+            stack.append(counts)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                counts[1] += perf_counter() - start
+                counts[0] += 1
+                stack.pop()
+
+
+        return instrumented
+
+
+    def _instrumented_attribute(self, cls, name, attribute):
+
+        key = cls.__name__ + '.' + name
+        creates_vectors = name == '__init__'
+        if isinstance(attribute, staticmethod):
+            instrumented = staticmethod(self._instrument(key, attribute.__func__, False))
+        elif isinstance(attribute, classmethod):
+            instrumented = classmethod(self._instrument(key, attribute.__func__, False))
+        elif isinstance(attribute, property):
+            fget = attribute.fget
+            if fget is not None:
+                fget = self._instrument(key, fget, False)
+            instrumented = property(fget=fget, fset=attribute.fset, fdel=attribute.fdel, doc=attribute.__doc__)
+        elif isinstance(attribute, FunctionType):
+            # Only functions, not e.g. the remembered vectors of frozen classes (which are callable)
+            instrumented = self._instrument(key, attribute, creates_vectors)
+        else:
+            instrumented = None
+
+        return instrumented
+
+
+    def _classes_to_instrument(self):
+
+        vector_classes = self.vector_classes or [ *hf.vector_classes ]
+        classes = [ ]
+        for vector_class in vector_classes:
+            # The methods are spread over the chain of classes that the vector class is made from
+            for cls in vector_class.__mro__:
+                if (cls in hf.vector_classes) and (cls not in classes):
+                    classes.append(cls)
+
+        return classes
+
+
+    def start(self):
+        """Replace the methods with instrumented methods"""
+
+        if self._saved:
+            msg = "The profile has already been started"
+            raise RuntimeError(msg)
+        for cls in self._classes_to_instrument():
+            for name, attribute in [ *vars(cls).items() ]:
+                instrumented = self._instrumented_attribute(cls, name, attribute)
+                if instrumented is not None:
+                    self._saved.append((cls, name, attribute))
+                    setattr(cls, name, instrumented)
+
+        return self
+
+
+    def stop(self):
+        """Put the original methods back"""
+
+        for cls, name, attribute in reversed(self._saved):
+            setattr(cls, name, attribute)
+        self._saved = [ ]
+
+        return self
+
+
+    def __enter__(self):
+
+        return self.start()
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.stop()
+        if self.log_level is not None:
+            logger.log(self.log_level, "Vector method profile:\n%s", self.report())
+
+        return False
+
+
+    def stats(self):
+        """Dictionary with the number of calls, the cumulative time in seconds and the vectors created for each called method"""
+
+        stats = \
+            {
+                key: { 'calls': calls, 'time': total_time, 'vectors_created': created }
+                for key, (calls, total_time, created) in self._counts.items()
+                if calls > 0
+            }
+
+        return stats
+
+
+    def report(self, limit=None):
+        """The statistics as text, with the methods that took the most time first"""
+
+        rows = sorted(self.stats().items(), key=lambda item: item[1]['time'], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        lines = [ '{:<48} {:>10} {:>12} {:>10}'.format('method', 'calls', 'time (ms)', 'vectors') ]
+        for key, stat in rows:
+            lines.append(
+                '{key:<48} {calls:>10} {time:>12.3f} {vectors:>10}'
+                .format(key=key, calls=stat['calls'], time=stat['time'] * 1e3, vectors=stat['vectors_created'])
+            )
+        text = '\n'.join(lines)
+
+        return text
+
+
+def profile(*vector_classes, log_level=logging.INFO):
+    """
+    Context manager that counts the calls, the time and the created vectors for the methods of vector classes
+    Without arguments all the existing vector classes are profiled
+    The report is logged to the 'skvectors.profile' logger when the context is left (unless log_level is None)
+    """
+
+    return Profile(*vector_classes, log_level=log_level)
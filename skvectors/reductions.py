@@ -0,0 +1,158 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Streaming reductions (bounds, centroid, covariance and principal axes) for clouds of cartesian vectors. It needs NumPy.
+
+The vectors are consumed in chunks. The mean and the sums of the squared deviations of
+each chunk are combined with those of the previous chunks with the pairwise update by
+Chan, Golub and LeVeque, which is the chunked form of Welford's algorithm. Statistics
+of different sources (e.g. computed in parallel) can be merged the same way.
+"""
+
+import numpy as np
+
+from skvectors.batches import as_points
+
+_CHUNK = 65536
+
+
+class Vector_Statistics:
+    """
+    Mergeable bounds, mean and covariance of a cloud of cartesian vectors
+    """
+
+    def __init__(self, vector_class, vectors=None):
+
+        self.vector_class = vector_class
+        dimensions = vector_class.dimensions()
+        self.count = 0
+        self._mean = np.zeros(dimensions)
+        self._m2 = np.zeros((dimensions, dimensions))
+        self._min = np.full(dimensions, np.inf)
+        self._max = np.full(dimensions, -np.inf)
+        if vectors is not None:
+            self.update(vectors)
+
+
+    def __repr__(self):
+
+        return "Vector_Statistics({self.vector_class.__name__}, count={self.count})".format_map(vars())
+
+
+    def _combine(self, count, mean, m2, min_values, max_values):
+
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean = self._mean + delta * (count / total)
+        self._m2 = self._m2 + m2 + np.outer(delta, delta) * (self.count * count / total)
+        self._min = np.minimum(self._min, min_values)
+        self._max = np.maximum(self._max, max_values)
+        self.count = total
+
+
+    def _update_points(self, points):
+
+        if len(points) == 0:
+            return
+        mean = points.mean(axis=0)
+        deviations = points - mean
+        m2 = deviations.T @ deviations
+        self._combine(len(points), mean, m2, points.min(axis=0), points.max(axis=0))
+
+
+    def update(self, vectors):
+        """
+        Add vectors to the statistics and return self
+        vectors may be a vector (possibly with arrays as component values)
+        or an iterable of such vectors, e.g. a generator that yields chunks
+        """
+
+        vector_class = self.vector_class
+        if vector_class.is_vector(vectors):
+            points, _ = as_points(vector_class, vectors)
+            self._update_points(points)
+        else:
+            is_vector = vector_class.is_vector
+            dimensions = vector_class.dimensions()
+            pending = [ ]
+            for v in vectors:
+                if not is_vector(v):
+                    v = vector_class.fill(v)
+                cvalues = v._cvalues
+                if any(isinstance(cv, np.ndarray) for cv in cvalues):
+                    self.update(v)
+                else:
+                    pending.append(cvalues)
+                    if len(pending) == _CHUNK:
+                        self._update_points(np.array(pending, dtype=float))
+                        pending = [ ]
+            self._update_points(np.array(pending, dtype=float).reshape(-1, dimensions))
+
+        return self
+
+
+    def merge(self, other):
+        """Add the statistics of another Vector_Statistics instance to this one and return self"""
+
+        if other.vector_class is not self.vector_class:
+            msg = "Can not merge statistics for the vector classes {self.vector_class.__name__} and {other.vector_class.__name__}".format_map(vars())
+            raise TypeError(msg)
+        self._combine(other.count, other._mean, other._m2, other._min, other._max)
+
+        return self
+
+
+    def _ensure_not_empty(self):
+
+        if self.count == 0:
+            msg = "There are no vectors in the statistics"
+            raise ValueError(msg)
+
+
+    def bounds(self):
+        """The vectors with the smallest and the largest component values (axis-aligned bounding box)"""
+
+        self._ensure_not_empty()
+        vector_class = self.vector_class
+        bounds = (vector_class(*self._min.tolist()), vector_class(*self._max.tolist()))
+
+        return bounds
+
+
+    def centroid(self):
+        """The mean of the vectors"""
+
+        self._ensure_not_empty()
+        vector = self.vector_class(*self._mean.tolist())
+
+        return vector
+
+
+    def covariance(self, ddof=1):
+        """The covariance matrix of the component values (with ddof delta degrees of freedom, as in numpy.cov)"""
+
+        self._ensure_not_empty()
+        if self.count <= ddof:
+            msg = "At least {minimum} vectors are needed for the covariance".format(minimum=ddof + 1)
+            raise ValueError(msg)
+        matrix = self._m2 / (self.count - ddof)
+
+        return matrix
+
+
+    def principal_axes(self, ddof=1):
+        """
+        The variances along the principal axes (largest first) and the principal axes as vectors of length 1
+        """
+
+        eigenvalues, eigenvectors = np.linalg.eigh(self.covariance(ddof))
+        order = np.argsort(eigenvalues)[::-1]
+        vector_class = self.vector_class
+        variances = eigenvalues[order]
+        axes = [ vector_class(*eigenvectors[:, i].tolist()) for i in order.tolist() ]
+
+        return variances, axes
@@ -30,7 +30,7 @@ def verify_names(*, chk_names, ref_names):
     return names_ok
 
 
-def create_class_Simple_Vector(name, component_names, *, brackets='<>', sep=', '):
+def create_class_Simple_Vector(name, component_names, *, brackets='<>', sep=', ', frozen=False):
     """
     Function that creates a simple vector class
     The number of dimensions are determined by the number of component names
@@ -42,7 +42,8 @@ def create_class_Simple_Vector(name, component_names, *, brackets='<>', sep=', '
             name = 'FV_' + name,
             component_names = component_names,
             brackets = brackets,
-            sep = sep
+            sep = sep,
+            frozen = frozen
         )
 
 
@@ -241,11 +242,14 @@ def create_class_Simple_Vector(name, component_names, *, brackets='<>', sep=', '
 
             def apply_op_arg2_i(value):
 
+                self._verify_not_frozen()
                 self._cvalues = \
                     [
                         op(cvs, value) if present else cvs
                         for cvs, present in cvalues_present
                     ]
+                self._coerce_cvalues()
+                self._clear_memo()
 
 
             return apply_op_arg2_i
@@ -5,6 +5,7 @@ Use of this source code is governed by a BSD-license that can be found in the LI
 """
 
 import math
+import random
 import unittest
 import skvectors
 
@@ -211,6 +212,47 @@ class Test_Case_cartesian_2d_vector(unittest.TestCase):
         self.assertAlmostEqual(s, -math.pi / 4, msg=fail_msg)
 
 
+    def test_angle_sin_cos(self):
+
+        fail_msg = "Problem with method 'angle_sin_cos'"
+        u = self.V2D(1.5, 0)
+        w = self.V2D(0, 2.5)
+        a, s, c = self.V2D.angle_sin_cos(u, w)
+        self.assertAlmostEqual(a, math.pi / 2, msg=fail_msg)
+        self.assertAlmostEqual(s, 1.0, msg=fail_msg)
+        self.assertAlmostEqual(c, 0.0, msg=fail_msg)
+        # The angle is the same as from angle(), from -2*pi to +2*pi
+        u = self.V2D(-1.5, 0)
+        w = self.V2D(0, -2.5)
+        a, s, c = u.angle_sin_cos(w)
+        self.assertEqual(a, u.angle(w), msg=fail_msg)
+        self.assertAlmostEqual(a, -3 * math.pi / 2, msg=fail_msg)
+        self.assertAlmostEqual(s, 1.0, msg=fail_msg)
+        self.assertAlmostEqual(c, 0.0, msg=fail_msg)
+        rng = random.Random(7)
+        for _ in range(100):
+            u = self.V2D(rng.uniform(-10, 10), rng.uniform(-10, 10))
+            w = self.V2D(rng.uniform(-10, 10), rng.uniform(-10, 10))
+            a, s, c = u.angle_sin_cos(w)
+            self.assertEqual(a, u.angle(w), msg=fail_msg)
+            self.assertAlmostEqual(s, math.sin(a), places=12, msg=fail_msg)
+            self.assertAlmostEqual(c, math.cos(a), places=12, msg=fail_msg)
+        u = self.V2D(0, -2.5)
+        w = self.V2D(-3.5, -3.5)
+        a, s, c = u.angle_sin_cos(w, clip=True)
+        self.assertAlmostEqual(a, -math.pi / 4, msg=fail_msg)
+        self.assertAlmostEqual(s, -math.sqrt(2.0) / 2.0, msg=fail_msg)
+        self.assertAlmostEqual(c, math.sqrt(2.0) / 2.0, msg=fail_msg)
+        u = self.V2D(3, -1)
+        w = self.V2D(-2, 5)
+        a, s, c = u.angle_sin_cos(w)
+        self.assertAlmostEqual(s, u.sin(w), places=15, msg=fail_msg)
+        self.assertAlmostEqual(c, u.cos(w), places=15, msg=fail_msg)
+        u = self.V2D(0, 0)
+        with self.assertRaises(ZeroDivisionError, msg=fail_msg):
+            u.angle_sin_cos(w)
+
+
     def test_rotate(self):
 
         fail_msg = "Problem with method 'rotate'"
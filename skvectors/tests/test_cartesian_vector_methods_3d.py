@@ -8,6 +8,11 @@ import math
 import unittest
 import skvectors
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Test_Case_cartesian_vector(unittest.TestCase):
 
@@ -644,6 +649,75 @@ class Test_Case_cartesian_vector(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError, msg=fail_msg):
             s = u.cos(0)
 
+
+    def test_angle_sin_cos(self):
+
+        fail_msg = "Problem with method 'angle_sin_cos'"
+        u = self.V3D(2.0, 0.0, 0.0)
+        w = self.V3D(3.0, 0.0, -3.0)
+        a, s, c = u.angle_sin_cos(w)
+        self.assertAlmostEqual(a, math.pi / 4, msg=fail_msg)
+        self.assertAlmostEqual(s, math.sqrt(2.0) / 2.0, msg=fail_msg)
+        self.assertAlmostEqual(c, math.sqrt(2.0) / 2.0, msg=fail_msg)
+        u = self.V3D(0.0, 2.0, 0.0)
+        w = self.V3D(0.0, -1.0, -math.sqrt(3.0))
+        a, s, c = self.V3D.angle_sin_cos(u, w)
+        self.assertAlmostEqual(a, math.pi * 2 / 3, msg=fail_msg)
+        self.assertAlmostEqual(s, math.sqrt(3.0) / 2.0, msg=fail_msg)
+        self.assertAlmostEqual(c, -0.5, msg=fail_msg)
+        u = self.V3D(0, -3, 0)
+        w = self.V3D(0, 2, 0)
+        a, s, c = u.angle_sin_cos(w, clip=True)
+        self.assertAlmostEqual(a, math.pi, msg=fail_msg)
+        self.assertEqual(s, 0.0, msg=fail_msg)
+        self.assertEqual(c, -1.0, msg=fail_msg)
+        for u, w in [ (self.V3D(1, 2, 3), self.V3D(-3, 0.5, 2)), (self.V3D(1, 2, 3), self.V3D(1, 2, 3.000001)) ]:
+            a, s, c = u.angle_sin_cos(w)
+            self.assertEqual(a, u.angle(w), msg=fail_msg)
+            self.assertAlmostEqual(c, u.cos(w), places=15, msg=fail_msg)
+            self.assertAlmostEqual(s, math.sin(a), places=15, msg=fail_msg)
+            self.assertAlmostEqual(c, math.cos(a), places=15, msg=fail_msg)
+        # The sine of a tiny angle is as accurate as the angle
+        u = self.V3D(1, 2, 3)
+        w = self.V3D(1, 2, 3 + 1e-8)
+        a, s, c = u.angle_sin_cos(w)
+        self.assertAlmostEqual(s / a, 1.0, places=15, msg=fail_msg)
+        u = self.V3D(0, 0, 0)
+        w = self.V3D(-3, 4, -5)
+        with self.assertRaises(ZeroDivisionError, msg=fail_msg):
+            u.angle_sin_cos(w)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_angle_sin_cos_arrays(self):
+
+        fail_msg = "Problem with method 'angle_sin_cos'"
+        n = 100
+        NP3D = \
+            self.create_vector_class(
+                name = 'NP3D',
+                component_names = 'xyz',
+                cnull = np.zeros(n),
+                cunit = np.ones(n),
+                functions = { 'eq': np.equal, 'all': np.all, 'min': np.minimum, 'max': np.maximum, 'atan2': np.arctan2 }
+            )
+        rng = np.random.default_rng(5)
+        a = rng.standard_normal((3, n))
+        b = rng.standard_normal((3, n))
+        u = NP3D(*a)
+        w = NP3D(*b)
+        angles, sines, cosines = u.angle_sin_cos(w)
+        np.testing.assert_array_equal(angles, u.angle(w), err_msg=fail_msg)
+        np.testing.assert_allclose(sines, np.sin(angles), rtol=1e-14, err_msg=fail_msg)
+        np.testing.assert_allclose(cosines, np.cos(angles), rtol=1e-13, atol=1e-15, err_msg=fail_msg)
+        for i in range(0, n, 17):
+            ui = self.V3D(*a[:, i])
+            wi = self.V3D(*b[:, i])
+            ai, si, ci = ui.angle_sin_cos(wi)
+            self.assertAlmostEqual(angles[i], ai, places=15, msg=fail_msg)
+            self.assertAlmostEqual(sines[i], si, places=15, msg=fail_msg)
+            self.assertAlmostEqual(cosines[i], ci, places=15, msg=fail_msg)
+
 ### TODO ?:
 #     def test_imatmul(self):
 #
@@ -4,8 +4,15 @@ https://github.com/t-o-k/scikit-vectors
 Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
 """
 
+import operator
 import unittest
 import skvectors
+import skvectors.vectors as vectors_module
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class Test_Case_create_fundamental_vector_class(unittest.TestCase):
@@ -205,6 +212,117 @@ class Test_Case_create_vector_class(Test_Case_create_simple_vector_class):
 
     create_vector_class = staticmethod(skvectors.create_class_Vector)
 
+
+    def create_counting_class(self, cnull, cunit, eq, verify):
+
+        calls = [ ]
+
+
+        def counting_eq(a, b):
+
+            calls.append((a, b))
+
+            return eq(a, b)
+
+
+        functions = { 'eq': counting_eq }
+        self.create_vector_class(
+            name = 'V',
+            component_names = self.component_names,
+            cnull = cnull,
+            cunit = cunit,
+            functions = functions,
+            verify = verify
+        )
+
+        return functions, calls
+
+
+    def test_verify(self):
+
+        fail_msg = self.fail_msg
+
+        component_names = self.component_names
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.create_vector_class(name='V', component_names=component_names, verify='some')
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.create_vector_class(name='V', component_names=component_names, cnull=1, cunit=0, verify='full')
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.create_vector_class(name='V', component_names=component_names, cnull=1, cunit=0, verify='cached')
+        V = self.create_vector_class(name='V', component_names=component_names, cnull=1, cunit=0, verify='off')
+        self.assertEqual(V.component_names(), component_names, msg=fail_msg)
+
+
+    def test_verify_cached(self):
+
+        fail_msg = self.fail_msg
+
+        component_names = self.component_names
+        functions, calls = self.create_counting_class(0, 1, operator.eq, 'off')
+        # The calls that are not made by the verification
+        no_of_calls = len(calls)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=0, cunit=1, functions=functions)
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=0, cunit=1, functions=functions)
+        self.assertEqual(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=0.0, cunit=1.0, functions=functions)
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=0, cunit=1, functions=functions, verify='full')
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        # Values with the same hash value (hash(2**61) == hash(1)) are verified again
+        self.assertEqual(hash(2**61), hash(1), msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.create_vector_class(name='V', component_names=component_names, cnull=0, cunit=2**61, functions=functions)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_verify_cached_numpy(self):
+
+        fail_msg = self.fail_msg
+
+        component_names = self.component_names
+        functions, calls = self.create_counting_class(np.zeros(4), np.ones(4), np.equal, 'off')
+        no_of_calls = len(calls)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(4), cunit=np.ones(4), functions=functions)
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(4), cunit=np.ones(4), functions=functions)
+        self.assertEqual(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        # Arrays with other shapes or dtypes are verified again
+        self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(5), cunit=np.ones(5), functions=functions)
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        calls.clear()
+        self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(4, dtype=np.float32), cunit=np.ones(4, dtype=np.float32), functions=functions)
+        self.assertGreater(len(calls), no_of_calls, msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(4), cunit=np.full(4, 2.0), functions=functions)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_verify_cached_size(self):
+
+        fail_msg = self.fail_msg
+
+        component_names = self.component_names
+        # The signatures of large arrays are small
+        signature = vectors_module._units_signature(np.ones(100000))
+        self.assertLess(sum(len(part) for part in signature if isinstance(part, bytes)), 100, msg=fail_msg)
+        max_verified_units = vectors_module._max_verified_units
+        try:
+            vectors_module._max_verified_units = 2
+            for n in range(2, 6):
+                self.create_vector_class(name='V', component_names=component_names, cnull=np.zeros(n), cunit=np.ones(n))
+                self.assertLessEqual(len(vectors_module._verified_units), 2, msg=fail_msg)
+        finally:
+            vectors_module._max_verified_units = max_verified_units
+
+
     # TODO:
     # Test dunder methods
     # Test cnull and cunit
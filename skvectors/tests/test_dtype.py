@@ -0,0 +1,170 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_dtype_tolerant_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.fail_msg = "Problem with dtype for '{}'".format(cls.create_vector_class.__name__)
+        cls.AV = \
+            cls.create_vector_class(
+                name = 'AV',
+                component_names = 'xyz',
+                cnull = np.zeros(6),
+                cunit = np.ones(6),
+                dtype = 'float32'
+            )
+        cls.SV = \
+            cls.create_vector_class(
+                name = 'SV',
+                component_names = 'xyz',
+                dtype = np.float32
+            )
+        rng = np.random.default_rng(3)
+        cls.arrays = rng.standard_normal((2, 3, 6))
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.fail_msg
+        del cls.AV
+        del cls.SV
+        del cls.arrays
+
+
+    def assert_float32(self, value):
+
+        self.assertEqual(np.result_type(value), np.float32, msg=self.fail_msg)
+
+
+    def assert_float32_vector(self, vector):
+
+        for cv in vector.cvalues:
+            self.assert_float32(cv)
+
+
+    def test_units(self):
+
+        AV = self.AV
+        SV = self.SV
+        self.assertEqual(AV.component_dtype(), np.float32, msg=self.fail_msg)
+        self.assert_float32(AV._cnull)
+        self.assert_float32(AV._cunit)
+        self.assertIsInstance(SV._cunit, np.float32, msg=self.fail_msg)
+        for V in (AV, SV):
+            self.assert_float32_vector(V.zero())
+            self.assert_float32_vector(V.one())
+            self.assert_float32_vector(V.basis_y())
+            self.assert_float32_vector(V.fill(2.5))
+            self.assert_float32(V.abs_tol)
+
+
+    def test_no_dtype(self):
+
+        V = skvectors.create_class_Cartesian_3D_Vector('V', 'xyz')
+        self.assertIsNone(V.component_dtype(), msg=self.fail_msg)
+        self.assertIsInstance(V(1, 2, 3).x, int, msg=self.fail_msg)
+
+
+    def test_init(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        self.assert_float32_vector(v)
+        np.testing.assert_array_equal(v.x, a[0].astype(np.float32), err_msg=self.fail_msg)
+        self.assert_float32_vector(self.AV(*a.tolist()))
+        self.assert_float32_vector(self.AV(x=a[0], y=1.5, z=np.float64(2)))
+        w = self.SV(1, 2.5, np.float64(3))
+        self.assert_float32_vector(w)
+        self.assertIsInstance(w.x, np.float32, msg=self.fail_msg)
+
+
+    def test_length_and_normalize(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        self.assert_float32(v.length())
+        self.assert_float32_vector(v.normalize())
+        np.testing.assert_allclose(v.length(), np.sqrt((a**2).sum(axis=0)), rtol=1e-6, err_msg=self.fail_msg)
+        w = self.SV(2, -3, 6)
+        self.assertIsInstance(w.length(), np.float32, msg=self.fail_msg)
+        self.assertIsInstance(w.normalize().x, np.float32, msg=self.fail_msg)
+
+
+    def test_rotate(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        u = self.AV(*b)
+        self.assert_float32_vector(v.rotate_x(0.3))
+        self.assert_float32_vector(v.rotate_y(np.float64(0.3)))
+        self.assert_float32_vector(v.rotate_z(np.full(6, 0.3)))
+        self.assert_float32_vector(v.axis_rotate(u, 0.3))
+        self.assert_float32(v.angle(u))
+        w = self.SV(1, 2, 3)
+        for rotated in (w.rotate_x(0.3), w.rotate_y(0.3), w.rotate_z(0.3)):
+            self.assert_float32_vector(rotated)
+        self.assertIsInstance(w.angle(self.SV(3, 2, 1)), np.float32, msg=self.fail_msg)
+
+
+    def test_arithmetic(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        u = self.AV(*b)
+        self.assert_float32_vector(v + u)
+        self.assert_float32_vector(v * np.float64(2))
+        self.assert_float32_vector(v * b[0])
+        self.assert_float32_vector(v.cross(u))
+        self.assert_float32(v.dot(u))
+
+
+    def test_in_place_changes(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        v += np.float64(1)
+        self.assert_float32_vector(v)
+        v *= self.AV(*b)
+        self.assert_float32_vector(v)
+        v.x = b[0]
+        v[1:] = [ b[1], 2.0 ]
+        self.assert_float32_vector(v)
+
+
+    def test_tolerant_comparisons(self):
+
+        a, b = self.arrays
+        v = self.AV(*a)
+        u = self.AV(*b)
+        self.assert_float32(v.tolerance())
+        self.assert_float32(v.tolerance_with(u))
+        self.assert_float32(self.AV.tolerance_all([ v, u ]))
+        np.testing.assert_array_equal(v == v, np.ones(6, dtype=bool), err_msg=self.fail_msg)
+        np.testing.assert_array_equal(v == u, np.zeros(6, dtype=bool), err_msg=self.fail_msg)
+        self.assertTrue(np.all(v.are_parallel(v * 2)), msg=self.fail_msg)
+        w = self.SV(1, 2, 3)
+        self.assertTrue(w == self.SV(1, 2, 3.0000001), msg=self.fail_msg)
+        self.assertFalse(w == self.SV(1, 2, 3.1), msg=self.fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
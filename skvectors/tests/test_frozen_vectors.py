@@ -0,0 +1,225 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import functools
+import unittest
+import skvectors
+from skvectors.tolerant_containers import Tolerant_Vector_Set
+
+
+class Test_Case_frozen_fundamental_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Fundamental_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                frozen = True
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_hash(self):
+
+        fail_msg = "Problem with method '__hash__'"
+        u = self.V3D(0, -1, 2)
+        w = self.V3D(0.0, -1.0, 2.0)
+        self.assertEqual(hash(u), hash(w), msg=fail_msg)
+        self.assertEqual(hash(u), hash(u.copy()), msg=fail_msg)
+        d = { u: 'u' }
+        self.assertEqual(d[w], 'u', msg=fail_msg)
+        s = { u, w, self.V3D(3, 4, 5) }
+        self.assertEqual(len(s), 2, msg=fail_msg)
+
+
+        @functools.lru_cache(maxsize=None)
+        def first(v):
+
+            return v[0]
+
+
+        self.assertEqual(first(u), 0, msg=fail_msg)
+        self.assertEqual(first(w), 0, msg=fail_msg)
+        self.assertEqual(first.cache_info().hits, 1, msg=fail_msg)
+        not_frozen = \
+            self.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz'
+            )
+        with self.assertRaises(TypeError, msg=fail_msg):
+            hash(not_frozen(0, -1, 2))
+
+
+    def test_immutable(self):
+
+        fail_msg = "Problem with immutable vectors"
+        v = self.V3D(0, -1, 2)
+        self.assertIsInstance(v._cvalues, tuple, msg=fail_msg)
+        with self.assertRaises(AttributeError, msg=fail_msg):
+            v.x = 3
+        with self.assertRaises(TypeError, msg=fail_msg):
+            v[0] = 3
+        with self.assertRaises(TypeError, msg=fail_msg):
+            v[1:] = [ 3, 4 ]
+        self.assertListEqual(v.component_values(), [ 0, -1, 2 ], msg=fail_msg)
+        u = v.copy()
+        self.assertIsInstance(u._cvalues, tuple, msg=fail_msg)
+        self.assertEqual(u, v, msg=fail_msg)
+
+
+class Test_Case_frozen_simple_vector(Test_Case_frozen_fundamental_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Simple_Vector)
+
+
+    def test_in_place_operators(self):
+
+        fail_msg = "Problem with in-place operators for immutable vectors"
+        v = self.V3D(0, -1, 2)
+        u = v
+        with self.assertRaises(TypeError, msg=fail_msg):
+            u += 1
+        with self.assertRaises(TypeError, msg=fail_msg):
+            u *= self.V3D(1, 2, 3)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            u.c_iadd_x(3)
+        self.assertListEqual(v.component_values(), [ 0, -1, 2 ], msg=fail_msg)
+        w = v + 1
+        self.assertIsInstance(w._cvalues, tuple, msg=fail_msg)
+        self.assertListEqual(w.component_values(), [ 1, 0, 3 ], msg=fail_msg)
+        w = v.c_add_x(3)
+        self.assertListEqual(w.component_values(), [ 3, -1, 2 ], msg=fail_msg)
+
+
+class Test_Case_frozen_vector(Test_Case_frozen_simple_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Vector)
+
+
+    def test_zero_one(self):
+
+        fail_msg = "Problem with class methods 'zero', 'one' and 'basis_x'"
+        self.assertEqual(hash(self.V3D.zero()), hash(self.V3D(0, 0, 0)), msg=fail_msg)
+        self.assertEqual(hash(self.V3D.one()), hash(self.V3D(1, 1, 1)), msg=fail_msg)
+        self.assertEqual(hash(self.V3D.basis_x()), hash(self.V3D(1, 0, 0)), msg=fail_msg)
+        # The vectors are only made once
+        self.assertIs(self.V3D.zero(), self.V3D.zero(), msg=fail_msg)
+        self.assertIs(self.V3D.one(), self.V3D.one(), msg=fail_msg)
+        self.assertIs(self.V3D.basis_x(), self.V3D(1, 2, 3).basis_x(), msg=fail_msg)
+        self.assertIsNot(self.V3D.basis_x(), self.V3D.basis_y(), msg=fail_msg)
+        self.assertIs(type(self.V3D.zero()), self.V3D, msg=fail_msg)
+        with skvectors.profile(self.V3D, log_level=None):
+            self.assertIs(self.V3D.zero(), self.V3D.zero(), msg=fail_msg)
+            self.assertIs(type(self.V3D.basis_x()), self.V3D, msg=fail_msg)
+
+
+class Test_Case_frozen_versatile_vector(Test_Case_frozen_simple_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Versatile_Vector)
+
+
+    def test_hash(self):
+
+        fail_msg = "Problem with method '__hash__'"
+        u = self.V3D(0, -1, 2)
+        w = self.V3D(0.0, -1.0, 2.0)
+        self.assertEqual(hash(u), hash(w), msg=fail_msg)
+
+
+class Test_Case_frozen_cartesian_vector(Test_Case_frozen_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_Vector)
+
+
+    def test_memoize(self):
+
+        fail_msg = "Problem with memoized methods for immutable vectors"
+        v = self.V3D(3.0, 0.0, -4.0)
+        self.assertEqual(v.length(), 5.0, msg=fail_msg)
+        self.assertEqual(abs(v), 5.0, msg=fail_msg)
+        self.assertIs(v.normalize(), v.normalize(), msg=fail_msg)
+        self.assertListEqual(v.normalize().component_values(), [ 0.6, 0.0, -0.8 ], msg=fail_msg)
+        self.assertEqual(v.normalize().length(), 1.0, msg=fail_msg)
+        self.assertEqual(self.V3D.length.__name__, 'length', msg=fail_msg)
+        u = self.V3D(0, 0, 0)
+        with self.assertRaises(ZeroDivisionError, msg=fail_msg):
+            u.normalize()
+
+
+class Test_Case_frozen_cartesian_3d_vector(Test_Case_frozen_cartesian_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+class Test_Case_frozen_tolerant_cartesian_3d_vector(Test_Case_frozen_cartesian_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    def test_hash(self):
+
+        fail_msg = "Problem with method '__hash__'"
+        # Tolerantly equal vectors can not have equal hash values
+        u = self.V3D(1, 2, 3)
+        w = self.V3D(1, 2, 3 + 1e-14)
+        self.assertEqual(u, w, msg=fail_msg)
+        self.assertIsNone(self.V3D.__hash__, msg=fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            hash(u)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            { u, w }
+        vectors = Tolerant_Vector_Set(self.V3D, [ u, w ])
+        self.assertEqual(len(vectors), 1, msg=fail_msg)
+
+
+    def test_zero_one(self):
+
+        fail_msg = "Problem with class methods 'zero', 'one' and 'basis_x'"
+        self.assertEqual(self.V3D.zero(), self.V3D(0, 0, 0), msg=fail_msg)
+        self.assertEqual(self.V3D.basis_x(), self.V3D(1, 0, 0), msg=fail_msg)
+        self.assertIs(self.V3D.zero(), self.V3D.zero(), msg=fail_msg)
+        self.assertIs(self.V3D.basis_x(), self.V3D(1, 2, 3).basis_x(), msg=fail_msg)
+
+
+    def test_memoize_tolerance(self):
+
+        fail_msg = "Problem with memoized method 'tolerance' for immutable vectors"
+        v = self.V3D(300.0, 0.0, -400.0)
+        self.assertEqual(v.tolerance(), 500 * 1e-9, msg=fail_msg)
+        self.assertIn('tolerance', v._memo, msg=fail_msg)
+        self.assertIn('length', v._memo, msg=fail_msg)
+        self.assertEqual(v.tol, 500 * 1e-9, msg=fail_msg)
+
+
+class Test_Case_frozen_tolerant_versatile_vector(Test_Case_frozen_simple_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Versatile_Vector)
+
+
+    def test_hash(self):
+
+        fail_msg = "Problem with method '__hash__'"
+        u = self.V3D(1, 2, 3)
+        w = self.V3D(1, 2, 3 + 1e-14)
+        self.assertEqual(u, w, msg=fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            hash(u)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,17 @@ https://github.com/t-o-k/scikit-vectors
 Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
 """
 
+import math
+import operator
 import unittest
+from functools import partial
 import skvectors
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Test_Case_fundamental_vector(unittest.TestCase):
 
@@ -272,6 +280,53 @@ class Test_Case_fundamental_vector(unittest.TestCase):
         self.assertEqual(st, '<-4.44e+00, 5.55e+00, -6.67e+00>', msg=fail_msg)
 
 
+    def test_format_many(self):
+
+        fail_msg = "Problem with class method 'format_many'"
+        vectors = [ self.V3D(0, -1, 2), self.V3D(-3.5, 4.5, -5.5) ]
+        l = self.V3D.format_many(vectors)
+        self.assertListEqual(l, [ '<0, -1, 2>', '<-3.5, 4.5, -5.5>' ], msg=fail_msg)
+        l = self.V3D.format_many(vectors, '.2e')
+        self.assertListEqual(l, [ format(v, '.2e') for v in vectors ], msg=fail_msg)
+        l = self.V3D.format_many(iter(vectors), '>6.1f')
+        self.assertListEqual(l, [ '<   0.0,   -1.0,    2.0>', '<  -3.5,    4.5,   -5.5>' ], msg=fail_msg)
+        l = self.V3D.format_many([ ], '.3f')
+        self.assertListEqual(l, [ ], msg=fail_msg)
+        v = self.V3D([ 0.0, 1.5 ], (-1.0, 2.5), 2.0)
+        l = self.V3D.format_many(v, '.1f')
+        self.assertListEqual(l, [ '<0.0, -1.0, 2.0>', '<1.5, 2.5, 2.0>' ], msg=fail_msg)
+        v = self.V3D(0, -1, 2)
+        l = self.V3D.format_many(v, '.1f')
+        self.assertListEqual(l, [ '<0.0, -1.0, 2.0>' ], msg=fail_msg)
+        V3D = \
+            skvectors.create_class_Fundamental_Vector(
+                'V3D',
+                'xyz',
+                brackets = [ '{{ ', ' }}' ],
+                sep = '}; {'
+            )
+        l = V3D.format_many([ V3D(0, -1, 2) ], '{^3')
+        self.assertListEqual(l, [ '{{ {0{}; {-1{}; {{2{ }}' ], msg=fail_msg)
+        l = V3D.format_many([ V3D(0, -1, 2) ])
+        self.assertListEqual(l, [ '{{ 0}; {-1}; {2 }}' ], msg=fail_msg)
+
+
+    def test_format_changed_brackets_and_sep(self):
+
+        fail_msg = "Problem with formatting after changing brackets or sep"
+        V3D = skvectors.create_class_Fundamental_Vector('V3D', 'xyz', brackets='<>', sep=', ')
+        v = V3D(0, -1, 2)
+        self.assertEqual(format(v, '.1f'), '<0.0, -1.0, 2.0>', msg=fail_msg)
+        V3D.brackets = '[]'
+        V3D.sep = '; '
+        self.assertEqual(format(v, '.1f'), '[0.0; -1.0; 2.0]', msg=fail_msg)
+        self.assertListEqual(V3D.format_many([ v ], '.1f'), [ '[0.0; -1.0; 2.0]' ], msg=fail_msg)
+        # The brackets and sep of an instance are used for the instance
+        v.sep = ' '
+        self.assertEqual(format(v, '.1f'), '[0.0 -1.0 2.0]', msg=fail_msg)
+        self.assertEqual(format(V3D(1, 2, 3), '.1f'), '[1.0; 2.0; 3.0]', msg=fail_msg)
+
+
     def test_iter(self):
 
         fail_msg = "Problem with method '__iter__'"
@@ -684,6 +739,49 @@ class Test_Case_fundamental_vector(unittest.TestCase):
         self.assertIsNotNone(doc, msg=fail_msg)
 
 
+    def test_register_vector_function(self):
+
+        fail_msg = "Problem with method 'register_vector_function'"
+        # A class of its own, so that the registered functions do not change the class for the other tests
+        V3D = self.create_vector_class(name='V3D', component_names='xyz')
+        V3D.register_vector_function('fabs', math.fabs)
+        V3D.register_vector_function('sub', operator.sub)
+        V3D.register_vector_function('max', max, 2)
+        V3D.register_vector_function('square', partial(pow, exp=2))
+        u = V3D(0, -1, 2)
+        self.assertEqual(u.vector_fabs().component_values(), [ 0.0, 1.0, 2.0 ], msg=fail_msg)
+        self.assertEqual(u.vector_sub(1).component_values(), [ -1, -2, 1 ], msg=fail_msg)
+        self.assertEqual(u.vector_max(V3D(1, -2, 1)).component_values(), [ 1, -1, 2 ], msg=fail_msg)
+        self.assertEqual(u.vector_square().component_values(), [ 0, 1, 4 ], msg=fail_msg)
+        self.assertIsNotNone(V3D.vector_sub.__doc__, msg=fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            V3D.register_vector_function('nothing', lambda: 0)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            V3D.register_vector_function('not_callable', 3)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_register_vector_function_ufunc(self):
+
+        fail_msg = "Problem with method 'register_vector_function' for a ufunc"
+        V3D = self.create_vector_class(name='V3D', component_names='xyz')
+        V3D.register_vector_function('hypot', np.hypot)
+        V3D.register_vector_function('negative', np.negative)
+        u = V3D(3, -5, 8)
+        v = u.vector_hypot(V3D(4, 12, 15))
+        self.assertEqual(v.component_values(), [ 5.0, 13.0, 17.0 ], msg=fail_msg)
+        self.assertEqual(u.vector_negative().component_values(), [ -3, 5, -8 ], msg=fail_msg)
+        u = V3D(*np.arange(6.0).reshape(3, 2))
+        out = V3D(*np.zeros((3, 2)))
+        v = u.vector_hypot(0, out=out)
+        self.assertIs(v, out, msg=fail_msg)
+        self.assertEqual([ cv.tolist() for cv in out.component_values() ], [ [ 0.0, 1.0 ], [ 2.0, 3.0 ], [ 4.0, 5.0 ] ], msg=fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            u.vector_hypot()
+        with self.assertRaises(TypeError, msg=fail_msg):
+            V3D.register_vector_function('divmod', np.divmod)
+
+
 class Test_Case_simple_vector(Test_Case_fundamental_vector):
 
     create_vector_class = staticmethod(skvectors.create_class_Simple_Vector)
@@ -0,0 +1,95 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+import skvectors
+
+# The modules are imported lazily with PEP 562, which needs Python 3.7
+LAZY_IMPORTS = sys.version_info >= (3, 7)
+
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(skvectors.__file__)))
+
+
+def run_python(code, *options):
+
+    completed = \
+        subprocess.run(
+            [ sys.executable, *options, '-c', code ],
+            cwd = PACKAGE_PARENT,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+            universal_newlines = True,
+            check = True
+        )
+
+    return completed
+
+
+def cumulative_import_time(code, module_name):
+
+    completed = run_python(code, '-X', 'importtime')
+    lines = \
+        [
+            line
+            for line in completed.stderr.splitlines()
+            if line.split('|')[-1].strip() == module_name
+        ]
+
+    return int(lines[0].split('|')[1])
+
+
+@unittest.skipUnless(LAZY_IMPORTS, "The modules are only imported lazily with Python 3.7 or higher")
+class Test_Case_import_time(unittest.TestCase):
+
+
+    def test_import_time(self):
+
+        fail_msg = "Problem with the time it takes to import skvectors"
+        # Compared with importing the modules eagerly, in the same environment, instead of with a fixed budget
+        lazy_time = min(cumulative_import_time('import skvectors', 'skvectors') for _ in range(3))
+        eager_time = \
+            min(
+                cumulative_import_time('import skvectors.tolerant_versatile_vectors', 'skvectors.tolerant_versatile_vectors')
+                for _ in range(3)
+            )
+        self.assertLess(lazy_time, eager_time, msg=fail_msg)
+
+
+    def test_lazy_imports(self):
+
+        fail_msg = "Problem with the modules that are imported with skvectors"
+        code = \
+            "import sys, skvectors; " \
+            "print(' '.join(sorted(m for m in sys.modules if m.split('.')[0] in ('skvectors', 'pydoc', 'inspect', 'logging', 'numpy'))))"
+        completed = run_python(code)
+        self.assertEqual(completed.stdout.split(), [ 'skvectors' ], msg=fail_msg)
+        code = \
+            "import sys, skvectors; " \
+            "skvectors.create_class_Cartesian_2D_Vector; " \
+            "print(' '.join(sorted(m for m in sys.modules if m.split('.')[0] in ('inspect', 'logging', 'numpy'))))"
+        completed = run_python(code)
+        self.assertEqual(completed.stdout.split(), [ ], msg=fail_msg)
+
+
+class Test_Case_lazy_attributes(unittest.TestCase):
+
+
+    def test_lazy_attributes(self):
+
+        fail_msg = "Problem with the lazily imported functions of skvectors"
+        for name in skvectors.__all__:
+            self.assertTrue(callable(getattr(skvectors, name)), msg=fail_msg)
+            self.assertIn(name, dir(skvectors), msg=fail_msg)
+        with self.assertRaises(AttributeError, msg=fail_msg):
+            skvectors.create_class_Nothing
+
+
+if __name__ == "__main__":
+    unittest.main()
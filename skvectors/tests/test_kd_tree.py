@@ -0,0 +1,123 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+    from skvectors.kd_tree import Vector_KD_Tree
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_kd_tree(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                cnull = 0,
+                cunit = 1,
+                functions = None
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def setUp(self):
+
+        rng = np.random.default_rng(3)
+        self.points = rng.uniform(-1, 1, (500, 3))
+        self.queries = rng.uniform(-1.2, 1.2, (20, 3))
+
+
+    def test_init(self):
+
+        fail_msg = "Problem with class 'Vector_KD_Tree'"
+        tree = Vector_KD_Tree(self.V3D, self.V3D(*self.points.T))
+        self.assertEqual(len(tree), 500, msg=fail_msg)
+        tree = Vector_KD_Tree(self.V3D, (self.V3D(*p) for p in [ (1, 2, 3), (4, 5, 6) ]))
+        self.assertEqual(len(tree), 2, msg=fail_msg)
+        tree = Vector_KD_Tree(self.V3D, [ ])
+        self.assertEqual(len(tree), 0, msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            Vector_KD_Tree(self.V3D, [ ], leaf_size=0)
+
+
+    def test_query(self):
+
+        fail_msg = "Problem with method 'query'"
+        for leaf_size in [ 1, 5, 32 ]:
+            tree = Vector_KD_Tree(self.V3D, self.V3D(*self.points.T), leaf_size=leaf_size)
+            distances, positions = tree.query(self.V3D(*self.queries.T), k=3)
+            self.assertEqual(distances.shape, (20, 3), msg=fail_msg)
+            for q, d, p in zip(self.queries, distances, positions):
+                brute_force = np.sqrt(((self.points - q)**2).sum(axis=1))
+                nearest = np.argsort(brute_force)[:3]
+                np.testing.assert_allclose(d, brute_force[nearest], err_msg=fail_msg)
+                np.testing.assert_array_equal(p, nearest, err_msg=fail_msg)
+        distances, positions = tree.query(self.V3D(*self.queries[0]), k=1000)
+        self.assertEqual(distances.shape, (500,), msg=fail_msg)
+        self.assertTrue(np.all(np.diff(distances) >= 0), msg=fail_msg)
+        self.assertEqual(sorted(positions), [ *range(500) ], msg=fail_msg)
+
+
+    def test_query_radius(self):
+
+        fail_msg = "Problem with method 'query_radius'"
+        tree = Vector_KD_Tree(self.V3D, self.V3D(*self.points.T), leaf_size=8)
+        results = tree.query_radius([ self.V3D(*q) for q in self.queries ], 0.4)
+        self.assertEqual(len(results), 20, msg=fail_msg)
+        for q, (d, p) in zip(self.queries, results):
+            brute_force = np.sqrt(((self.points - q)**2).sum(axis=1))
+            inside = np.flatnonzero(brute_force <= 0.4)
+            self.assertEqual(sorted(p), sorted(inside), msg=fail_msg)
+            np.testing.assert_allclose(d, np.sort(brute_force[inside]), err_msg=fail_msg)
+
+
+    def test_nearest(self):
+
+        fail_msg = "Problem with method 'nearest'"
+        vectors = [ self.V3D(0, 0, 0), self.V3D(1, 2, 3), self.V3D(5, 5, 5), self.V3D(-1, 0, 0) ]
+        tree = Vector_KD_Tree(self.V3D, vectors, leaf_size=1)
+        nearest = tree.nearest(self.V3D(4, 4, 4), k=2)
+        self.assertIs(nearest[0], vectors[2], msg=fail_msg)
+        self.assertIs(nearest[1], vectors[1], msg=fail_msg)
+        nearest = tree.nearest([ self.V3D(-2, 0, 0), self.V3D(1, 2, 2) ])
+        self.assertEqual(nearest, [ [ vectors[3] ], [ vectors[1] ] ], msg=fail_msg)
+        tree = Vector_KD_Tree(self.V3D, self.V3D(*self.points.T))
+        nearest = tree.nearest(self.V3D(*self.points[7]))
+        self.assertEqual(nearest, [ self.V3D(*self.points[7]) ], msg=fail_msg)
+        self.assertIsInstance(nearest[0], self.V3D, msg=fail_msg)
+
+
+    def test_within(self):
+
+        fail_msg = "Problem with method 'within'"
+        vectors = [ self.V3D(0, 0, 0), self.V3D(1, 2, 3), self.V3D(5, 5, 5), self.V3D(0, 0, 1) ]
+        tree = Vector_KD_Tree(self.V3D, vectors)
+        self.assertEqual(tree.within(self.V3D(0, 0, 0.9), 1), [ vectors[3], vectors[0] ], msg=fail_msg)
+        self.assertEqual(tree.within(self.V3D(9, 9, 9), 1), [ ], msg=fail_msg)
+        within = tree.within([ self.V3D(5, 5, 4), self.V3D(1, 2, 3) ], 0.5)
+        self.assertEqual(within, [ [ ], [ vectors[1] ] ], msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+
+class Test_Case_memoize_cartesian_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                memoize = True
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def setUp(self):
+
+        self.V3D.reset_memo_statistics()
+
+
+    def test_memo_statistics(self):
+
+        fail_msg = "Problem with method 'memo_statistics'"
+        u = self.V3D(2, -3, 6)
+        self.assertEqual(u.length(), 7, msg=fail_msg)
+        self.assertEqual(u.length(), 7, msg=fail_msg)
+        self.assertEqual(u.length(), 7, msg=fail_msg)
+        statistics = self.V3D.memo_statistics()
+        self.assertEqual(statistics['length'], { 'hits': 2, 'misses': 1 }, msg=fail_msg)
+        self.assertEqual(statistics['normalize'], { 'hits': 0, 'misses': 0 }, msg=fail_msg)
+        self.V3D.reset_memo_statistics()
+        statistics = self.V3D.memo_statistics()
+        self.assertEqual(statistics['length'], { 'hits': 0, 'misses': 0 }, msg=fail_msg)
+        not_memoizing = \
+            self.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', '
+            )
+        self.assertEqual(not_memoizing.memo_statistics(), { }, msg=fail_msg)
+
+
+    def test_changed_vector(self):
+
+        fail_msg = "Problem with memoized method 'length' for changed vector"
+        u = self.V3D(2, -3, 6)
+        self.assertEqual(u.length(), 7, msg=fail_msg)
+        u.x = 0
+        self.assertEqual(u.length(), 45**0.5, msg=fail_msg)
+        u[:] = [ 1, 2, 2 ]
+        self.assertEqual(u.length(), 3, msg=fail_msg)
+        u[1] = 0
+        self.assertEqual(u.length(), 5**0.5, msg=fail_msg)
+        u += self.V3D(-1, 3, -2)
+        self.assertEqual(u.length(), 3, msg=fail_msg)
+        u.c_imul_z(4)
+        self.assertEqual(u.length(), 3, msg=fail_msg)
+        u.c_iadd_x(4)
+        self.assertEqual(u.length(), 5, msg=fail_msg)
+        statistics = self.V3D.memo_statistics()
+        self.assertEqual(statistics['length'], { 'hits': 0, 'misses': 7 }, msg=fail_msg)
+
+
+    def test_returned_copy(self):
+
+        fail_msg = "Problem with memoized method 'normalize'"
+        u = self.V3D(0, 4, 3)
+        w = u.normalize()
+        w.y = 100
+        self.assertEqual(u.normalize(), self.V3D(0, 0.8, 0.6), msg=fail_msg)
+        self.assertIsNot(u.normalize(), u.normalize(), msg=fail_msg)
+        self.assertEqual(u, self.V3D(0, 4, 3), msg=fail_msg)
+        v = u.copy()
+        v.z = 0
+        self.assertEqual(v.normalize(), self.V3D(0, 1, 0), msg=fail_msg)
+        self.assertEqual(u.normalize(), self.V3D(0, 0.8, 0.6), msg=fail_msg)
+
+
+class Test_Case_memoize_cartesian_3d_vector(Test_Case_memoize_cartesian_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    def test_memoized_properties(self):
+
+        fail_msg = "Problem with memoized property 'radius'"
+        u = self.V3D(0, 4, 3)
+        self.assertEqual(u.radius, 5, msg=fail_msg)
+        self.assertEqual(u.radius, 5, msg=fail_msg)
+        statistics = self.V3D.memo_statistics()
+        self.assertEqual(statistics['radius'], { 'hits': 1, 'misses': 1 }, msg=fail_msg)
+        u.z = 0
+        self.assertEqual(u.radius, 4, msg=fail_msg)
+
+
+class Test_Case_memoize_tolerant_cartesian_3d_vector(Test_Case_memoize_cartesian_3d_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    def test_memoized_tolerance(self):
+
+        fail_msg = "Problem with memoized method 'tolerance'"
+        u = self.V3D(0, 0, 1e10)
+        t = u.tolerance()
+        self.assertEqual(u.tolerance(), t, msg=fail_msg)
+        statistics = self.V3D.memo_statistics()
+        self.assertEqual(statistics['tolerance'], { 'hits': 1, 'misses': 1 }, msg=fail_msg)
+        u.z = 0
+        self.assertEqual(u.tolerance(), self.V3D.abs_tol, msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_pairwise_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        functions = \
+            {
+                'and': np.logical_and,
+                'or': np.logical_or,
+                'all': np.all,
+                'min': np.minimum,
+                'max': np.maximum,
+                'atan2': np.arctan2
+            }
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                functions = functions
+            )
+        rng = np.random.default_rng(3)
+        cls.vectors_a = [ cls.V3D(*cv) for cv in rng.standard_normal((37, 3)).tolist() ]
+        cls.vectors_b = [ cls.V3D(*cv) for cv in rng.standard_normal((23, 3)).tolist() ]
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+        del cls.vectors_a
+        del cls.vectors_b
+
+
+    def per_pair(self, method_name, vectors_a, vectors_b):
+
+        results = \
+            np.array(
+                [
+                    [ getattr(a, method_name)(b) for b in vectors_b ]
+                    for a in vectors_a
+                ]
+            )
+
+        return results
+
+
+    def test_pairwise_dot(self):
+
+        fail_msg = "Problem with method 'pairwise_dot'"
+        dots = self.V3D.pairwise_dot(self.vectors_a, self.vectors_b, block=8)
+        np.testing.assert_array_equal(dots, self.per_pair('dot', self.vectors_a, self.vectors_b), err_msg=fail_msg)
+
+
+    def test_pairwise_distance(self):
+
+        fail_msg = "Problem with method 'pairwise_distance'"
+        distances = self.V3D.pairwise_distance(self.vectors_a, self.vectors_b, block=10)
+        np.testing.assert_array_equal(distances, self.per_pair('distance', self.vectors_a, self.vectors_b), err_msg=fail_msg)
+        distances = self.V3D.pairwise_distance(self.vectors_a)
+        np.testing.assert_array_equal(distances, self.per_pair('distance', self.vectors_a, self.vectors_a), err_msg=fail_msg)
+        np.testing.assert_array_equal(np.diag(distances), 0.0, err_msg=fail_msg)
+
+
+    def test_pairwise_angle(self):
+
+        fail_msg = "Problem with method 'pairwise_angle'"
+        vectors_b = self.vectors_b + [ self.vectors_a[0] * 3, -self.vectors_a[1] ]
+        angles = self.V3D.pairwise_angle(self.vectors_a, vectors_b, block=16)
+        # The vectorized arctan2 in NumPy may differ from the scalar one in the last bit
+        np.testing.assert_allclose(angles, self.per_pair('angle', self.vectors_a, vectors_b), rtol=1e-15, err_msg=fail_msg)
+        self.assertAlmostEqual(angles[0, -2], 0.0, msg=fail_msg)
+        self.assertAlmostEqual(angles[1, -1], np.pi, msg=fail_msg)
+
+
+    def test_pairwise_other_method(self):
+
+        fail_msg = "Problem with method 'pairwise' for another method"
+        vectors_b = self.vectors_b[:5] + [ self.vectors_a[2] * 2 ]
+        parallel = self.V3D.pairwise('are_parallel', self.vectors_a, vectors_b, block=7)
+        np.testing.assert_array_equal(parallel, self.per_pair('are_parallel', self.vectors_a, vectors_b), err_msg=fail_msg)
+        self.assertTrue(parallel[2, -1], msg=fail_msg)
+
+
+    def test_pairwise_batch(self):
+
+        fail_msg = "Problem with method 'pairwise_distance' for vectors with arrays as component values"
+        batch_a = self.V3D(*np.array([ v.cvalues for v in self.vectors_a ]).T)
+        distances = self.V3D.pairwise_distance(batch_a, self.vectors_b)
+        np.testing.assert_array_equal(distances, self.per_pair('distance', self.vectors_a, self.vectors_b), err_msg=fail_msg)
+
+
+    def test_pairwise_stream(self):
+
+        fail_msg = "Problem with method 'pairwise_distance' with stream"
+        expected = self.per_pair('distance', self.vectors_a, self.vectors_b)
+        distances = np.full(expected.shape, np.nan)
+        blocks = self.V3D.pairwise_distance(self.vectors_a, self.vectors_b, block=16, stream=True)
+        for row_slice, column_slice, block in blocks:
+            self.assertLessEqual(block.size, 16 * 16, msg=fail_msg)
+            distances[row_slice, column_slice] = block
+        np.testing.assert_array_equal(distances, expected, err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.pairwise_distance(self.vectors_a, stream=True, out=distances)
+
+
+    def test_pairwise_out(self):
+
+        fail_msg = "Problem with method 'pairwise_dot' with out"
+        out = np.empty((37, 23))
+        dots = self.V3D.pairwise_dot(self.vectors_a, self.vectors_b, out=out)
+        self.assertIs(dots, out, msg=fail_msg)
+        np.testing.assert_array_equal(out, self.per_pair('dot', self.vectors_a, self.vectors_b), err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.pairwise_dot(self.vectors_a, self.vectors_b, out=np.empty((23, 37)))
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.pairwise_dot(self.vectors_a, self.vectors_b, block=0)
+
+
+    def test_pairwise_empty(self):
+
+        fail_msg = "Problem with method 'pairwise_distance' for no vectors"
+        distances = self.V3D.pairwise_distance([ ], self.vectors_b)
+        self.assertEqual(distances.shape, (0, 23), msg=fail_msg)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_pairwise_cartesian_2d_vector(unittest.TestCase):
+
+
+    def test_pairwise_angle(self):
+
+        fail_msg = "Problem with method 'pairwise_angle' for 2D vectors"
+        V2D = skvectors.create_class_Cartesian_2D_Vector('V2D', 'xy', functions={ 'atan2': np.arctan2 })
+        rng = np.random.default_rng(4)
+        vectors_a = [ V2D(*cv) for cv in rng.standard_normal((29, 2)).tolist() ]
+        vectors_b = [ V2D(*cv) for cv in rng.standard_normal((17, 2)).tolist() ]
+        angles = V2D.pairwise_angle(vectors_a, vectors_b, block=8)
+        expected = np.array([ [ a.angle(b) for b in vectors_b ] for a in vectors_a ])
+        np.testing.assert_array_equal(angles, expected, err_msg=fail_msg)
+        self.assertLess(angles.min(), -np.pi, msg=fail_msg)
+        self.assertGreater(angles.max(), np.pi, msg=fail_msg)
+        angles = V2D.pairwise_angle(vectors_a)
+        np.testing.assert_array_equal(angles, -angles.T, err_msg=fail_msg)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_pairwise_tolerant_cartesian_2d_vector(unittest.TestCase):
+
+
+    def test_pairwise_angle(self):
+
+        fail_msg = "Problem with method 'pairwise_angle' for tolerant 2D vectors"
+        TV2D = skvectors.create_class_Tolerant_Cartesian_2D_Vector('TV2D', 'xy')
+        vectors = [ TV2D(1, 0), TV2D(0, 1), TV2D(-1, -1) ]
+        angles = TV2D.pairwise_angle(vectors)
+        expected = np.array([ [ a.angle(b) for b in vectors ] for a in vectors ])
+        np.testing.assert_allclose(angles, expected, rtol=1e-15, err_msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
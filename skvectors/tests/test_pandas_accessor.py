@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import math
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+    import pandas as pd
+    import skvectors.pandas_accessor
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, "Pandas is not installed")
+class Test_Case_pandas_accessor(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                cnull = 0,
+                cunit = 1,
+                functions = \
+                    {
+                        'min': np.minimum,
+                        'max': np.maximum,
+                        'atan2': np.arctan2,
+                        'cos': np.cos,
+                        'sin': np.sin
+                    }
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def setUp(self):
+
+        self.df = \
+            pd.DataFrame(
+                {
+                    'x': [ 3.0, 0.0, -2.0 ],
+                    'y': [ 0.0, 4.0, 0.0 ],
+                    'z': [ -4.0, 3.0, 0.0 ],
+                    'label': [ 'a', 'b', 'c' ]
+                },
+                index = [ 10, 20, 30 ]
+            )
+
+
+    def test_bind(self):
+
+        fail_msg = "Problem with accessor 'skv'"
+        vc = self.df.skv(self.V3D, [ 'x', 'y', 'z' ])
+        self.assertListEqual(vc.columns, [ 'x', 'y', 'z' ], msg=fail_msg)
+        v = vc.vector()
+        self.assertTrue(self.V3D.is_vector(v), msg=fail_msg)
+        self.assertListEqual(list(v.x), [ 3.0, 0.0, -2.0 ], msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.df.skv(self.V3D, [ 'x', 'y' ])
+        with self.assertRaises(KeyError, msg=fail_msg):
+            self.df.skv(self.V3D, [ 'x', 'y', 'w' ])
+
+
+    def test_scalar_result(self):
+
+        fail_msg = "Problem with scalar results from accessor 'skv'"
+        s = self.df.skv(self.V3D, 'xyz').length()
+        self.assertListEqual(list(self.df['length']), [ 5.0, 5.0, 2.0 ], msg=fail_msg)
+        self.assertListEqual(list(s.index), [ 10, 20, 30 ], msg=fail_msg)
+        self.df.skv(self.V3D, 'xyz').radius
+        self.assertListEqual(list(self.df['radius']), [ 5.0, 5.0, 2.0 ], msg=fail_msg)
+        self.df.skv(self.V3D, 'xyz').dot(self.V3D(1, 1, 1), names='d')
+        self.assertListEqual(list(self.df['d']), [ -1.0, 7.0, -2.0 ], msg=fail_msg)
+
+
+    def test_existing_columns(self):
+
+        fail_msg = "Problem with existing columns for accessor 'skv'"
+        vc = self.df.skv(self.V3D, 'xyz')
+        vc.length()
+        self.df['length'] = 0.0
+        with self.assertRaises(ValueError, msg=fail_msg):
+            vc.length()
+        self.assertListEqual(list(self.df['length']), [ 0.0, 0.0, 0.0 ], msg=fail_msg)
+        vc.length(names='length')
+        self.assertListEqual(list(self.df['length']), [ 5.0, 5.0, 2.0 ], msg=fail_msg)
+        self.df['cross_y'] = 1.0
+        with self.assertRaises(ValueError, msg=fail_msg):
+            vc.cross(self.V3D(1, 0, 0))
+        self.assertNotIn('cross_x', self.df.columns, msg=fail_msg)
+        vc.normalize(names=[ 'x', 'y', 'z' ])
+        self.assertListEqual(list(self.df['x']), [ 0.6, 0.0, -1.0 ], msg=fail_msg)
+
+
+    def test_vector_result(self):
+
+        fail_msg = "Problem with vector results from accessor 'skv'"
+        vc = self.df.skv(self.V3D, 'xyz')
+        nc = vc.normalize(names=[ 'nx', 'ny', 'nz' ])
+        self.assertListEqual(nc.columns, [ 'nx', 'ny', 'nz' ], msg=fail_msg)
+        self.assertListEqual(list(self.df['nx']), [ 0.6, 0.0, -1.0 ], msg=fail_msg)
+        self.assertListEqual(list(self.df['nz']), [ -0.8, 0.6, 0.0 ], msg=fail_msg)
+        cc = vc.cross(nc)
+        self.assertListEqual(cc.columns, [ 'cross_x', 'cross_y', 'cross_z' ], msg=fail_msg)
+        for cvs in cc.vector():
+            for cv in cvs:
+                self.assertAlmostEqual(cv, 0.0, msg=fail_msg)
+        vc.rotate_z(math.pi / 2, names=[ 'rx', 'ry', 'rz' ])
+        for rx, ry, y in zip(self.df['rx'], self.df['ry'], self.df['y']):
+            self.assertAlmostEqual(rx, -y, msg=fail_msg)
+        for ry, x in zip(self.df['ry'], self.df['x']):
+            self.assertAlmostEqual(ry, x, msg=fail_msg)
+        r = vc.apply('__add__', self.V3D(1, 2, 3), names=[ 'ax', 'ay', 'az' ])
+        self.assertListEqual(list(self.df['az']), [ -1.0, 6.0, 3.0 ], msg=fail_msg)
+        self.assertListEqual(r.columns, [ 'ax', 'ay', 'az' ], msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
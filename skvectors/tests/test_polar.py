@@ -0,0 +1,138 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import math
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Test_Case_to_polar(unittest.TestCase):
+
+
+    def test_to_polar_3d(self):
+
+        fail_msg = "Problem with method 'to_polar'"
+        V3D = skvectors.create_class_Cartesian_3D_Vector('V3D', 'xyz')
+        v = V3D(3.0, -4.0, 12.0)
+        self.assertEqual(v.to_polar(), (v.radius, v.azimuth, v.inclination), msg=fail_msg)
+        radius, azimuth, inclination = v.to_polar()
+        self.assertEqual(radius, 13.0, msg=fail_msg)
+        self.assertAlmostEqual(azimuth, math.atan2(-4.0, 3.0), msg=fail_msg)
+        self.assertAlmostEqual(inclination, math.atan2(12.0, 5.0), msg=fail_msg)
+        u = V3D.from_polar(*v.to_polar())
+        for cu, cv in zip(u, v):
+            self.assertAlmostEqual(cu, cv, msg=fail_msg)
+        self.assertEqual(V3D(0, 0, 0).to_polar(), (0.0, 0.0, 0.0), msg=fail_msg)
+
+
+    def test_to_polar_2d(self):
+
+        fail_msg = "Problem with method 'to_polar'"
+        V2D = skvectors.create_class_Cartesian_2D_Vector('V2D', 'xy')
+        v = V2D(-3.0, 4.0)
+        self.assertEqual(v.to_polar(), (v.radius, v.azimuth), msg=fail_msg)
+        self.assertEqual(v.to_polar(), (5.0, math.atan2(4.0, -3.0)), msg=fail_msg)
+        u = V2D.from_polar(*v.to_polar())
+        for cu, cv in zip(u, v):
+            self.assertAlmostEqual(cu, cv, msg=fail_msg)
+
+
+    def test_polar_as_dict_memoize(self):
+
+        fail_msg = "Problem with method 'polar_as_dict'"
+        MV3D = skvectors.create_class_Cartesian_3D_Vector('MV3D', 'xyz', memoize=True)
+        v = MV3D(1.0, 2.0, 2.0)
+        polar = v.polar_as_dict()
+        self.assertEqual(polar, v.polar_as_dict(), msg=fail_msg)
+        self.assertEqual(polar['radius'], 3.0, msg=fail_msg)
+        self.assertEqual(MV3D.memo_statistics()['radius'], { 'hits': 1, 'misses': 1 }, msg=fail_msg)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_polar_many(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = skvectors.create_class_Cartesian_3D_Vector('V3D', 'xyz')
+        cls.V2D = skvectors.create_class_Cartesian_2D_Vector('V2D', 'xy')
+        rng = np.random.default_rng(11)
+        cls.arrays = rng.standard_normal((3, 500)) * 10
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+        del cls.V2D
+        del cls.arrays
+
+
+    def test_to_polar_many_3d(self):
+
+        fail_msg = "Problem with class method 'to_polar_many'"
+        V3D = self.V3D
+        vectors = [ V3D(*cv) for cv in self.arrays.T.tolist() ]
+        polar = V3D.to_polar_many(vectors)
+        self.assertEqual(polar.shape, (3, 500), msg=fail_msg)
+        expected = np.array([ v.to_polar() for v in vectors ]).T
+        np.testing.assert_allclose(polar, expected, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+        np.testing.assert_array_equal(V3D.to_polar_many(V3D(*self.arrays)), polar, err_msg=fail_msg)
+        out = np.empty((3, 500))
+        result = V3D.to_polar_many(vectors, out=out)
+        self.assertIs(result, out, msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            V3D.to_polar_many(vectors, out=np.empty((2, 500)))
+
+
+    def test_from_polar_many_3d(self):
+
+        fail_msg = "Problem with class method 'from_polar_many'"
+        V3D = self.V3D
+        radius, azimuth, inclination = V3D.to_polar_many(V3D(*self.arrays))
+        v = V3D.from_polar_many(radius, azimuth, inclination)
+        self.assertIsInstance(v, V3D, msg=fail_msg)
+        np.testing.assert_allclose(v.cvalues, self.arrays, rtol=1e-12, atol=1e-12, err_msg=fail_msg)
+        for i in range(0, 500, 37):
+            u = V3D.from_polar(radius[i], azimuth[i], inclination[i])
+            np.testing.assert_allclose([ cv[i] for cv in v ], u.cvalues, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+        # Scalars are broadcast
+        v = V3D.from_polar_many(2.0, [ 0.0, math.pi / 2 ], 0.0)
+        np.testing.assert_allclose(v.cvalues, [ [ 2.0, 0.0 ], [ 0.0, 2.0 ], [ 0.0, 0.0 ] ], atol=1e-15, err_msg=fail_msg)
+        out = np.empty((3, 500))
+        v = V3D.from_polar_many(radius, azimuth, inclination, out=out)
+        np.testing.assert_array_equal(out, v.cvalues, err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            V3D.from_polar_many(radius, azimuth, inclination, out=np.empty((3, 499)))
+        with self.assertRaises(ValueError, msg=fail_msg):
+            V3D.from_polar_many(out[0], azimuth, inclination, out=out)
+
+
+    def test_polar_many_2d(self):
+
+        fail_msg = "Problem with class methods 'to_polar_many' and 'from_polar_many'"
+        V2D = self.V2D
+        vectors = [ V2D(*cv) for cv in self.arrays[:2].T.tolist() ]
+        polar = V2D.to_polar_many(vectors)
+        self.assertEqual(polar.shape, (2, 500), msg=fail_msg)
+        expected = np.array([ v.to_polar() for v in vectors ]).T
+        np.testing.assert_allclose(polar, expected, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+        v = V2D.from_polar_many(*polar)
+        self.assertIsInstance(v, V2D, msg=fail_msg)
+        np.testing.assert_allclose(v.cvalues, self.arrays[:2], rtol=1e-12, atol=1e-12, err_msg=fail_msg)
+        for i in range(0, 500, 37):
+            u = V2D.from_polar(*polar[:, i])
+            np.testing.assert_allclose([ cv[i] for cv in v ], u.cvalues, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+    import skvectors.products
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_products_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', '
+            )
+        rng = np.random.default_rng(7)
+        # More vectors than in one chunk
+        n = skvectors.products._CHUNK + 123
+        cls.arrays = [ rng.standard_normal((3, n)) for _ in range(3) ]
+        cls.batches = [ cls.V3D(*cvalues) for cvalues in cls.arrays ]
+        cls.lists = [ [ cls.V3D(*cv) for cv in cvalues.T.tolist() ] for cvalues in cls.arrays ]
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+        del cls.arrays
+        del cls.batches
+        del cls.lists
+
+
+    def test_cross_many(self):
+
+        fail_msg = "Problem with method 'cross_many'"
+        list_a, list_b, _ = self.lists
+        expected = np.array([ a.cross(b).cvalues for a, b in zip(list_a, list_b) ]).T
+        vectors = self.V3D.cross_many(self.batches[0], self.batches[1])
+        self.assertTrue(self.V3D.is_vector(vectors), msg=fail_msg)
+        np.testing.assert_array_equal(np.array(vectors.cvalues), expected, err_msg=fail_msg)
+        vectors = self.V3D.cross_many(list_a, self.batches[1])
+        np.testing.assert_array_equal(np.array(vectors.cvalues), expected, err_msg=fail_msg)
+
+
+    def test_cross_many_normalize(self):
+
+        fail_msg = "Problem with method 'cross_many' with normalize"
+        list_a, list_b, _ = self.lists
+        expected = np.array([ a.cross(b).normalize().cvalues for a, b in zip(list_a, list_b) ]).T
+        vectors = self.V3D.cross_many(list_a, list_b, normalize=True)
+        np.testing.assert_allclose(np.array(vectors.cvalues), expected, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+        vectors = self.V3D.cross_many([ self.V3D(1, 2, 3) ], [ self.V3D(2, 4, 6) ], normalize=True)
+        self.assertEqual(vectors.cvalues, [ 0.0, 0.0, 0.0 ], msg=fail_msg)
+
+
+    def test_cross_many_out(self):
+
+        fail_msg = "Problem with method 'cross_many' with out"
+        n = self.arrays[0].shape[1]
+        out = np.empty((3, n))
+        vectors = self.V3D.cross_many(*self.batches[:2], out=out)
+        np.testing.assert_array_equal(out, np.array(vectors.cvalues), err_msg=fail_msg)
+        np.testing.assert_array_equal(out, np.array(self.V3D.cross_many(*self.batches[:2]).cvalues), err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.cross_many(*self.batches[:2], out=np.empty((n, 3)))
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.cross_many(vectors, self.batches[1], out=out)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.cross_many(self.lists[0][:5], self.lists[1][:6])
+
+
+    def test_stp_many(self):
+
+        fail_msg = "Problem with method 'stp_many'"
+        expected = np.array([ a.stp(b, c) for a, b, c in zip(*self.lists) ])
+        scalars = self.V3D.stp_many(*self.batches)
+        np.testing.assert_array_equal(scalars, expected, err_msg=fail_msg)
+        out = np.empty(len(expected))
+        scalars = self.V3D.stp_many(self.lists[0], self.batches[1], self.lists[2], out=out)
+        self.assertIs(scalars, out, msg=fail_msg)
+        np.testing.assert_array_equal(out, expected, err_msg=fail_msg)
+
+
+    def test_triangle_normals(self):
+
+        fail_msg = "Problem with method 'triangle_normals'"
+        expected = np.array([ (p1 - p0).cross(p2 - p0).cvalues for p0, p1, p2 in zip(*self.lists) ]).T
+        normals = self.V3D.triangle_normals(*self.batches)
+        np.testing.assert_array_equal(np.array(normals.cvalues), expected, err_msg=fail_msg)
+        expected = np.array([ (p1 - p0).cross(p2 - p0).normalize().cvalues for p0, p1, p2 in zip(*self.lists) ]).T
+        normals = self.V3D.triangle_normals(*self.lists, normalize=True)
+        np.testing.assert_allclose(np.array(normals.cvalues), expected, rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+
+
+    def test_triangle_normals_degenerate(self):
+
+        fail_msg = "Problem with method 'triangle_normals' for degenerate triangles"
+        p0 = [ self.V3D(0, 0, 0), self.V3D(1, 1, 1) ]
+        p1 = [ self.V3D(2, 0, 0), self.V3D(2, 2, 2) ]
+        p2 = [ self.V3D(0, 3, 0), self.V3D(3, 3, 3) ]
+        normals = self.V3D.triangle_normals(p0, p1, p2, normalize=True)
+        np.testing.assert_array_equal(normals.z, [ 1.0, 0.0 ], err_msg=fail_msg)
+        np.testing.assert_array_equal(normals.x, [ 0.0, 0.0 ], err_msg=fail_msg)
+
+
+    def test_empty(self):
+
+        fail_msg = "Problem with batch products for no vectors"
+        normals = self.V3D.triangle_normals([ ], [ ], [ ], normalize=True)
+        self.assertEqual(normals.x.shape, (0,), msg=fail_msg)
+        self.assertEqual(self.V3D.stp_many([ ], [ ], [ ]).shape, (0,), msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+
+class Test_Case_profile(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    def setUp(self):
+
+        self.V3D = \
+            self.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', '
+            )
+
+
+    def tearDown(self):
+
+        del self.V3D
+
+
+    def stat(self, stats, method_name):
+
+        matches = [ stat for key, stat in stats.items() if key.endswith('.' + method_name) ]
+        self.assertEqual(len(matches), 1)
+
+        return matches[0]
+
+
+    def test_profile_counts(self):
+
+        fail_msg = "Problem with function 'profile'"
+        u = self.V3D(1, 2, 3)
+        w = self.V3D(0, 1, 0)
+        with skvectors.profile(self.V3D, log_level=None) as prof:
+            for _ in range(5):
+                u.reject(w)
+            u * 2
+            u.c_abs_x()
+        stats = prof.stats()
+        self.assertEqual(self.stat(stats, 'reject')['calls'], 5, msg=fail_msg)
+        self.assertEqual(self.stat(stats, 'dot')['calls'], 10, msg=fail_msg)
+        self.assertEqual(self.stat(stats, '__getattr__')['calls'], 1, msg=fail_msg)
+        # self * other in both the dot products, other * s and self - other * s in each call
+        self.assertEqual(self.stat(stats, 'reject')['vectors_created'], 20, msg=fail_msg)
+        self.assertEqual(self.stat(stats, '__mul__')['calls'], 16, msg=fail_msg)
+        self.assertGreater(self.stat(stats, 'reject')['time'], 0.0, msg=fail_msg)
+        self.assertGreaterEqual(self.stat(stats, 'reject')['time'], self.stat(stats, 'dot')['time'] / 2, msg=fail_msg)
+        self.assertFalse(any(key.endswith('.cross') for key in stats), msg=fail_msg)
+
+
+    def test_profile_restores_methods(self):
+
+        fail_msg = "Problem with function 'profile' when restoring the methods"
+        length = self.V3D.length
+        mul = self.V3D.__mul__
+        fill = self.V3D.fill
+        with skvectors.profile(log_level=None):
+            self.assertIsNot(self.V3D.length, length, msg=fail_msg)
+        self.assertIs(self.V3D.length, length, msg=fail_msg)
+        self.assertIs(self.V3D.__mul__, mul, msg=fail_msg)
+        self.assertEqual(self.V3D.fill, fill, msg=fail_msg)
+        with self.assertRaises(ZeroDivisionError, msg=fail_msg):
+            with skvectors.profile(self.V3D, log_level=None):
+                self.V3D(0, 0, 0).normalize()
+        self.assertIs(self.V3D.length, length, msg=fail_msg)
+
+
+    def test_profile_log(self):
+
+        fail_msg = "Problem with function 'profile' when logging"
+        with self.assertLogs('skvectors.profile', level='INFO') as logs:
+            with skvectors.profile(self.V3D) as prof:
+                self.V3D(1, 2, 3).length()
+        self.assertEqual(len(logs.output), 1, msg=fail_msg)
+        self.assertIn('length', logs.output[0], msg=fail_msg)
+        self.assertIn('length', prof.report(limit=3), msg=fail_msg)
+
+
+    def test_profile_started_twice(self):
+
+        fail_msg = "Problem with method 'start'"
+        prof = skvectors.profile(self.V3D, log_level=None)
+        with prof:
+            with self.assertRaises(RuntimeError, msg=fail_msg):
+                prof.start()
+
+
+if __name__ == "__main__":
+    unittest.main()
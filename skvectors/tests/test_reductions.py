@@ -0,0 +1,124 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_reductions_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', '
+            )
+        rng = np.random.default_rng(11)
+        cls.points = rng.standard_normal((1000, 3)) @ np.array([ [ 3, 1, 0 ], [ 0, 2, 0 ], [ 0, 0, 0.5 ] ]) + [ 1, -2, 3 ]
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+        del cls.points
+
+
+    def vectors(self, points):
+
+        return [ self.V3D(*p) for p in points.tolist() ]
+
+
+    def test_bounds(self):
+
+        fail_msg = "Problem with method 'bounds'"
+        low, high = self.V3D.bounds(self.vectors(self.points))
+        self.assertEqual(low.cvalues, self.points.min(axis=0).tolist(), msg=fail_msg)
+        self.assertEqual(high.cvalues, self.points.max(axis=0).tolist(), msg=fail_msg)
+
+
+    def test_centroid(self):
+
+        fail_msg = "Problem with method 'centroid'"
+        vector = self.V3D.centroid(self.V3D(*self.points.T))
+        np.testing.assert_allclose(vector.cvalues, self.points.mean(axis=0), rtol=1e-14, err_msg=fail_msg)
+        vector = self.V3D.centroid(self.vectors(self.points))
+        np.testing.assert_allclose(vector.cvalues, self.points.mean(axis=0), rtol=1e-14, err_msg=fail_msg)
+
+
+    def test_covariance(self):
+
+        fail_msg = "Problem with method 'covariance'"
+        expected = np.cov(self.points.T)
+        np.testing.assert_allclose(self.V3D.covariance(self.vectors(self.points)), expected, rtol=1e-12, err_msg=fail_msg)
+        expected = np.cov(self.points.T, ddof=0)
+        np.testing.assert_allclose(self.V3D.covariance(self.V3D(*self.points.T), ddof=0), expected, rtol=1e-12, err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            self.V3D.covariance([ self.V3D(1, 2, 3) ])
+
+
+    def test_covariance_stable(self):
+
+        fail_msg = "Problem with method 'covariance' for vectors far from the origin"
+        chunks = (self.V3D(*(chunk + 1e9).T) for chunk in np.array_split(self.points, 7))
+        covariance = self.V3D.covariance(chunks)
+        np.testing.assert_allclose(covariance, np.cov(self.points.T), rtol=1e-6, err_msg=fail_msg)
+
+
+    def test_principal_axes(self):
+
+        fail_msg = "Problem with method 'principal_axes'"
+        variances, axes = self.V3D.principal_axes(self.V3D(*self.points.T))
+        eigenvalues, eigenvectors = np.linalg.eigh(np.cov(self.points.T))
+        np.testing.assert_allclose(variances, eigenvalues[::-1], rtol=1e-12, err_msg=fail_msg)
+        for axis, eigenvector in zip(axes, eigenvectors.T[::-1]):
+            self.assertAlmostEqual(abs(axis.dot(self.V3D(*eigenvector))), 1.0, msg=fail_msg)
+        self.assertAlmostEqual(axes[0].cross(axes[1]).dot(axes[2])**2, 1.0, msg=fail_msg)
+
+
+    def test_merge(self):
+
+        fail_msg = "Problem with method 'merge'"
+        statistics_a = self.V3D.statistics(self.vectors(self.points[:300]))
+        statistics_b = self.V3D.statistics(self.V3D(*self.points[300:].T))
+        statistics = self.V3D.statistics().merge(statistics_a).merge(statistics_b)
+        self.assertEqual(statistics.count, 1000, msg=fail_msg)
+        np.testing.assert_allclose(statistics.covariance(), np.cov(self.points.T), rtol=1e-12, err_msg=fail_msg)
+        low, high = statistics.bounds()
+        self.assertEqual(low.cvalues, self.points.min(axis=0).tolist(), msg=fail_msg)
+        V2D = skvectors.create_class_Cartesian_2D_Vector('V2D', 'xy')
+        with self.assertRaises(TypeError, msg=fail_msg):
+            statistics.merge(V2D.statistics([ V2D(1, 2) ]))
+
+
+    def test_update(self):
+
+        fail_msg = "Problem with method 'update'"
+        statistics = self.V3D.statistics()
+        self.assertEqual(statistics.count, 0, msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            statistics.centroid()
+        mixed = [ self.V3D(*self.points[:10].T), *self.vectors(self.points[10:20]), self.V3D(*self.points[20:].T) ]
+        statistics.update(mixed).update([ ])
+        self.assertEqual(statistics.count, 1000, msg=fail_msg)
+        np.testing.assert_allclose(statistics.centroid().cvalues, self.points.mean(axis=0), rtol=1e-14, err_msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ Use of this source code is governed by a BSD-license that can be found in the LI
 from math import floor, ceil, trunc
 import itertools
 import unittest
+from unittest import mock
 import skvectors
 
 
@@ -999,6 +1000,24 @@ class Test_Case_simple_vector(unittest.TestCase):
         )
 
 
+    def test_scalar_operands(self):
+
+        fail_msg = "Problem with scalar operands for the arithmetic operators"
+        u = self.V3D(-3, 4, -5)
+        with mock.patch.object(self.V3D, 'fill', side_effect=AssertionError("fill() was called")):
+            self.assertListEqual((u * 2).component_values(), [ -6, 8, -10 ], msg=fail_msg)
+            self.assertListEqual((2 - u).component_values(), [ 5, -2, 7 ], msg=fail_msg)
+            self.assertListEqual((u ** 2).component_values(), [ 9, 16, 25 ], msg=fail_msg)
+            self.assertListEqual((2 ** self.V3D(0, 1, 2)).component_values(), [ 1, 2, 4 ], msg=fail_msg)
+            self.assertListEqual((u / 2).component_values(), [ -1.5, 2.0, -2.5 ], msg=fail_msg)
+            v = u.copy()
+            v /= 2
+            self.assertListEqual(v.component_values(), [ -1.5, 2.0, -2.5 ], msg=fail_msg)
+        for value in [ 2, 2.0, True ]:
+            self.assertListEqual((u * value).component_values(), (u * self.V3D.fill(value)).component_values(), msg=fail_msg)
+            self.assertListEqual((value - u).component_values(), (self.V3D.fill(value) - u).component_values(), msg=fail_msg)
+
+
 ### TODO:
 #     def test_setattr(self):
 #
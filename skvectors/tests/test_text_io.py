@@ -0,0 +1,143 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import io
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+    from skvectors.text_io import read_text, write_text
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_text_io(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                cnull = 0,
+                cunit = 1,
+                functions = None
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_read_text(self):
+
+        fail_msg = "Problem with function 'read_text'"
+        text = \
+            "# x y z\n" \
+            "1.0 2.0 3.0\n" \
+            "4.0 5.0 6.0\n" \
+            "\n" \
+            "7.0 8.0 9.0\n" \
+            "# comment\n" \
+            "10.0 11.0 12.0\n" \
+            "13.0 14.0 15.0\n"
+        batches = [ *read_text(io.StringIO(text), self.V3D, chunk_rows=2) ]
+        self.assertListEqual([ len(v.x) for v in batches ], [ 1, 1, 1, 2 ], msg=fail_msg)
+        for v in batches:
+            self.assertTrue(self.V3D.is_vector(v), msg=fail_msg)
+        xs = np.concatenate([ v.x for v in batches ])
+        zs = np.concatenate([ v.z for v in batches ])
+        self.assertListEqual(xs.tolist(), [ 1.0, 4.0, 7.0, 10.0, 13.0 ], msg=fail_msg)
+        self.assertListEqual(zs.tolist(), [ 3.0, 6.0, 9.0, 12.0, 15.0 ], msg=fail_msg)
+        batches = [ *read_text(io.StringIO(text), self.V3D, chunk_rows=100) ]
+        self.assertEqual(len(batches), 1, msg=fail_msg)
+        self.assertListEqual(batches[0].length().tolist()[:1], [ 14.0**0.5 ], msg=fail_msg)
+
+
+    def test_read_text_csv(self):
+
+        fail_msg = "Problem with function 'read_text'"
+        text = \
+            "id,z,y,x\n" \
+            "0,3,2,1\n" \
+            "1,6,5,4\n"
+        v, = read_text(io.StringIO(text), self.V3D, columns=[ 3, 2, 1 ], delimiter=',', skip_rows=1)
+        self.assertListEqual(v.x.tolist(), [ 1.0, 4.0 ], msg=fail_msg)
+        self.assertListEqual(v.y.tolist(), [ 2.0, 5.0 ], msg=fail_msg)
+        self.assertListEqual(v.z.tolist(), [ 3.0, 6.0 ], msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            next(read_text(io.StringIO(text), self.V3D, columns=[ 1, 2 ]))
+        with self.assertRaises(ValueError, msg=fail_msg):
+            next(read_text(io.StringIO(text), self.V3D, chunk_rows=0))
+
+
+    def test_write_text(self):
+
+        fail_msg = "Problem with function 'write_text'"
+        vectors = [ self.V3D(1, -2, 3), self.V3D(0.5, 0.25, -1.5) ]
+        text_file = io.StringIO()
+        write_text(text_file, vectors, format_spec='.2f')
+        self.assertEqual(text_file.getvalue(), "1.00 -2.00 3.00\n0.50 0.25 -1.50\n", msg=fail_msg)
+        rows = np.arange(30.0).reshape(10, 3)
+        for chunk_rows in [ 1, 3, 1000 ]:
+            batch = self.V3D(*rows.T)
+            text_file = io.StringIO()
+            write_text(text_file, [ batch ], format_spec='.3e', delimiter=',', chunk_rows=chunk_rows)
+            text_file.seek(0)
+            v, = read_text(text_file, self.V3D, delimiter=',')
+            with self.subTest(chunk_rows=chunk_rows):
+                self.assertListEqual(v.y.tolist(), rows[:, 1].tolist(), msg=fail_msg)
+        batch = self.V3D(np.arange(3.0), 7.0, np.arange(3.0))
+        text_file = io.StringIO()
+        write_text(text_file, [ batch ], chunk_rows=1)
+        text_file.seek(0)
+        v, = read_text(text_file, self.V3D)
+        self.assertListEqual(v.y.tolist(), [ 7.0, 7.0, 7.0 ], msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            write_text(io.StringIO(), [ batch ], chunk_rows=0)
+
+
+    def test_write_text_same_lines(self):
+
+        fail_msg = "Problem with function 'write_text'"
+        rows = np.array([ [ 0.1, -2.0, 1e-20 ], [ 1 / 3, 2.5, 1e16 ], [ -0.0, 7.0, 3.0 ] ] * 4)
+        vectors = [ self.V3D(*row) for row in rows.tolist() ]
+        batch = self.V3D(*rows.T)
+        for format_spec in [ '', '.3f', '>12.5e', '{^8' ]:
+            text_file = io.StringIO()
+            write_text(text_file, vectors, format_spec=format_spec)
+            expected = text_file.getvalue()
+            self.assertEqual(expected.splitlines()[0], ' '.join(format(cv, format_spec) for cv in vectors[0]), msg=fail_msg)
+            # The lines are the same on both sides of chunk_rows
+            for chunk_rows in [ 1, 5, 12, 13, 1000 ]:
+                text_file = io.StringIO()
+                write_text(text_file, [ batch ], format_spec=format_spec, chunk_rows=chunk_rows)
+                with self.subTest(format_spec=format_spec, chunk_rows=chunk_rows):
+                    self.assertEqual(text_file.getvalue(), expected, msg=fail_msg)
+        text_file = io.StringIO()
+        write_text(text_file, [ batch ])
+        self.assertEqual(text_file.getvalue().splitlines()[:2], [ '0.1 -2.0 1e-20', '0.3333333333333333 2.5 1e+16' ], msg=fail_msg)
+        # Integer formats are for integer component values, however the vectors are batched
+        for chunk_rows in [ 1, 1000 ]:
+            with self.assertRaises(ValueError, msg=fail_msg):
+                write_text(io.StringIO(), [ batch ], format_spec='d', chunk_rows=chunk_rows)
+            text_file = io.StringIO()
+            write_text(text_file, [ self.V3D(np.arange(3), 4, -5) ], format_spec='d', chunk_rows=chunk_rows)
+            self.assertEqual(text_file.getvalue(), "0 4 -5\n1 4 -5\n2 4 -5\n", msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
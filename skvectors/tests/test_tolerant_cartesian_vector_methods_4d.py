@@ -5,9 +5,15 @@ Use of this source code is governed by a BSD-license that can be found in the LI
 """
 
 import math
+import random
 import unittest
 import skvectors
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Test_Case_tolerant_cartesian_vector(unittest.TestCase):
 
@@ -70,6 +76,32 @@ class Test_Case_tolerant_cartesian_vector(unittest.TestCase):
         w = self.V4D(-1.0, 2.0, -4.0, 2.0)
         r = self.V4D.tolerance_all([ u, v, w ])
         self.assertEqual(r, self.rel_tol * 5, msg=fail_msg)
+        r = self.V4D.tolerance_all(w)
+        self.assertEqual(r, self.rel_tol * 5, msg=fail_msg)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_tolerance_all_numpy(self):
+
+        fail_msg = "Problem with method 'tolerance_all' for NumPy arrays"
+        V4D = \
+            self.create_vector_class(
+                name = 'V4D',
+                component_names = 'abcd',
+                functions = { 'max': np.maximum },
+                abs_tol = self.abs_tol,
+                rel_tol = self.rel_tol
+            )
+        u = V4D(np.array([ -0.2, 1.0 ]), np.array([ 0.4, -2.0 ]), np.array([ 0.8, -4.0 ]), np.array([ -0.4, 2.0 ]))
+        r = V4D.tolerance_all(u)
+        self.assertEqual(r, self.rel_tol * 5, msg=fail_msg)
+        r = V4D.tolerance_all(V4D(*np.zeros((4, 3))))
+        self.assertEqual(r, self.abs_tol, msg=fail_msg)
+        v = V4D(0.0, 0.6, -0.8, 0.0)
+        r = V4D.tolerance_all([ u, v ])
+        np.testing.assert_array_equal(r, [ self.rel_tol, self.rel_tol * 5 ], err_msg=fail_msg)
+        r = V4D.tolerance_all([ v, 0.0 ])
+        self.assertEqual(r, self.rel_tol, msg=fail_msg)
 
 
     def test_tolerance_with(self):
@@ -181,7 +213,59 @@ class Test_Case_tolerant_cartesian_vector(unittest.TestCase):
     #     fail_msg = "Problem with method 'longer'"
 
 
-    # def test_round_components(self):
-    # 
-    #     fail_msg = "Problem with method 'round_components'"
+    def reference_round_components(self, v):
+
+        # The earlier definition of round_components(), built on _round_cvalue()
+        eps = v.tolerance()
+        p = -v.component_ceil(v.component_log10(eps))
+
+        return v._vector(v._round_cvalue(cv, p) for cv in v._cvalues)
+
+
+    def test_round_components(self):
+
+        fail_msg = "Problem with method 'round_components'"
+        u = self.V4D(0.0, 0.0, 0.0, 0.0)
+        self.assertEqual(u.round_components().cvalues, [ 0.0, 0.0, 0.0, 0.0 ], msg=fail_msg)
+        u = self.V4D(1.23456789012345, -2.5e-10, 3.0, -4.000000000049)
+        self.assertEqual(u.round_components().cvalues, [ 1.234567890, -0.0, 3.0, -4.0 ], msg=fail_msg)
+        self.assertEqual(u.cround.cvalues, u.round_components().cvalues, msg=fail_msg)
+        rng = random.Random(17)
+        for _ in range(500):
+            scale = 10**rng.uniform(-14, 8)
+            u = self.V4D(*(scale * rng.uniform(-1, 1) for _ in range(4)))
+            r = u.round_components()
+            self.assertEqual(r.cvalues, self.reference_round_components(u).cvalues, msg=fail_msg)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_round_components_numpy(self):
+
+        fail_msg = "Problem with method 'round_components' for NumPy arrays"
+        functions = \
+            {
+                'max': np.maximum,
+                'ceil': np.ceil,
+                'trunc': np.trunc,
+                'log10': np.log10,
+                'copysign': np.copysign
+            }
+        V4D = \
+            self.create_vector_class(
+                name = 'V4D',
+                component_names = 'abcd',
+                functions = functions,
+                abs_tol = self.abs_tol,
+                rel_tol = self.rel_tol
+            )
+        rng = np.random.default_rng(17)
+        cvalues = rng.uniform(-1, 1, (4, 300)) * 10**rng.uniform(-14, 8, 300)
+        r = V4D(*cvalues).round_components()
+        for i, cvs in enumerate(cvalues.T):
+            u = self.V4D(*cvs.tolist())
+            self.assertEqual(
+                [ cv[i] for cv in r.cvalues ],
+                self.reference_round_components(u).cvalues,
+                msg = fail_msg
+            )
 
@@ -0,0 +1,173 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import random
+import unittest
+import skvectors
+from skvectors.tolerant_containers import Tolerant_Vector_Set, Tolerant_Vector_Dict
+
+
+class Test_Case_tolerant_vector_set(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                abs_tol = 0.01,
+                rel_tol = 0.05
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_add(self):
+
+        fail_msg = "Problem with method 'add'"
+        s = Tolerant_Vector_Set(self.V3D)
+        s.add(self.V3D(1, 2, 3))
+        s.add(self.V3D(1, 2, 3.001))
+        s.add(self.V3D(1, 2, 4))
+        self.assertEqual(len(s), 2, msg=fail_msg)
+        self.assertEqual([ *s ], [ self.V3D(1, 2, 3), self.V3D(1, 2, 4) ], msg=fail_msg)
+
+
+    def test_contains(self):
+
+        fail_msg = "Problem with method '__contains__'"
+        s = Tolerant_Vector_Set(self.V3D, [ self.V3D(0, 0, 0), self.V3D(100, 0, 0) ])
+        self.assertTrue(self.V3D(0.005, 0, 0) in s, msg=fail_msg)
+        self.assertTrue(self.V3D(104, 0, 0) in s, msg=fail_msg)
+        self.assertFalse(self.V3D(0, 0, 1) in s, msg=fail_msg)
+        self.assertEqual(s.find(self.V3D(99, 0, 0)), self.V3D(100, 0, 0), msg=fail_msg)
+        self.assertIsNone(s.find(self.V3D(50, 0, 0)), msg=fail_msg)
+
+
+    def test_discard(self):
+
+        fail_msg = "Problem with method 'discard'"
+        s = Tolerant_Vector_Set(self.V3D, [ self.V3D(0, 0, 0), self.V3D(100, 0, 0) ])
+        s.discard(self.V3D(101, 0, 0))
+        self.assertEqual([ *s ], [ self.V3D(0, 0, 0) ], msg=fail_msg)
+        s.discard(self.V3D(101, 0, 0))
+        self.assertEqual(len(s), 1, msg=fail_msg)
+        with self.assertRaises(KeyError, msg=fail_msg):
+            s.remove(self.V3D(5, 0, 0))
+        s.add(self.V3D(100, 0, 0))
+        self.assertTrue(self.V3D(100, 0, 0) in s, msg=fail_msg)
+
+
+    def test_set_operations(self):
+
+        fail_msg = "Problem with set operations"
+        s = Tolerant_Vector_Set(self.V3D, [ self.V3D(0, 0, 0), self.V3D(1, 1, 1) ])
+        t = Tolerant_Vector_Set(self.V3D, [ self.V3D(1, 1, 1.001), self.V3D(2, 2, 2) ])
+        self.assertEqual(len(s | t), 3, msg=fail_msg)
+        self.assertEqual([ *(s & t) ], [ self.V3D(1, 1, 1) ], msg=fail_msg)
+        self.assertEqual([ *(s - t) ], [ self.V3D(0, 0, 0) ], msg=fail_msg)
+        u = Tolerant_Vector_Set(self.V3D, [ self.V3D(5, 5, 5) ])
+        for empty in [ s - s, s ^ s, s & u ]:
+            self.assertIsInstance(empty, Tolerant_Vector_Set, msg=fail_msg)
+            self.assertEqual(len(empty), 0, msg=fail_msg)
+            empty.add(self.V3D(1, 2, 3))
+            self.assertTrue(self.V3D(1, 2, 3.001) in empty, msg=fail_msg)
+
+
+    def test_cell_boundaries(self):
+
+        fail_msg = "Problem with vectors in neighbour cells"
+        rng = random.Random(11)
+        vectors = \
+            [
+                self.V3D(*(10**rng.uniform(-2, 3) * rng.uniform(-1, 1) for _ in range(3)))
+                for _ in range(200)
+            ]
+        s = Tolerant_Vector_Set(self.V3D, vectors)
+        for v in vectors:
+            moved = v * rng.uniform(0.97, 1.03) + self.V3D(*(rng.uniform(-0.005, 0.005) for _ in range(3)))
+            expected = any(w == moved for w in s)
+            self.assertEqual(moved in s, expected, msg=fail_msg)
+
+
+class Test_Case_tolerant_versatile_vector_set(Test_Case_tolerant_vector_set):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Versatile_Vector)
+
+
+class Test_Case_tolerant_vector_dict(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                abs_tol = 0.01,
+                rel_tol = 0.05
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_setitem_getitem(self):
+
+        fail_msg = "Problem with methods '__setitem__' and '__getitem__'"
+        d = Tolerant_Vector_Dict(self.V3D)
+        d[self.V3D(1, 2, 3)] = 'a'
+        d[self.V3D(1, 2, 3.001)] = 'b'
+        d[self.V3D(-1, 0, 0)] = 'c'
+        self.assertEqual(len(d), 2, msg=fail_msg)
+        self.assertEqual(d[self.V3D(1.001, 2, 3)], 'b', msg=fail_msg)
+        self.assertEqual([ *d.keys() ], [ self.V3D(1, 2, 3), self.V3D(-1, 0, 0) ], msg=fail_msg)
+        self.assertEqual([ *d.values() ], [ 'b', 'c' ], msg=fail_msg)
+        with self.assertRaises(KeyError, msg=fail_msg):
+            d[self.V3D(0, 0, 0)]
+        self.assertIsNone(d.get(self.V3D(0, 0, 0)), msg=fail_msg)
+        self.assertEqual(d.find_key(self.V3D(-1, 0.01, 0)), self.V3D(-1, 0, 0), msg=fail_msg)
+
+
+    def test_delitem(self):
+
+        fail_msg = "Problem with method '__delitem__'"
+        d = Tolerant_Vector_Dict(self.V3D, [ (self.V3D(1, 2, 3), 1), (self.V3D(0, 0, 0), 2) ])
+        del d[self.V3D(1, 2, 3.02)]
+        self.assertEqual([ *d.items() ], [ (self.V3D(0, 0, 0), 2) ], msg=fail_msg)
+        self.assertFalse(self.V3D(1, 2, 3) in d, msg=fail_msg)
+        with self.assertRaises(KeyError, msg=fail_msg):
+            del d[self.V3D(1, 2, 3)]
+        d.setdefault(self.V3D(1, 2, 3), [ ]).append(5)
+        d.setdefault(self.V3D(1, 2, 3.0001), [ ]).append(6)
+        self.assertEqual(d[self.V3D(1, 2, 3)], [ 5, 6 ], msg=fail_msg)
+
+
+class Test_Case_tolerant_versatile_vector_dict(Test_Case_tolerant_vector_dict):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Versatile_Vector)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import random
+import unittest
+import skvectors
+from skvectors.tolerant_index import Tolerant_Vector_Index
+
+
+class Test_Case_tolerant_vector_index(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                abs_tol = 0.01,
+                rel_tol = 0.05
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_init(self):
+
+        fail_msg = "Problem with class 'Tolerant_Vector_Index'"
+        index = Tolerant_Vector_Index(self.V3D, [ self.V3D(1, 2, 3), self.V3D(0, 0, 0) ])
+        self.assertEqual(len(index), 2, msg=fail_msg)
+        self.assertEqual([ *index ], [ self.V3D(1, 2, 3), self.V3D(0, 0, 0) ], msg=fail_msg)
+        no_abs_tol = self.create_vector_class('V3D', 'xyz', abs_tol=0.0)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            Tolerant_Vector_Index(no_abs_tol)
+        large_rel_tol = self.create_vector_class('V3D', 'xyz', rel_tol=1.0)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            Tolerant_Vector_Index(large_rel_tol)
+
+
+    def test_add(self):
+
+        fail_msg = "Problem with method 'add'"
+        index = Tolerant_Vector_Index(self.V3D)
+        self.assertEqual(index.add(self.V3D(1, 2, 3)), 0, msg=fail_msg)
+        self.assertEqual(index.add(self.V3D(1, 2, 3)), 1, msg=fail_msg)
+        self.assertEqual(index.add(0), 2, msg=fail_msg)
+        self.assertEqual(len(index), 3, msg=fail_msg)
+
+
+    def test_remove_at(self):
+
+        fail_msg = "Problem with method 'remove_at'"
+        index = Tolerant_Vector_Index(self.V3D)
+        positions = [ index.add(self.V3D(i, 0, 0)) for i in range(10) ]
+        for position in positions[:8]:
+            index.remove_at(position)
+        self.assertEqual(len(index), 2, msg=fail_msg)
+        self.assertEqual([ *index ], [ self.V3D(8, 0, 0), self.V3D(9, 0, 0) ], msg=fail_msg)
+        # The removed vectors do not leave placeholders behind
+        self.assertEqual(len(index._vectors), 2, msg=fail_msg)
+        self.assertEqual(len(index._keys), 2, msg=fail_msg)
+        with self.assertRaises(KeyError, msg=fail_msg):
+            index.remove_at(positions[0])
+        with self.assertRaises(KeyError, msg=fail_msg):
+            index.vector_at(positions[0])
+        self.assertFalse(self.V3D(0, 0, 0) in index, msg=fail_msg)
+        # Positions are not reused
+        self.assertEqual(index.add(self.V3D(0, 0, 0)), 10, msg=fail_msg)
+        self.assertEqual(index.vector_at(positions[9]), self.V3D(9, 0, 0), msg=fail_msg)
+        self.assertEqual(index.find_equal(self.V3D(0, 0, 0)), [ self.V3D(0, 0, 0) ], msg=fail_msg)
+
+
+    def test_find_equal(self):
+
+        fail_msg = "Problem with method 'find_equal'"
+        u = self.V3D(100, 0, 0)
+        v = self.V3D(104, 0, 0)
+        w = self.V3D(106, 0, 0)
+        index = Tolerant_Vector_Index(self.V3D, [ w, u, v ])
+        self.assertEqual(index.find_equal(self.V3D(100, 0, 0)), [ u, v ], msg=fail_msg)
+        self.assertEqual(index.find_equal(self.V3D(102, 3, 0)), [ w, u, v ], msg=fail_msg)
+        self.assertEqual(index.find_equal(self.V3D(0, 100, 0)), [ ], msg=fail_msg)
+        index = Tolerant_Vector_Index(self.V3D, [ self.V3D(0, 0, 0.005) ])
+        self.assertEqual(index.find_equal(0), [ self.V3D(0, 0, 0.005) ], msg=fail_msg)
+
+
+    def test_contains(self):
+
+        fail_msg = "Problem with method 'contains'"
+        index = Tolerant_Vector_Index(self.V3D, [ self.V3D(0, -10, 0) ])
+        self.assertTrue(index.contains(self.V3D(0.1, -10.2, 0.1)), msg=fail_msg)
+        self.assertFalse(index.contains(self.V3D(0, -11, 0)), msg=fail_msg)
+        self.assertTrue(self.V3D(0, -10.3, 0) in index, msg=fail_msg)
+        self.assertFalse(self.V3D(0, 10, 0) in index, msg=fail_msg)
+
+
+    def test_unique(self):
+
+        fail_msg = "Problem with method 'unique'"
+        index = Tolerant_Vector_Index(self.V3D, [ self.V3D(1, 1, 1) ])
+        vectors = \
+            [
+                self.V3D(1, 1, 1.005),
+                self.V3D(2, 2, 2),
+                self.V3D(2, 2.001, 2),
+                self.V3D(3, 3, 3)
+            ]
+        self.assertEqual(index.unique(vectors), [ vectors[1], vectors[3] ], msg=fail_msg)
+        self.assertEqual(len(index), 3, msg=fail_msg)
+
+
+    def test_agrees_with_eq(self):
+
+        fail_msg = "Problem with method 'find_equal' compared to method '__eq__'"
+        rng = random.Random(7)
+        vectors = [ ]
+        for _ in range(150):
+            scale = 10**rng.uniform(-3, 4)
+            vectors.append(self.V3D(*(scale * rng.uniform(-1, 1) for _ in range(3))))
+        queries = \
+            [
+                v * rng.uniform(0.9, 1.1) + self.V3D(*(rng.uniform(-0.01, 0.01) for _ in range(3)))
+                for v in vectors
+            ]
+        index = Tolerant_Vector_Index(self.V3D, vectors)
+        for q in queries:
+            expected = [ v for v in vectors if v == q ]
+            self.assertEqual(index.find_equal(q), expected, msg=fail_msg)
+            self.assertEqual(index.contains(q), len(expected) > 0, msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Test_Case_tolerant_versatile_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Versatile_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                functions = None,
+                abs_tol = [ 0.01, 0.01, 0.5 ],
+                rel_tol = 0.125
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_tolerance(self):
+
+        fail_msg = "Problem with method 'tolerance'"
+        u = self.V3D(2, -8, 1)
+        self.assertEqual(u.tolerance().cvalues, [ 0.25, 1.0, 0.5 ], msg=fail_msg)
+
+
+    def test_tolerance_with(self):
+
+        fail_msg = "Problem with method 'tolerance_with'"
+        u = self.V3D(2, -8, 1)
+        v = self.V3D(-4, 0, 0)
+        self.assertEqual(u.tolerance_with(v).cvalues, [ 0.5, 1.0, 0.5 ], msg=fail_msg)
+        self.assertEqual(v.tolerance_with(u).cvalues, [ 0.5, 1.0, 0.5 ], msg=fail_msg)
+
+
+    def test_tolerance_all(self):
+
+        fail_msg = "Problem with method 'tolerance_all'"
+        r = self.V3D.tolerance_all([ ])
+        self.assertEqual(r.cvalues, [ 0.01, 0.01, 0.5 ], msg=fail_msg)
+        u = self.V3D(2, -8, 1)
+        v = self.V3D(-4, 0, 0)
+        w = self.V3D(0, 16, -8)
+        r = self.V3D.tolerance_all([ u, v, w ])
+        self.assertEqual(r.cvalues, [ 0.5, 2.0, 1.0 ], msg=fail_msg)
+        r = self.V3D.tolerance_all(u)
+        self.assertEqual(r.cvalues, [ 0.25, 1.0, 0.5 ], msg=fail_msg)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_tolerance_all_numpy(self):
+
+        fail_msg = "Problem with method 'tolerance_all' for NumPy arrays"
+        V3D = \
+            self.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                functions = { 'max': np.maximum, 'abs': np.abs },
+                abs_tol = [ 0.01, 0.01, 0.5 ],
+                rel_tol = 0.125
+            )
+        u = V3D(np.array([ 2.0, -4.0, 0.0 ]), np.array([ -8.0, 0.0, 16.0 ]), np.array([ 1.0, 0.0, -8.0 ]))
+        r = V3D.tolerance_all(u)
+        self.assertEqual(r.cvalues, [ 0.5, 2.0, 1.0 ], msg=fail_msg)
+        r = V3D.tolerance_all([ u, V3D(-8, 0, 0) ])
+        np.testing.assert_array_equal(r.x, [ 1.0, 1.0, 1.0 ], err_msg=fail_msg)
+        np.testing.assert_array_equal(r.y, [ 1.0, 0.01, 2.0 ], err_msg=fail_msg)
+
+
+    def test_eq(self):
+
+        fail_msg = "Problem with method '__eq__'"
+        u = self.V3D(2, -8, 1)
+        self.assertTrue(u == self.V3D(2.2, -8.9, 0.6), msg=fail_msg)
+        self.assertFalse(u == self.V3D(2.3, -8, 1), msg=fail_msg)
+        self.assertFalse(u == self.V3D(2, -8, 1.6), msg=fail_msg)
+        fail_msg = "Problem with method '__ne__'"
+        self.assertTrue(u != self.V3D(3, -10, 2), msg=fail_msg)
+        self.assertFalse(u != self.V3D(3, -10, 1), msg=fail_msg)
+
+
+    def test_eq_components(self):
+
+        fail_msg = "Problem with method 'eq'"
+        u = self.V3D(2, -8, 1)
+        self.assertEqual(u.eq(self.V3D(2.3, -8.5, 1)).cvalues, [ False, True, True ], msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
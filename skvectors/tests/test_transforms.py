@@ -0,0 +1,196 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Test_Case_transform_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', '
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def assert_vectors_almost_equal(self, u, w, fail_msg):
+
+        for cu, cw in zip(u.cvalues, w.cvalues):
+            self.assertAlmostEqual(cu, cw, places=12, msg=fail_msg)
+
+
+    def test_identity(self):
+
+        fail_msg = "Problem with class method 'transform'"
+        t = self.V3D.transform()
+        self.assertIsInstance(t, skvectors.Transform, msg=fail_msg)
+        self.assertEqual(t.matrix(), [ [ 1, 0, 0, 0 ], [ 0, 1, 0, 0 ], [ 0, 0, 1, 0 ], [ 0, 0, 0, 1 ] ], msg=fail_msg)
+        v = self.V3D(1.5, -2, 3)
+        self.assertEqual(t(v), v, msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            skvectors.Transform(self.V3D, [ [ 1, 0 ], [ 0, 1 ] ])
+        V4D = skvectors.create_class_Cartesian_Vector('V4D', 'xyzw')
+        with self.assertRaises(ValueError, msg=fail_msg):
+            skvectors.Transform(V4D)
+
+
+    def test_pipeline(self):
+
+        fail_msg = "Problem with method 'apply'"
+        V3D = self.V3D
+        axis = V3D(1, -2, 0.5)
+        t = \
+            V3D.transform() \
+            .rotate(0.3, 'x') \
+            .rotate(-1.2, 'z') \
+            .rotate(0.7, axis) \
+            .scale(2.5) \
+            .scale([ 1, 2, 3 ]) \
+            .translate(V3D(1, 2, 3))
+        for v in [ V3D(0.5, -1, 2), V3D(0, 0, 0), V3D(-3, 4, 10) ]:
+            w = v.rotate_x(0.3).rotate_z(-1.2).axis_rotate(axis, 0.7) * 2.5 * V3D(1, 2, 3) + V3D(1, 2, 3)
+            self.assert_vectors_almost_equal(t.apply(v), w, fail_msg)
+            self.assert_vectors_almost_equal(t(v), w, fail_msg)
+        t = V3D.transform().then('reorient', V3D(1, 0, 0), V3D(0, 1, 0))
+        self.assert_vectors_almost_equal(t(V3D(2, 0, 0)), V3D(0, 2, 0), fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            V3D.transform().rotate(0.3)
+
+
+    def test_compose_and_invert(self):
+
+        fail_msg = "Problem with methods 'compose' and 'invert'"
+        V3D = self.V3D
+        t1 = V3D.transform().rotate(0.4, 'y').translate([ 1, 0, -2 ])
+        t2 = V3D.transform().scale(V3D(2, 3, 4)).rotate(-0.9, 'x')
+        v = V3D(0.25, -1.5, 2)
+        self.assert_vectors_almost_equal((t2 @ t1)(v), t2(t1(v)), fail_msg)
+        self.assert_vectors_almost_equal(t2.compose(t1)(v), t2(t1(v)), fail_msg)
+        t = t2 @ t1
+        self.assert_vectors_almost_equal(t.invert()(t(v)), v, fail_msg)
+        self.assert_vectors_almost_equal((t.invert() @ t)(v), v, fail_msg)
+        with self.assertRaises(ZeroDivisionError, msg=fail_msg):
+            V3D.transform().scale([ 1, 0, 1 ]).invert()
+        W = self.create_vector_class('W', 'xyz')
+        with self.assertRaises(TypeError, msg=fail_msg):
+            t1 @ W.transform()
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_apply_many(self):
+
+        fail_msg = "Problem with method 'apply_many'"
+        V3D = self.V3D
+        t = V3D.transform().rotate(0.3, 'x').rotate(1.1, V3D(1, 1, 1)).scale(1.5).translate([ 4, 5, 6 ])
+        rng = np.random.default_rng(2)
+        arrays = rng.standard_normal((3, 200))
+        vectors = [ V3D(*cv) for cv in arrays.T.tolist() ]
+        w = t.apply_many(vectors)
+        self.assertIsInstance(w, V3D, msg=fail_msg)
+        expected = np.array([ t(v).cvalues for v in vectors ]).T
+        np.testing.assert_allclose(w.cvalues, expected, rtol=1e-13, atol=1e-13, err_msg=fail_msg)
+        out = np.empty((3, 200))
+        w = t.apply_many(V3D(*arrays), out=out)
+        np.testing.assert_allclose(out, expected, rtol=1e-13, atol=1e-13, err_msg=fail_msg)
+        np.testing.assert_array_equal(w.cvalues, out, err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            t.apply_many(vectors, out=np.empty((3, 100)))
+        np.testing.assert_allclose(t.invert().apply_many(w).cvalues, arrays, rtol=1e-12, atol=1e-12, err_msg=fail_msg)
+
+
+    def test_apply_sequence(self):
+
+        fail_msg = "Problem with method 'apply'"
+        V3D = self.V3D
+        t = V3D.transform().rotate(0.3, 'y').translate([ 1, 2, 3 ])
+        self.assert_vectors_almost_equal(t((1, -2, 0.5)), t(V3D(1, -2, 0.5)), fail_msg)
+        self.assert_vectors_almost_equal(t([ 1, -2, 0.5 ]), t(V3D(1, -2, 0.5)), fail_msg)
+
+
+class Test_Case_transform_tolerant_cartesian_3d_vector(Test_Case_transform_cartesian_3d_vector):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_transform_numpy_units(unittest.TestCase):
+
+
+    def test_array_units(self):
+
+        fail_msg = "Problem with transforms for a class with arrays as units"
+        functions = { 'cos': np.cos, 'sin': np.sin, 'atan2': np.arctan2 }
+        V3D = skvectors.create_class_Cartesian_3D_Vector('V3D', 'xyz')
+        A = skvectors.create_class_Cartesian_3D_Vector('A', 'xyz', cnull=np.zeros(4), cunit=np.ones(4), functions=functions)
+        t = V3D.transform().rotate(0.5, 'x').rotate(0.3, V3D(1, 1, 0)).scale(V3D(1, 2, 3)).translate(V3D(1, 2, 3))
+        a = A.transform().rotate(0.5, 'x').rotate(0.3, A(1, 1, 0)).scale(A(1, 2, 3)).translate(A(1, 2, 3))
+        np.testing.assert_allclose(a.matrix(), t.matrix(), rtol=1e-15, atol=1e-15, err_msg=fail_msg)
+        rng = np.random.default_rng(5)
+        arrays = rng.standard_normal((3, 4))
+        w = a.apply_many(A(*arrays))
+        self.assertIsInstance(w, A, msg=fail_msg)
+        np.testing.assert_allclose(w.cvalues, a(A(*arrays)).cvalues, rtol=1e-13, atol=1e-13, err_msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            A.transform().translate(A(*arrays))
+
+
+    def test_dtype(self):
+
+        fail_msg = "Problem with the dtype of transformed vectors"
+        V3D = skvectors.create_class_Cartesian_3D_Vector('V3D', 'xyz', dtype=np.float32)
+        t = V3D.transform().rotate(0.5, 'z').translate([ 1, 2, 3 ])
+        w = t.apply_many(V3D(*np.ones((3, 10))))
+        for cv in w.cvalues:
+            self.assertEqual(cv.dtype, np.float32, msg=fail_msg)
+        out = np.empty((3, 10), dtype=np.float32)
+        w = t.apply_many(V3D(*np.ones((3, 10))), out=out)
+        # The rows of out are used as they are, without converting them again
+        for cv, row in zip(w._cvalues, out):
+            self.assertTrue(np.shares_memory(cv, row), msg=fail_msg)
+        with self.assertRaises(ValueError, msg=fail_msg):
+            t.apply_many(V3D(*np.ones((3, 10))), out=np.empty((3, 9), dtype=np.float32))
+
+
+class Test_Case_transform_cartesian_2d_vector(unittest.TestCase):
+
+
+    def test_transform(self):
+
+        fail_msg = "Problem with class method 'transform'"
+        V2D = skvectors.create_class_Cartesian_2D_Vector('V2D', 'xy')
+        t = V2D.transform().rotate(1.0).scale([ 2, -1 ]).translate(V2D(1, 0))
+        v = V2D(0.5, 2)
+        w = v.rotate(1.0) * V2D(2, -1) + V2D(1, 0)
+        for cu, cw in zip(t(v), w):
+            self.assertAlmostEqual(cu, cw, places=12, msg=fail_msg)
+        for cu, cv in zip(t.invert()(t(v)), v):
+            self.assertAlmostEqual(cu, cv, places=12, msg=fail_msg)
+        with self.assertRaises(TypeError, msg=fail_msg):
+            t.rotate(1.0, 'x')
+
+
+if __name__ == "__main__":
+    unittest.main()
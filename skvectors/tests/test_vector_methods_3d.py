@@ -69,6 +69,23 @@ class Test_Case_vector(unittest.TestCase):
         self.assertNotEqual(id_u_before, id_v_after, msg=fail_msg)
 
 
+    def test_constant_vectors_changed(self):
+
+        fail_msg = "Problem with class methods 'zero', 'one' and 'basis_x'"
+        self.assertIs(self.V3D.basis_x, self.V3D.basis_x, msg=fail_msg)
+        v = self.V3D.basis_x()
+        v.x = 5
+        v += 1
+        self.assertListEqual(self.V3D.basis_x().component_values(), [ 1, 0, 0 ], msg=fail_msg)
+        v = self.V3D.zero()
+        v[:] = [ 1, 2, 3 ]
+        self.assertListEqual(self.V3D.zero().component_values(), [ 0, 0, 0 ], msg=fail_msg)
+        v = self.V3D.one()
+        v *= 2
+        self.assertListEqual(self.V3D.one().component_values(), [ 1, 1, 1 ], msg=fail_msg)
+        self.assertIsNot(self.V3D.one(), self.V3D.one(), msg=fail_msg)
+
+
     def test_basis_y(self):
 
         fail_msg = "Problem with class method 'basis_y'"
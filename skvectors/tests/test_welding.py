@@ -0,0 +1,168 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+"""
+
+import unittest
+import skvectors
+
+try:
+    import numpy as np
+    from skvectors.welding import weld_points
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_weld_points(unittest.TestCase):
+
+
+    def brute_force(self, points, tolerance):
+
+        # Each point goes to the first earlier representative within the tolerance
+        labels = [ *range(len(points)) ]
+        for i in range(len(points)):
+            for j in range(i):
+                if labels[j] == j and np.sum((points[i] - points[j])**2) <= tolerance**2:
+                    labels[i] = j
+                    break
+
+        return labels
+
+
+    def test_weld_points(self):
+
+        fail_msg = "Problem with function 'weld_points'"
+        rng = np.random.default_rng(5)
+        for dimensions in [ 1, 2, 3 ]:
+            points = rng.random((200, dimensions))
+            tolerance = 0.04 / dimensions
+            positions, inverse = weld_points(points, tolerance)
+            roots = self.brute_force(points, tolerance)
+            self.assertEqual(positions.tolist(), sorted(set(roots)), msg=fail_msg)
+            self.assertEqual(positions[inverse].tolist(), roots, msg=fail_msg)
+
+
+    def test_weld_points_chain(self):
+
+        fail_msg = "Problem with function 'weld_points' for a chain of points"
+        points = np.zeros((112, 2))
+        points[:, 0] = np.arange(112) * 0.09
+        tolerance = 0.1
+        positions, inverse = weld_points(points, tolerance)
+        self.assertGreater(len(positions), 1, msg=fail_msg)
+        self.assertEqual(positions.tolist(), [ *range(0, 112, 2) ], msg=fail_msg)
+        distances = np.sqrt(np.sum((points - points[positions[inverse]])**2, axis=1))
+        self.assertTrue(np.all(distances <= tolerance), msg=fail_msg)
+
+
+    def test_weld_points_no_tolerance(self):
+
+        fail_msg = "Problem with function 'weld_points' with no tolerance"
+        points = np.array([ [ 1.0, 2.0 ], [ 0.0, 0.0 ], [ 1.0, 2.0 ], [ 1.0, 2.000001 ] ])
+        positions, inverse = weld_points(points, 0.0)
+        self.assertEqual(positions.tolist(), [ 0, 1, 3 ], msg=fail_msg)
+        self.assertEqual(inverse.tolist(), [ 0, 1, 0, 2 ], msg=fail_msg)
+        positions, inverse = weld_points(np.zeros((0, 3)), 0.1)
+        self.assertEqual(len(positions), 0, msg=fail_msg)
+        self.assertEqual(len(inverse), 0, msg=fail_msg)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class Test_Case_weld_tolerant_cartesian_3d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_3D_Vector)
+
+
+    @classmethod
+    def setUpClass(cls):
+
+        functions = \
+            {
+                'max': np.maximum,
+                'log10': np.log10,
+                'ceil': np.ceil,
+                'trunc': np.trunc,
+                'copysign': np.copysign
+            }
+        cls.V3D = \
+            cls.create_vector_class(
+                name = 'V3D',
+                component_names = 'xyz',
+                brackets = '<>',
+                sep = ', ',
+                functions = functions,
+                abs_tol = 0.01,
+                rel_tol = 0.0
+            )
+
+
+    @classmethod
+    def tearDownClass(cls):
+
+        del cls.V3D
+
+
+    def test_weld_list(self):
+
+        fail_msg = "Problem with method 'weld' for a list of vectors"
+        vectors = \
+            [
+                self.V3D(0, 0, 0),
+                self.V3D(1, 1, 1),
+                self.V3D(0.005, 0, 0),
+                self.V3D(1, 1, 1.009),
+                self.V3D(5, 5, 5)
+            ]
+        unique_vectors, inverse = self.V3D.weld(vectors)
+        self.assertEqual(len(unique_vectors), 3, msg=fail_msg)
+        self.assertIs(unique_vectors[1], vectors[1], msg=fail_msg)
+        self.assertEqual(inverse, [ 0, 1, 0, 1, 2 ], msg=fail_msg)
+        unique_vectors, inverse = self.V3D.weld(vectors, tolerance=0.001)
+        self.assertEqual(len(unique_vectors), 5, msg=fail_msg)
+
+
+    def test_weld_batch(self):
+
+        fail_msg = "Problem with method 'weld' for a batch of vectors"
+        rng = np.random.default_rng(2)
+        points = rng.random((1000, 3)) * 10
+        moved = points + rng.uniform(-0.004, 0.004, points.shape)
+        batch = self.V3D(*np.concatenate([ points, moved ]).T)
+        unique_vectors, inverse = self.V3D.weld(batch)
+        np.testing.assert_array_equal(unique_vectors.x, points[:, 0], err_msg=fail_msg)
+        np.testing.assert_array_equal(inverse, np.tile(np.arange(1000), 2), err_msg=fail_msg)
+
+
+    def test_weld_round_components(self):
+
+        fail_msg = "Problem with method 'weld' with rounded components"
+        vectors = [ self.V3D(0.001, 2.0, 0.0), self.V3D(0.004, 1.998, 0.0), self.V3D(0.006, 2.0, 0.0) ]
+        unique_vectors, inverse = self.V3D.weld(vectors, round_components=True)
+        self.assertEqual(unique_vectors, [ vectors[0].round_components(), vectors[2].round_components() ], msg=fail_msg)
+        self.assertEqual(inverse, [ 0, 0, 1 ], msg=fail_msg)
+        batch = self.V3D(*np.array([ v.cvalues for v in vectors ]).T)
+        unique_vectors, inverse = self.V3D.weld(batch, round_components=True)
+        np.testing.assert_allclose(unique_vectors.x, [ 0.0, 0.01 ], err_msg=fail_msg)
+        np.testing.assert_array_equal(inverse, [ 0, 0, 1 ], err_msg=fail_msg)
+
+
+class Test_Case_weld_tolerant_cartesian_2d_vector(unittest.TestCase):
+
+    create_vector_class = staticmethod(skvectors.create_class_Tolerant_Cartesian_2D_Vector)
+
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_weld(self):
+
+        fail_msg = "Problem with method 'weld'"
+        V2D = self.create_vector_class('V2D', 'xy', abs_tol=1e-6, rel_tol=1e-3)
+        vectors = [ V2D(1000, 0), V2D(1000.5, 0), V2D(0, 0), V2D(0, 1e-7) ]
+        unique_vectors, inverse = V2D.weld(vectors)
+        self.assertEqual(unique_vectors, [ vectors[0], vectors[2] ], msg=fail_msg)
+        self.assertEqual(inverse, [ 0, 0, 1, 1 ], msg=fail_msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Functions for reading and writing vectors from and to text files,
+e.g. CSV files or whitespace separated XYZ files. These functions need NumPy.
+"""
+
+import warnings
+from contextlib import contextmanager
+from itertools import islice
+import numpy as np
+from skvectors.fundamental_vectors import format_template
+
+
+@contextmanager
+def _open_text(path_or_file, mode):
+
+    if hasattr(path_or_file, 'read') or hasattr(path_or_file, 'write'):
+        yield path_or_file
+    else:
+        with open(path_or_file, mode) as text_file:
+            yield text_file
+
+
+def read_text(path, vector_class, *, columns=None, chunk_rows=100000, delimiter=None, skip_rows=0, comments='#', dtype=float):
+    """
+    Generator that reads vectors from a text file in chunks of chunk_rows lines
+    Each chunk is yielded as one vector with NumPy arrays as component values
+    """
+
+    dimensions = vector_class.dimensions()
+    if columns is None:
+        columns = range(dimensions)
+    columns = [ *columns ]
+    if len(columns) != dimensions:
+        msg = \
+            "The number of columns ({no_of_columns}) does not match " \
+            "the number of dimensions for {vector_class.__name__} ({dimensions})" \
+            .format(
+                no_of_columns = len(columns),
+                vector_class = vector_class,
+                dimensions = dimensions
+            )
+        raise ValueError(msg)
+    if chunk_rows < 1:
+        msg = "The number of rows in a chunk must be at least 1"
+        raise ValueError(msg)
+    with _open_text(path, 'r') as text_file:
+        lines = iter(text_file)
+        for _ in islice(lines, skip_rows):
+            pass
+        while True:
+            chunk = [ *islice(lines, chunk_rows) ]
+            if len(chunk) == 0:
+                break
+            with warnings.catch_warnings():
+                # Chunks with only comments or empty lines gives a warning
+                warnings.simplefilter('ignore', UserWarning)
+                array = \
+                    np.loadtxt(
+                        chunk,
+                        dtype = dtype,
+                        comments = comments,
+                        delimiter = delimiter,
+                        usecols = columns,
+                        ndmin = 2
+                    )
+            if array.shape[0] > 0:
+                yield vector_class(*array.T)
+
+
+def _no_of_rows(vector):
+
+    shapes = \
+        [
+            np.shape(cvs)
+            for cvs in vector._cvalues
+        ]
+    if all(len(shape) == 0 for shape in shapes):
+        rows = 1
+    else:
+        rows = max(shape[0] for shape in shapes if len(shape) > 0)
+
+    return rows
+
+
+def write_text(path, vectors, *, format_spec='', delimiter=' ', chunk_rows=10000):
+    """
+    Write vectors to a text file, one vector per line
+    vectors may be vectors with scalar component values and/or vectors with array component values
+    All the component values are formatted with format(), so the lines do not depend on how the vectors are batched
+    The lines for vectors with array component values are made and written chunk_rows lines at a time
+    """
+
+    if chunk_rows < 1:
+        msg = "The number of rows in a chunk must be at least 1"
+        raise ValueError(msg)
+    with _open_text(path, 'w') as text_file:
+        for vector in vectors:
+            # A format string for a whole line, like the one that __format__ uses
+            template = format_template(vector.dimensions(), format_spec, ('', '\n'), delimiter)
+            rows = _no_of_rows(vector)
+            columns = \
+                [
+                    np.broadcast_to(cvs, (rows,))
+                    for cvs in vector._cvalues
+                ]
+            for start in range(0, rows, chunk_rows):
+                stop = start + chunk_rows
+                text_file.writelines(map(template, *(column[start:stop].tolist() for column in columns)))
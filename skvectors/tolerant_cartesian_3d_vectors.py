@@ -9,7 +9,7 @@ from skvectors.cartesian_3d_vectors import create_class_Cartesian_3D_Vector
 from skvectors.make_tolerant import make_Cartesian_Vector_Tolerant
 
 
-def create_class_Tolerant_Cartesian_3D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, functions=None, abs_tol=1e-12, rel_tol=1e-9):
+def create_class_Tolerant_Cartesian_3D_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=0, cunit=1, dtype=None, functions=None, abs_tol=1e-12, rel_tol=1e-9, frozen=False, memoize=False, verify='cached'):
     """
     Function that creates a tolerant cartesian vector class with 3 dimensions
     The number of dimensions are determined by the number of component names
@@ -26,7 +26,11 @@ def create_class_Tolerant_Cartesian_3D_Vector(name, component_names, *, brackets
             sep = sep,
             cnull = cnull,
             cunit = cunit,
-            functions = functions
+            dtype = dtype,
+            functions = functions,
+            frozen = frozen,
+            memoize = memoize,
+            verify = verify
         )
     TC3DV = \
         make_Cartesian_Vector_Tolerant(
@@ -0,0 +1,156 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Set and dictionary for tolerant vectors, where vectors that compare equal
+(within the tolerances of their class) count as the same member or key.
+
+Tolerant equality is not transitive, so the first added of several equal vectors is the one that is kept.
+"""
+
+from collections.abc import MutableMapping, MutableSet
+
+from skvectors.tolerant_index import Tolerant_Vector_Index
+
+
+class Tolerant_Vector_Set(MutableSet):
+    """Set of tolerant vectors, with roughly constant time membership tests"""
+
+
+    def __init__(self, vector_class, vectors=()):
+
+        self._vector_class = vector_class
+        self._index = Tolerant_Vector_Index(vector_class)
+        for vector in vectors:
+            self.add(vector)
+
+
+    def _from_iterable(self, vectors):
+
+        # The results of the set operations have the same vector class as this set
+        tolerant_vector_set = type(self)(self._vector_class, vectors)
+
+        return tolerant_vector_set
+
+
+    def __len__(self):
+
+        return len(self._index)
+
+
+    def __iter__(self):
+
+        return iter(self._index)
+
+
+    def __contains__(self, vector):
+
+        return self._index.contains(vector)
+
+
+    def __repr__(self):
+
+        return '{cls.__name__}({vector_class.__name__}, {vectors!r})' \
+            .format(cls=type(self), vector_class=self._vector_class, vectors=[ *self ])
+
+
+    def add(self, vector):
+        """Add a vector if the set does not already contain an equal vector"""
+
+        if not self._index.contains(vector):
+            self._index.add(vector)
+
+
+    def discard(self, vector):
+        """Remove the vector that is equal to a vector, if there is one"""
+
+        position = self._index._first_equal_position(vector)
+        if position is not None:
+            self._index.remove_at(position)
+
+
+    def find(self, vector):
+        """The vector in the set that is equal to a vector, or None"""
+
+        position = self._index._first_equal_position(vector)
+        if position is None:
+            member = None
+        else:
+            member = self._index.vector_at(position)
+
+        return member
+
+
+class Tolerant_Vector_Dict(MutableMapping):
+    """Dictionary with tolerant vectors as keys, with roughly constant time lookups"""
+
+
+    def __init__(self, vector_class, items=(), **kwargs):
+
+        self._vector_class = vector_class
+        self._index = Tolerant_Vector_Index(vector_class)
+        self._values = { }
+        self.update(items, **kwargs)
+
+
+    def __len__(self):
+
+        return len(self._index)
+
+
+    def __iter__(self):
+
+        return iter(self._index)
+
+
+    def __repr__(self):
+
+        return '{cls.__name__}({vector_class.__name__}, {items!r})' \
+            .format(cls=type(self), vector_class=self._vector_class, items=[ *self.items() ])
+
+
+    def _position(self, key):
+
+        position = self._index._first_equal_position(key)
+        if position is None:
+            raise KeyError(key)
+
+        return position
+
+
+    def __getitem__(self, key):
+
+        return self._values[self._position(key)]
+
+
+    def __setitem__(self, key, value):
+
+        position = self._index._first_equal_position(key)
+        if position is None:
+            position = self._index.add(key)
+        self._values[position] = value
+
+
+    def __delitem__(self, key):
+
+        position = self._position(key)
+        self._index.remove_at(position)
+        del self._values[position]
+
+
+    def __contains__(self, key):
+
+        return self._index.contains(key)
+
+
+    def find_key(self, key):
+        """The key in the dictionary that is equal to a vector, or None"""
+
+        position = self._index._first_equal_position(key)
+        if position is None:
+            stored_key = None
+        else:
+            stored_key = self._index.vector_at(position)
+
+        return stored_key
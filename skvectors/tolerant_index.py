@@ -0,0 +1,292 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Spatial hash index for finding vectors that are equal within the tolerance of a tolerant vector class.
+
+The tolerance of a vector grows with its length, so the vectors are stored at levels.
+At level k the grid has cells of size abs_tol * 2**k, and a vector is stored
+at the lowest level where the cell size is not smaller than its tolerance.
+For tolerant versatile vectors, which are compared component by component,
+each component value gets its own level and cell.
+"""
+
+import math
+from collections import OrderedDict
+from itertools import product
+
+# Widens the searches a little, so that rounding errors can not make them miss equal vectors
+_SLACK = 1 + 2**-20
+
+
+def _verify_tolerances(vector_class, abs_tol, rel_tol):
+
+    if not abs_tol > 0:
+        msg = \
+            "The absolute tolerance of {vector_class.__name__} must be larger than 0 for an index" \
+            .format_map(vars())
+        raise ValueError(msg)
+    if not 0 <= rel_tol < 1:
+        msg = \
+            "The relative tolerance of {vector_class.__name__} must be at least 0 and less than 1 for an index" \
+            .format_map(vars())
+        raise ValueError(msg)
+
+
+def _level(eps, abs_tol):
+
+    if eps <= abs_tol:
+        level = 0
+    else:
+        level = max(0, math.ceil(math.log2(eps / abs_tol)))
+        # Make sure that rounding errors do not give a too small cell
+        while abs_tol * 2**level < eps:
+            level += 1
+
+    return level
+
+
+def _levels_to_search(magnitude, eps, abs_tol, rel_tol):
+    """The levels where values that may be equal to a value with this magnitude and tolerance are stored"""
+
+    min_magnitude = max(0, min(magnitude - eps, magnitude / (1 + rel_tol)) / _SLACK)
+    max_magnitude = max(magnitude + eps, magnitude / (1 - rel_tol)) * _SLACK
+    min_level = _level(max(abs_tol, min_magnitude * rel_tol), abs_tol)
+    max_level = _level(max(abs_tol, max_magnitude * rel_tol), abs_tol)
+
+    return range(min_level, max_level + 1)
+
+
+def _cell_range(value, radius, cell_size):
+
+    return range(math.floor((value - radius) / cell_size), math.floor((value + radius) / cell_size) + 1)
+
+
+class Tolerant_Vector_Index:
+    """
+    Index of tolerant cartesian or tolerant versatile vectors
+    Lookups take roughly constant time and agree with the vector class' __eq__ method
+    The vectors must not be changed while they are in the index
+    Positions are given in increasing order and are not reused after a vector is removed
+    """
+
+
+    def __init__(self, vector_class, vectors=()):
+
+        self._componentwise = hasattr(vector_class, 'abs_tolerances')
+        if self._componentwise:
+            abs_tols = vector_class.abs_tolerances
+            rel_tols = vector_class.rel_tolerances
+        else:
+            abs_tols = [ vector_class.abs_tol ]
+            rel_tols = [ vector_class.rel_tol ]
+        for abs_tol, rel_tol in zip(abs_tols, rel_tols):
+            _verify_tolerances(vector_class, abs_tol, rel_tol)
+        self._vector_class = vector_class
+        self._abs_tols = abs_tols
+        self._rel_tols = rel_tols
+        # Positions to vectors and cell keys, in the order that the vectors were added
+        self._vectors = OrderedDict()
+        self._keys = { }
+        self._next_position = 0
+        self._cells = { }
+        for vector in vectors:
+            self.add(vector)
+
+
+    def __len__(self):
+
+        return len(self._vectors)
+
+
+    def __iter__(self):
+
+        return iter(self._vectors.values())
+
+
+    def _ensure_is_vector(self, vector):
+
+        vector_class = self._vector_class
+        if not vector_class.is_vector(vector):
+            vector = vector_class.fill(vector)
+
+        return vector
+
+
+    def _key(self, vector):
+
+        if self._componentwise:
+            cvalues = vector._cvalues
+            levels = \
+                [
+                    _level(eps, abs_tol)
+                    for eps, abs_tol in zip(vector._epsilon_1(cvalues), self._abs_tols)
+                ]
+            key = \
+                tuple(
+                    (level, math.floor(cv / (abs_tol * 2**level)))
+                    for cv, level, abs_tol in zip(cvalues, levels, self._abs_tols)
+                )
+        else:
+            abs_tol = self._abs_tols[0]
+            level = _level(vector.tolerance(), abs_tol)
+            cell_size = abs_tol * 2**level
+            key = \
+                (
+                    level,
+                    *(
+                        math.floor(cv / cell_size)
+                        for cv in vector._cvalues
+                    )
+                )
+
+        return key
+
+
+    def _candidate_keys(self, vector):
+
+        if self._componentwise:
+            component_cells = [ ]
+            cvalues = vector._cvalues
+            for cv, eps, abs_tol, rel_tol in zip(cvalues, vector._epsilon_1(cvalues), self._abs_tols, self._rel_tols):
+                own_cell_size = abs_tol * 2**_level(eps, abs_tol)
+                cells = [ ]
+                for level in _levels_to_search(abs(cv), eps, abs_tol, rel_tol):
+                    cell_size = abs_tol * 2**level
+                    # Equal values are never further apart than the largest of their tolerances
+                    radius = max(own_cell_size, cell_size) * _SLACK
+                    cells.extend((level, i) for i in _cell_range(cv, radius, cell_size))
+                component_cells.append(cells)
+            yield from product(*component_cells)
+        else:
+            abs_tol = self._abs_tols[0]
+            rel_tol = self._rel_tols[0]
+            eps = vector.tolerance()
+            own_cell_size = abs_tol * 2**_level(eps, abs_tol)
+            for level in _levels_to_search(vector.length(), eps, abs_tol, rel_tol):
+                cell_size = abs_tol * 2**level
+                # Equal vectors are never further apart than the largest of their tolerances
+                radius = max(own_cell_size, cell_size) * _SLACK
+                index_ranges = \
+                    [
+                        _cell_range(cv, radius, cell_size)
+                        for cv in vector._cvalues
+                    ]
+                yield from product([ level ], *index_ranges)
+
+
+    def _candidate_positions(self, vector):
+
+        cells = self._cells
+        for key in self._candidate_keys(vector):
+            yield from cells.get(key, ())
+
+
+    def add(self, vector):
+        """Add a vector to the index and return its position"""
+
+        vector = self._ensure_is_vector(vector)
+        position = self._next_position
+        key = self._key(vector)
+        self._vectors[position] = vector
+        self._keys[position] = key
+        self._cells.setdefault(key, [ ]).append(position)
+        self._next_position += 1
+
+        return position
+
+
+    def remove_at(self, position):
+        """Remove the vector at a position from the index"""
+
+        key = self._keys.pop(position, None)
+        if key is None:
+            msg = "There is no vector at position {position}".format_map(vars())
+            raise KeyError(msg)
+        cell = self._cells[key]
+        cell.remove(position)
+        if len(cell) == 0:
+            del self._cells[key]
+        del self._vectors[position]
+
+
+    def vector_at(self, position):
+        """The vector at a position"""
+
+        if position not in self._vectors:
+            msg = "There is no vector at position {position}".format_map(vars())
+            raise KeyError(msg)
+
+        return self._vectors[position]
+
+
+    def _equal_positions(self, vector):
+
+        vector = self._ensure_is_vector(vector)
+        vectors = self._vectors
+        positions = \
+            sorted(
+                position
+                for position in self._candidate_positions(vector)
+                if vectors[position] == vector
+            )
+
+        return positions
+
+
+    def _first_equal_position(self, vector):
+
+        positions = self._equal_positions(vector)
+        if len(positions) == 0:
+            position = None
+        else:
+            position = positions[0]
+
+        return position
+
+
+    def find_equal(self, vector):
+        """List of the vectors in the index that are equal to a vector, in the order they were added"""
+
+        vectors = self._vectors
+        equal_vectors = \
+            [
+                vectors[position]
+                for position in self._equal_positions(vector)
+            ]
+
+        return equal_vectors
+
+
+    def contains(self, vector):
+        """Check if the index contains a vector that is equal to a vector"""
+
+        vector = self._ensure_is_vector(vector)
+        vectors = self._vectors
+        found = \
+            any(
+                vectors[position] == vector
+                for position in self._candidate_positions(vector)
+            )
+
+        return found
+
+
+    __contains__ = contains
+
+
+    def unique(self, vectors):
+        """
+        List of the vectors that are not equal to any vector in the index or to any earlier vector in vectors
+        These vectors are added to the index
+        """
+
+        unique_vectors = [ ]
+        for vector in vectors:
+            vector = self._ensure_is_vector(vector)
+            if not self.contains(vector):
+                self.add(vector)
+                unique_vectors.append(vector)
+
+        return unique_vectors
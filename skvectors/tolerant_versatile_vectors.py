@@ -31,7 +31,7 @@ def epsilon(*, abs_tol, rel_tol, values):
     return eps
 
 
-def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<>', sep=', ', functions=None, abs_tol=1e-12, rel_tol=1e-9):
+def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<>', sep=', ', functions=None, abs_tol=1e-12, rel_tol=1e-9, frozen=False):
     """
     Function that creates a tolerant versatile vector class
     The number of dimensions are determined by the number of component names
@@ -46,7 +46,8 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
             component_names = component_names,
             brackets = brackets,
             sep = sep,
-            functions = functions
+            functions = functions,
+            frozen = frozen
         )
 
 
@@ -148,6 +149,8 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
             dunder_compare_method.__name__ = method_name
             dunder_compare_method.__doc__ = method_doc
             setattr(cls, method_name, dunder_compare_method)
+        # Tolerantly equal vectors can have different component values, so they can not have equal hash values
+        cls.__hash__ = None
 
         return cls
 
@@ -163,12 +166,12 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
                 'and',
                 'or',
                 # 'any',
+                'all',
                 'max',
                 'abs'
             ]
 
 
-### Needs more testing
         @classmethod
         def _epsilon_1(cls, cvalues):
 
@@ -176,7 +179,7 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
                 (
                     cls.component_max(
                         cls.abs_tolerances[i],
-                        cvalues[i]*cls.rel_tolerances[i]
+                        cls.component_abs(cvalues[i])*cls.rel_tolerances[i]
                     )
                     for i in range(cls._dimensions)
                 )
@@ -184,7 +187,6 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
             return eps
 
 
-### Needs more testing
         @classmethod
         def _epsilon_2(cls, cvalues_1, cvalues_2):
 
@@ -192,7 +194,10 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
                 (
                     cls.component_max(
                         cls.abs_tolerances[i],
-                        cls.component_max(cvalues_1[i], cvalues_2[i])*cls.rel_tolerances[i]
+                        cls.component_max(
+                            cls.component_abs(cvalues_1[i]),
+                            cls.component_abs(cvalues_2[i])
+                        )*cls.rel_tolerances[i]
                     )
                     for i in range(cls._dimensions)
                 )
@@ -200,21 +205,18 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
             return eps
 
 
-### Needs more testing
         @classmethod
-        def _epsilon_n(cls, cvalues_n, i):
+        def _epsilon_n(cls, cvalues_n, i, axis=0):
             """Calculates a common tolerance value (epsilon) for all the values"""
 
             abs_tol = cls.abs_tolerances[i]
             rel_tol = cls.rel_tolerances[i]
-            eps = \
-                cls.component_max(
-                    abs_tol,
-                    cls.component_max(
-                        cls.component_abs(cv)
-                        for cv in cvalues_n
-                    )*rel_tol  ### This does not always work
-                )
+            if hasattr(cvalues_n, 'shape') or not hasattr(cvalues_n, '__iter__'):
+                abs_values = cls.component_abs(cvalues_n)
+            else:
+                abs_values = map(cls.component_abs, cvalues_n)
+            max_abs_value = hf.max_of_values(cls.component_max, abs_values, axis)
+            eps = cls.component_max(abs_tol, max_abs_value*rel_tol)
 
             return eps
 
@@ -232,27 +234,46 @@ def create_class_Tolerant_Versatile_Vector(name, component_names, *, brackets='<
             return result
 
 
-### Needs more testing
         @classmethod
         def tolerance_all(cls, vectors):
-            """Calculate a tolerance for each of the components of several vectors"""  ###
-
-            vectors = tuple(cls._ensure_all_are_vectors(vectors))
-            cvalues = \
-                (
-                    cls._epsilon_n(cls._component_from_vectors(vectors, i), i)
-                    for i in range(cls._dimensions)
-                )
+            """
+            Calculate a tolerance for each of the components of several vectors
+            A vector with arrays as component values counts as all the vectors in the arrays
+            """
+
+            if cls.is_vector(vectors):
+                cvalues = \
+                    (
+                        cls._epsilon_n(vectors._cvalues[i], i, axis=None)
+                        for i in range(cls._dimensions)
+                    )
+            else:
+                vectors = tuple(cls._ensure_all_are_vectors(vectors))
+                cvalues = \
+                    (
+                        cls._epsilon_n(cls._component_from_vectors(vectors, i), i)
+                        for i in range(cls._dimensions)
+                    )
             vector = cls(*cvalues, _internal=True)
 
             return vector
 
 
-### TODO
-#         def tolerance_with(self, other):
-#             """Calculate a common tolerance for two vectors based on their lengths"""
-#
-#             return
+        @hf.ensure_other_is_vector
+        def tolerance_with(self, other):
+            """Calculate a common tolerance for each of the components of two vectors"""
+
+            vector = self._vector(self._epsilon_2(self._cvalues, other._cvalues))
+
+            return vector
+
+
+        def tolerance(self):
+            """Calculate a tolerance for each of the components of a vector"""
+
+            vector = self._vector(self._epsilon_1(self._cvalues))
+
+            return vector
 
 
         @hf.ensure_other_is_vector
@@ -0,0 +1,275 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Affine transforms for the vectors of 2D and 3D cartesian vector classes.
+
+A transform is a homogeneous matrix, so a chain of rotations, scalings and translations
+is composed into one matrix once, instead of evaluating the trigonometric functions and
+making intermediate vectors for every vector it is applied to. The rotations are made
+from the rotation methods of the vector class, so they turn vectors the same way.
+"""
+
+from functools import reduce
+import operator
+
+
+def _product(matrix_a, matrix_b):
+
+    n = len(matrix_a)
+    product = \
+        [
+            [
+                reduce(operator.add, (matrix_a[i][k] * matrix_b[k][j] for k in range(n)))
+                for j in range(n)
+            ]
+            for i in range(n)
+        ]
+
+    return product
+
+
+def _matrix_value(value):
+
+    # For classes with arrays as units, the basis vectors and the vectors made from numbers have arrays with equal values
+    try:
+        value.shape
+    except AttributeError:
+        return value
+    import numpy as np
+    array = np.asarray(value)
+    if array.ndim == 0:
+        return array.item()
+    first = array.flat[0]
+    if not (array == first).all():
+        msg = "The values in the matrix of a transform must be the same for all the vectors"
+        raise ValueError(msg)
+
+    return first.item()
+
+
+class Transform:
+    """
+    Affine transform for the vectors of a 2D or 3D cartesian vector class, as a homogeneous matrix
+    The methods that add steps return new transforms that apply the steps after the transform
+    """
+
+    def __init__(self, vector_class, matrix=None):
+
+        dimensions = vector_class.dimensions()
+        if dimensions not in (2, 3):
+            msg = "Transforms are for vector classes with 2 or 3 dimensions, not {dimensions}".format_map(vars())
+            raise ValueError(msg)
+        self.vector_class = vector_class
+        n = dimensions + 1
+        if matrix is None:
+            matrix = [ [ int(i == j) for j in range(n) ] for i in range(n) ]
+        matrix = tuple(tuple(_matrix_value(value) for value in row) for row in matrix)
+        if (len(matrix) != n) or any(len(row) != n for row in matrix):
+            msg = "The matrix must have {n} rows with {n} values each".format_map(vars())
+            raise ValueError(msg)
+        self._matrix = matrix
+        # Rows of the linear part and the translation as vectors, for applying the transform to single vectors
+        self._rows = [ vector_class(*row[:dimensions], _internal=True) for row in matrix[:dimensions] ]
+        self._translation = vector_class(*(row[dimensions] for row in matrix[:dimensions]), _internal=True)
+
+
+    def __repr__(self):
+
+        return "Transform({cls.__name__}, {matrix})".format(cls=self.vector_class, matrix=self.matrix())
+
+
+    def matrix(self):
+        """The homogeneous matrix as a list of rows"""
+
+        return [ list(row) for row in self._matrix ]
+
+
+    def compose(self, other):
+        """The transform that applies another transform first and then this transform"""
+
+        if other.vector_class is not self.vector_class:
+            msg = "The transforms are for different vector classes"
+            raise TypeError(msg)
+
+        return Transform(self.vector_class, _product(self._matrix, other._matrix))
+
+
+    def __matmul__(self, other):
+
+        return self.compose(other)
+
+
+    def _then(self, matrix):
+
+        return Transform(self.vector_class, _product(matrix, self._matrix))
+
+
+    def _linear_matrix(self, function):
+
+        # The columns are the basis vectors mapped by the function
+        cls = self.vector_class
+        dimensions = cls.dimensions()
+        columns = \
+            [
+                function(getattr(cls, 'basis_' + cname)())._cvalues
+                for cname in cls.component_names()
+            ]
+        matrix = \
+            [
+                [ *(column[i] for column in columns), 0 ]
+                for i in range(dimensions)
+            ]
+        matrix.append([ *[ 0 ] * dimensions, 1 ])
+
+        return matrix
+
+
+    def then(self, method_name, *args):
+        """The transform followed by a linear method of the vector class, e.g. then('reorient', u, w)"""
+
+        matrix = self._linear_matrix(lambda vector: getattr(vector, method_name)(*args))
+
+        return self._then(matrix)
+
+
+    def rotate(self, angle, axis=None):
+        """
+        The transform followed by a rotation by an angle in radians
+        For 3D vectors the axis is a component name (e.g. 'x') or a vector to rotate around
+        """
+
+        cls = self.vector_class
+        if cls.dimensions() == 2:
+            if axis is not None:
+                msg = "2D vectors are not rotated around an axis"
+                raise TypeError(msg)
+            transform = self.then('rotate', angle)
+        elif axis is None:
+            msg = "3D vectors must be rotated around an axis"
+            raise TypeError(msg)
+        elif cls.is_vector(axis):
+            transform = self.then('axis_rotate', axis, angle)
+        else:
+            transform = self.then('rotate_' + axis, angle)
+
+        return transform
+
+
+    def scale(self, factors):
+        """The transform followed by a scaling by a factor or by a factor for each axis"""
+
+        dimensions = self.vector_class.dimensions()
+        if self.vector_class.is_vector(factors):
+            factors = factors._cvalues
+        else:
+            try:
+                factors = [ *factors ]
+            except TypeError:
+                factors = [ factors ] * dimensions
+        matrix = \
+            [
+                [ factors[i] if (i == j) else 0 for j in range(dimensions) ] + [ 0 ]
+                for i in range(dimensions)
+            ]
+        matrix.append([ *[ 0 ] * dimensions, 1 ])
+
+        return self._then(matrix)
+
+
+    def translate(self, offset):
+        """The transform followed by a translation by an offset vector (or sequence)"""
+
+        dimensions = self.vector_class.dimensions()
+        if self.vector_class.is_vector(offset):
+            offset = offset._cvalues
+        matrix = \
+            [
+                [ int(i == j) for j in range(dimensions) ] + [ offset[i] ]
+                for i in range(dimensions)
+            ]
+        matrix.append([ *[ 0 ] * dimensions, 1 ])
+
+        return self._then(matrix)
+
+
+    def invert(self):
+        """The inverse transform"""
+
+        dimensions = self.vector_class.dimensions()
+        linear = [ list(row[:dimensions]) for row in self._matrix[:dimensions] ]
+        inverse = [ [ int(i == j) for j in range(dimensions) ] for i in range(dimensions) ]
+        # Gauss-Jordan elimination with partial pivoting
+        for col in range(dimensions):
+            pivot_row = max(range(col, dimensions), key=lambda row: abs(linear[row][col]))
+            pivot = linear[pivot_row][col]
+            if pivot == 0:
+                msg = "The transform can not be inverted"
+                raise ZeroDivisionError(msg)
+            linear[col], linear[pivot_row] = linear[pivot_row], linear[col]
+            inverse[col], inverse[pivot_row] = inverse[pivot_row], inverse[col]
+            linear[col] = [ value / pivot for value in linear[col] ]
+            inverse[col] = [ value / pivot for value in inverse[col] ]
+            for row in range(dimensions):
+                if row != col:
+                    factor = linear[row][col]
+                    linear[row] = [ value - factor * value_col for value, value_col in zip(linear[row], linear[col]) ]
+                    inverse[row] = [ value - factor * value_col for value, value_col in zip(inverse[row], inverse[col]) ]
+        translation = [ row[dimensions] for row in self._matrix[:dimensions] ]
+        matrix = \
+            [
+                row + [ -reduce(operator.add, map(operator.mul, row, translation)) ]
+                for row in inverse
+            ]
+        matrix.append([ *[ 0 ] * dimensions, 1 ])
+
+        return Transform(self.vector_class, matrix)
+
+
+    def apply(self, vector):
+        """
+        The transformed vector (the components may be of any type that the vector class supports)
+        The vector may also be given as a sequence of component values
+        """
+
+        if not self.vector_class.is_vector(vector):
+            vector = self.vector_class(*vector)
+        transformed = vector._mmult(*self._rows) + self._translation
+
+        return transformed
+
+
+    def __call__(self, vector):
+
+        return self.apply(vector)
+
+
+    def apply_many(self, vectors, out=None):
+        """
+        The transformed vectors of a batch as a vector with arrays as component values (needs NumPy)
+        The batch may be an iterable of vectors or a vector with arrays as component values
+        The whole batch is transformed with a single matrix multiplication, also into out (shape (2 or 3, n)) if given
+        The result has the component dtype of the vector class, or float64 if it has none
+        """
+
+        import numpy as np
+        from skvectors.batches import as_points
+
+        cls = self.vector_class
+        dimensions = cls.dimensions()
+        points, _ = as_points(cls, vectors)
+        dtype = cls.component_dtype()
+        if dtype is None:
+            dtype = float
+        matrix = np.array(self._matrix, dtype=dtype)
+        shape = (dimensions, len(points))
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            msg = "The shape of out {out.shape} must be {shape}".format_map(vars())
+            raise ValueError(msg)
+        np.matmul(matrix[:dimensions, :dimensions], points.T, out=out)
+        out += matrix[:dimensions, dimensions:]
+
+        return cls(*out, _internal=True)
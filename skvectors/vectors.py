@@ -4,21 +4,92 @@ https://github.com/t-o-k/scikit-vectors
 Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
 """
 
+import hashlib
 import operator
 import math
+from collections import OrderedDict
 from copy import copy
 from functools import reduce
+from types import MethodType
 import skvectors.helper_functions as hf
 from skvectors.simple_vectors import create_class_Simple_Vector
 
+# The signatures of the cnull and cunit values (and the functions for eq and all) that have passed verify_units()
+# The oldest signatures are forgotten when there are more than _max_verified_units of them
+_verified_units = OrderedDict()
 
-def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=None, cunit=None, functions=None):
+_max_verified_units = 1024
+
+_verify_modes = ('full', 'cached', 'off')
+
+
+def _units_signature(value):
+    """
+    Signature with the type, dtype, shape and the value (or a digest of the bytes of the values) of a cnull or cunit value
+    A digest is used for arrays, so that the signatures of large arrays are small and still do not collide
+    None is returned if no signature can be made, e.g. for unhashable values or arrays of objects
+    """
+
+    dtype = getattr(value, 'dtype', None)
+    shape = getattr(value, 'shape', None)
+    # Pandas objects are converted to NumPy arrays, but their labels also matter in comparisons
+    to_numpy = getattr(value, 'to_numpy', None)
+    array = value if to_numpy is None else to_numpy()
+    tobytes = getattr(array, 'tobytes', None)
+    try:
+        if tobytes is None:
+            values = value
+        elif getattr(array, 'dtype', None) == object:
+            return None
+        else:
+            values = hashlib.sha256(tobytes()).digest()
+        labels = \
+            tuple(
+                tuple(getattr(value, attribute_name))
+                for attribute_name in ('index', 'columns')
+                if to_numpy is not None and hasattr(value, attribute_name)
+            )
+        if labels:
+            labels = hashlib.sha256(repr(labels).encode()).digest()
+        signature = (type(value), str(dtype), shape, values, labels)
+    except TypeError:
+        signature = None
+
+    return signature
+
+
+def _constant_vector(cls, attribute_name, cvalues):
+    """
+    Vector with constant component values, like the zero, one and basis vectors
+    A frozen class makes it once and then returns the same vector every time
+    The vectors of other classes share the component values, but they are replaced (not changed) when the vectors are changed
+    """
+
+    if not cls._frozen:
+        return cls(*cvalues, _internal=True)
+    try:
+        vector = vars(cls)[attribute_name]
+    except KeyError:
+        vector = cls(*cvalues, _internal=True)
+        setattr(cls, attribute_name, vector)
+
+    return vector
+
+
+def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull=None, cunit=None, dtype=None, functions=None, frozen=False, verify='cached'):
     """
     Function that makes a creates class
     The number of dimensions are determined by the number of component names
+    If a NumPy dtype is given, cnull, cunit and all the component values are converted to it,
+    and NumPy functions are used for the functions that are not given
+    The verification of cnull and cunit is done every time if verify is 'full', skipped if it is 'off',
+    and done once for each signature (type, dtype, shape and values) of cnull and cunit if it is 'cached'
     """
 
     hf.verify_class_name(name)
+    if verify not in _verify_modes:
+        msg = "The value for verify must be 'full', 'cached' or 'off'"
+        raise ValueError(msg)
     if functions is None:
         functions = { }
 
@@ -110,26 +181,66 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
             raise TypeError(msg)
         cnull = copy(cnull)
         cunit = copy(cunit)
-    verify_units(cnull, cunit)
+    if dtype is None:
+        to_dtype = None
+    else:
+        import numpy as np
+
+        dtype = np.dtype(dtype)
+
+
+        def to_dtype(value):
+            """Convert a value (a scalar, a NumPy array or a Pandas object) to the dtype of the class"""
+
+            value_dtype = getattr(value, 'dtype', None)
+            if (value_dtype is None) or (value_dtype != dtype):
+                astype = getattr(value, 'astype', None)
+                if astype is None:
+                    value = dtype.type(value)
+                else:
+                    value = astype(dtype)
+
+            return value
+
+
+        cnull = to_dtype(cnull)
+        cunit = to_dtype(cunit)
+    units_key = None
+    if verify == 'cached':
+        cnull_signature = _units_signature(cnull)
+        cunit_signature = _units_signature(cunit)
+        if (cnull_signature is not None) and (cunit_signature is not None):
+            units_key = (cnull_signature, cunit_signature, functions.get('eq'), functions.get('all'))
+            try:
+                hash(units_key)
+            except TypeError:
+                # E.g. for eq or all functions that are not hashable
+                units_key = None
+    if (verify != 'off') and (units_key not in _verified_units):
+        verify_units(cnull, cunit)
+        if units_key is not None:
+            while len(_verified_units) >= _max_verified_units:
+                _verified_units.popitem(last=False)
+            _verified_units[units_key] = None
     SV = \
         create_class_Simple_Vector(
             name = 'SV_' + name,
             component_names = component_names,
             brackets = brackets,
-            sep = sep
+            sep = sep,
+            frozen = frozen
         )
 
 
     def make_zero_vector_method(cls):
 
-        cnull = cls._cnull
-        cvalues = [ cnull ] * cls._dimensions
+        cvalues = (cls._cnull,) * cls._dimensions
 
 
         def zero(cls):
             """Vector with all components values set to 'cnull'"""
 
-            return cls(*cvalues, _internal=True)
+            return _constant_vector(cls, '_zero_vector', cvalues)
 
 
         cls.zero = classmethod(zero)
@@ -137,14 +248,13 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
 
     def make_one_vector_method(cls):
 
-        cunit = cls._cunit
-        cvalues = [ cunit ] * cls._dimensions
+        cvalues = (cls._cunit,) * cls._dimensions
 
 
         def one(cls):
             """Vector with all components values set to 'cunit'"""
 
-            return cls(*cvalues, _internal=True)
+            return _constant_vector(cls, '_one_vector', cvalues)
 
 
         cls.one = classmethod(one)
@@ -161,13 +271,28 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
 
                 self.method_name = basis_name
                 self.cname = cname
+                # The method is bound once for each class it is used from
+                self.bound_name = '_' + basis_name + '_method'
                 cnull = owner._cnull
                 cunit = owner._cunit
-                self.cvalues = \
-                    [
+                cvalues = \
+                    tuple(
                         cunit if (i == index) else cnull
                         for i in range(owner._dimensions)
-                    ]
+                    )
+                vector_name = '_' + basis_name + '_vector'
+
+
+                def basis_vector(cls):
+
+                    return _constant_vector(cls, vector_name, cvalues)
+
+
+                basis_vector.__name__ = basis_name
+                basis_vector.__doc__ = \
+                    "Basis vector, with length 'cunit' along the {cname}-axis" \
+                    .format_map(vars())
+                self.basis_vector = basis_vector
 
 
             def __set__(self, instance, value):
@@ -181,20 +306,13 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
 
             def __get__(self, instance, owner):
 
+                try:
+                    method = vars(owner)[self.bound_name]
+                except KeyError:
+                    method = MethodType(self.basis_vector, owner)
+                    setattr(owner, self.bound_name, method)
 
-                def basis_vector():
-
-                    vector = owner(*self.cvalues, _internal=True)
-
-                    return vector
-
-
-                basis_vector.__name__ = self.method_name
-                basis_vector.__doc__ = \
-                    "Basis vector, with length 'cunit' along the {self.cname}-axis" \
-                    .format_map(vars())
-
-                return basis_vector
+                return method
 
 
         for index, cname in enumerate(cls._cnames):
@@ -205,6 +323,8 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
     def init_Vector(cls):
         """Initialize class"""
 
+        # The dtype decides the default internal functions
+        cls._dtype = dtype
         hf.setup_vector_class(cls=cls, name=name, functions=functions)
         cls._cnull = cnull
         cls._cunit = cunit
@@ -303,14 +423,19 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
             return cunit
 
 
+        @classmethod
+        def _fill_value(cls, value):
+
+            return cls._cunit * value
+
+
         @classmethod
         def fill(cls, value):
             """A vector with all component values set to value"""
 
-            cunit = cls._cunit
             cvalues = \
                 (
-                    cunit * value
+                    cls._fill_value(value)
                     for _ in range(cls._dimensions)
                 )
             vector = cls(*cvalues, _internal=True)
@@ -358,6 +483,35 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
                             cunit * cv
                             for cv in cvalues
                         ]
+            self._coerce_cvalues()
+            if self._frozen:
+                self._cvalues = tuple(self._cvalues)
+
+
+        def _coerce_cvalues(self):
+
+            if to_dtype is not None:
+                self._cvalues = [ *map(to_dtype, self._cvalues) ]
+
+
+        @classmethod
+        def _coerce_value(cls, value):
+            """
+            A value calculated from component values, with the dtype of the class
+            (Older NumPy versions promote the results of operations on scalars to float64)
+            """
+
+            if to_dtype is not None:
+                value = to_dtype(value)
+
+            return value
+
+
+        @classmethod
+        def component_dtype(cls):
+            """The NumPy dtype of the component values, or None if the class has no fixed dtype"""
+
+            return cls._dtype
 
 
         def is_zero_vector(self):
@@ -403,6 +557,7 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
         def __setitem__(self, index, values):
             """Change vector component values by indexing"""
 
+            self._verify_not_frozen()
             cunit = self._cunit
             if isinstance(index, int):
                 cvalues = cunit * values
@@ -427,6 +582,8 @@ def create_class_Vector(name, component_names, *, brackets='<>', sep=', ', cnull
                      .format(type_index=type(index))
                 raise TypeError(msg)
             self._cvalues[index] = cvalues
+            self._coerce_cvalues()
+            self._clear_memo()
 
 
         def __floor__(self):
@@ -10,7 +10,7 @@ import skvectors.helper_functions as hf
 from skvectors.simple_vectors import create_class_Simple_Vector
 
 
-def create_class_Versatile_Vector(name, component_names, *, brackets='<>', sep=', ', functions=None):
+def create_class_Versatile_Vector(name, component_names, *, brackets='<>', sep=', ', functions=None, frozen=False):
     """
     Function that creates a versatile vector class
     The number of dimensions are determined by the number of component names
@@ -25,7 +25,8 @@ def create_class_Versatile_Vector(name, component_names, *, brackets='<>', sep='
             name = 'SV_' + name,
             component_names = component_names,
             brackets = brackets,
-            sep = sep
+            sep = sep,
+            frozen = frozen
         )
 
 
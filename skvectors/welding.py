@@ -0,0 +1,144 @@
+"""
+Copyright (c) 2019 Tor Olav Kristensen, http://subcube.com
+https://github.com/t-o-k/scikit-vectors
+Use of this source code is governed by a BSD-license that can be found in the LICENSE file.
+
+Welding of points, i.e. collapsing points that are near each other. It needs NumPy.
+
+The points are hashed into grid cells of the same size as the tolerance, so only
+points in neighbouring cells are compared. The points are welded greedily in their order:
+a point is welded to the first earlier representative that is within the tolerance,
+or else it becomes a representative. So every point is within the tolerance of its
+representative, even when the points form a chain.
+"""
+
+from itertools import product
+import numpy as np
+
+# Large odd numbers for hashing the integer cell coordinates
+_HASH_MULTIPLIERS = \
+    np.array(
+        [
+            0x9E3779B97F4A7C15,
+            0xC2B2AE3D27D4EB4F,
+            0x165667B19E3779F9,
+            0xD6E8FEB86659FD93
+        ],
+        dtype = np.uint64
+    )
+
+
+def _hash_cells(cells):
+
+    multipliers = np.resize(_HASH_MULTIPLIERS, cells.shape[1])
+    with np.errstate(over='ignore'):
+        hashes = (cells.astype(np.uint64) * multipliers).sum(axis=1)
+
+    return hashes
+
+
+def _find_hashes(sorted_hashes, hashes):
+    """Indices of hashes in sorted_hashes, or -1 for those that are not there"""
+
+    # Searching is faster for sorted hashes
+    order = np.argsort(hashes)
+    found = np.empty(len(hashes), dtype=np.intp)
+    found[order] = np.searchsorted(sorted_hashes, hashes[order])
+    found[found == len(sorted_hashes)] = 0
+    found[sorted_hashes[found] != hashes] = -1
+
+    return found
+
+
+def _half_offsets(dimensions):
+    """The offsets to the neighbour cells, but only one of each offset and its negation"""
+
+    offsets = \
+        [
+            offset
+            for offset in product([ -1, 0, 1 ], repeat=dimensions)
+            if offset >= (0,)*dimensions
+        ]
+
+    return offsets
+
+
+def _close_pairs(points, tolerance):
+    """Pairs of indices of points that are within the tolerance of each other"""
+
+    cells = np.floor(points / tolerance).astype(np.int64)
+    hashes = _hash_cells(cells)
+    order = np.argsort(hashes, kind='stable')
+    cell_hashes, starts, counts = np.unique(hashes[order], return_index=True, return_counts=True)
+    cell_of_point = np.empty(len(points), dtype=np.intp)
+    cell_of_point[order] = np.repeat(np.arange(len(cell_hashes)), counts)
+    unique_cells = cells[order[starts]]
+    first = [ ]
+    second = [ ]
+    for offset in _half_offsets(points.shape[1]):
+        neighbour_cells = _find_hashes(cell_hashes, _hash_cells(unique_cells + np.array(offset, dtype=np.int64)))
+        neighbour_of_point = neighbour_cells[cell_of_point]
+        has_neighbours = np.flatnonzero(neighbour_of_point >= 0)
+        cell_indices = neighbour_of_point[has_neighbours]
+        repeats = counts[cell_indices]
+        i = np.repeat(has_neighbours, repeats)
+        # Position within each neighbour cell
+        steps = np.arange(len(i)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        j = order[np.repeat(starts[cell_indices], repeats) + steps]
+        if any(offset):
+            # Hash collisions may give the same cell
+            candidates = i != j
+        else:
+            candidates = i < j
+        i = i[candidates]
+        j = j[candidates]
+        differences = points[i] - points[j]
+        close = np.einsum('ij,ij->i', differences, differences) <= tolerance**2
+        first.append(i[close])
+        second.append(j[close])
+    pairs = (np.concatenate(first), np.concatenate(second))
+
+    return pairs
+
+
+def _first_representatives(no_of_points, first, second):
+    """For each point the index of the first earlier representative within the tolerance, or its own index"""
+
+    later = np.maximum(first, second)
+    earlier = np.minimum(first, second)
+    order = np.lexsort((earlier, later))
+    labels = [ *range(no_of_points) ]
+    # The pairs come in the order of their later point, so the earlier points are settled first
+    for i, j in zip(later[order].tolist(), earlier[order].tolist()):
+        if labels[i] == i and labels[j] == j:
+            labels[i] = j
+    labels = np.array(labels, dtype=np.intp)
+
+    return labels
+
+
+def weld_points(points, tolerance):
+    """
+    Positions of the first point in each group of welded points
+    and for each point the index of its group in these positions
+    """
+
+    points = np.asarray(points, dtype=float)
+    no_of_points = points.shape[0]
+    if no_of_points == 0:
+        positions = np.zeros(0, dtype=np.intp)
+        inverse = np.zeros(0, dtype=np.intp)
+    elif tolerance > 0:
+        first, second = _close_pairs(points, tolerance)
+        labels = _first_representatives(no_of_points, first, second)
+        positions = np.flatnonzero(labels == np.arange(no_of_points))
+        inverse = np.searchsorted(positions, labels)
+    else:
+        _, positions, inverse = np.unique(points, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(positions)
+        positions = positions[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        inverse = rank[inverse.ravel()]
+
+    return positions, inverse